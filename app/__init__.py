@@ -14,29 +14,66 @@ def create_app(config_name='default'):
     # 2. Load config
     app.config.from_object(config[config_name])
 
-    # 3. Initialize extensions
+    # 3. Setup Jinja bytecode cache (before any template is compiled)
+    _setup_template_cache(app)
+
+    # 4. Initialize extensions
     db.init_app(app)
     migrate.init_app(app, db)
     login_manager.init_app(app)
     mail.init_app(app)
     csrf.init_app(app)
 
-    # 4. Register blueprints
+    # 5. Register blueprints
     _register_blueprints(app)
 
-    # 5. Register error handlers
+    # 6. Register error handlers
     _register_error_handlers(app)
 
-    # 6. Setup login manager
-    _setup_login_manager()
+    # 7. Setup login manager
+    _setup_login_manager(app)
+
+    # 8. Setup rate limiter
+    _setup_rate_limiter(app)
+
+    # 9. Setup page cache
+    _setup_page_cache(app)
+
+    # 10. Setup static asset helper (asset_url)
+    _setup_assets(app)
 
-    # 7. Import models
+    # 11. Setup response compression
+    _setup_compression(app)
+
+    # 12. Register CLI commands
+    _register_commands(app)
+
+    # 13. Import models
     with app.app_context():
         from . import models
 
+    # 14. Precompile templates (if enabled in config)
+    _warm_templates(app)
+
+    # 15. Start in-process background tasks (if enabled in config)
+    _start_background_tasks(app)
+
     return app
 
 
+def _setup_template_cache(app):
+    """Compiled templates shared on disk between workers (JINJA_BYTECODE_CACHE_DIR)"""
+    from .services.template_cache import init_template_cache
+    init_template_cache(app)
+
+
+def _warm_templates(app):
+    """Compile all templates at boot so no page pays for it on first hit (TEMPLATE_WARMUP)"""
+    if app.config.get('TEMPLATE_WARMUP'):
+        from .services.template_cache import warm_templates
+        warm_templates(app)
+
+
 def _register_blueprints(app):
     """Register all blueprints (controllers)"""
     try:
@@ -45,19 +82,60 @@ def _register_blueprints(app):
         from .controllers.profile_controller import profile
         from .controllers.booking_controller import booking
         from .controllers.admin.dashboard_controller import admin_dashboard
+        from .controllers.assets_controller import assets
 
         app.register_blueprint(main)
         app.register_blueprint(auth)
         app.register_blueprint(profile)
         app.register_blueprint(booking)
         app.register_blueprint(admin_dashboard)
+        app.register_blueprint(assets)
 
     except Exception as e:
         print(f"Error registering blueprints: {e}")
 
 
+def _setup_rate_limiter(app):
+    """Login / OTP attempt limits (RATE_LIMIT_BACKEND)"""
+    from .services.rate_limiter import init_rate_limiter
+    init_rate_limiter(app)
+
+
+def _setup_page_cache(app):
+    """Rendered-page cache for anonymous visitors (PAGE_CACHE_ENABLED)"""
+    from .services.page_cache import init_page_cache
+    init_page_cache(app)
+
+
+def _setup_assets(app):
+    """Fingerprinted asset URLs from the build manifest (flask assets build)"""
+    from .services.assets import init_assets
+    init_assets(app)
+
+
+def _setup_compression(app):
+    """gzip/brotli response bodies (COMPRESS_ENABLED)"""
+    from .services.compression import init_compression
+    init_compression(app)
+
+
+def _register_commands(app):
+    """Register maintenance CLI commands (flask <group> <command>)"""
+    from .commands import register_commands
+    register_commands(app)
+
+
+def _start_background_tasks(app):
+    """Periodic jobs such as pending booking expiry (BOOKING_EXPIRY_IN_PROCESS)"""
+    from .services.scheduler import start_background_tasks
+    start_background_tasks(app)
+
+
 def _register_error_handlers(app):
+    from .services.page_cache import cached_page
+
     @app.errorhandler(404)
+    @cached_page(max_age=60, name='errors.not_found')
     def not_found(error):
         try:
             return render_template('extra/404.html'), 404
@@ -71,13 +149,14 @@ def _register_error_handlers(app):
         except Exception:
             return "Internal server error", 500
 
-def _setup_login_manager():
-    """Configure Flask-Login user loader"""
+def _setup_login_manager(app):
+    """Configure Flask-Login user loader (cached user snapshots)"""
+    from .services.identity_cache import init_identity_cache, load_user_snapshot
+    init_identity_cache(app)
 
     @login_manager.user_loader
     def load_user(user_id):
         try:
-            from .models.user import User
-            return User.query.get(int(user_id))
+            return load_user_snapshot(int(user_id))
         except Exception as e:
             return None
\ No newline at end of file
@@ -0,0 +1,250 @@
+import click
+from flask.cli import AppGroup
+
+# ============== RATINGS ==============
+
+ratings_cli = AppGroup('ratings', help='Room rating aggregate maintenance.')
+
+
+@ratings_cli.command('backfill')
+@click.option('--batch-size', default=1000, show_default=True, help='Rooms per transaction.')
+def backfill_ratings(batch_size):
+    """Recompute every room's rating aggregate from the reviews table."""
+    from app.models.room import Room
+    processed = Room.rebuild_rating_aggregates(batch_size=batch_size)
+    click.echo(f"✅ Rebuilt rating aggregates for {processed} rooms")
+
+
+@ratings_cli.command('check')
+@click.option('--batch-size', default=1000, show_default=True, help='Rooms per query.')
+@click.option('--fix', is_flag=True, help='Rebuild the aggregate when mismatches are found.')
+def check_ratings(batch_size, fix):
+    """Report rooms whose stored rating aggregate disagrees with their reviews."""
+    from app.models.room import Room
+    mismatches = Room.find_rating_mismatches(batch_size=batch_size)
+
+    for mismatch in mismatches:
+        click.echo(f"❌ Room {mismatch['room_id']}: stored={mismatch['stored']} actual={mismatch['actual']}")
+
+    if not mismatches:
+        click.echo("✅ All room rating aggregates match their reviews")
+        return
+
+    click.echo(f"{len(mismatches)} room(s) out of sync")
+    if fix:
+        Room.rebuild_rating_aggregates(batch_size=batch_size)
+        click.echo("✅ Rating aggregates rebuilt")
+    else:
+        raise SystemExit(1)
+
+
+# ============== SEARCH ==============
+
+search_cli = AppGroup('search', help='Room full-text search index maintenance.')
+
+
+@search_cli.command('rebuild')
+def rebuild_search():
+    """Recompute every room's search document and rebuild the index."""
+    from app.models.room_search import rebuild_search_index
+    rebuild_search_index()
+    click.echo("✅ Room search index rebuilt")
+
+
+# ============== OCCUPANCY ==============
+
+occupancy_cli = AppGroup('occupancy', help='Room night-occupancy calendar maintenance.')
+
+
+@occupancy_cli.command('rebuild')
+@click.option('--batch-size', default=5000, show_default=True, help='Rows per fetch/insert batch.')
+def rebuild_occupancy(batch_size):
+    """Recompute the occupancy calendar from the bookings table."""
+    from app.models.occupancy import RoomOccupancy
+    rows = RoomOccupancy.rebuild(batch_size=batch_size)
+    click.echo(f"✅ Occupancy calendar rebuilt ({rows} room-months)")
+
+
+# ============== DASHBOARD STATS ==============
+
+stats_cli = AppGroup('stats', help='Admin dashboard rollup maintenance.')
+
+
+@stats_cli.command('rebuild')
+@click.option('--batch-size', default=5000, show_default=True, help='Rows per fetch/insert batch.')
+@click.option('--chunk-days', default=31, show_default=True, help='Nights rebuilt (and held in memory) at a time.')
+def rebuild_stats(batch_size, chunk_days):
+    """Recompute the daily per-room and per-room-type rollups from the bookings table."""
+    from app.models.booking_stats import rebuild_daily_stats
+    rows = rebuild_daily_stats(batch_size=batch_size, chunk_days=chunk_days)
+    click.echo(f"✅ Dashboard rollups rebuilt ({rows} room-night rows)")
+
+
+# ============== BOOKINGS ==============
+
+bookings_cli = AppGroup('bookings', help='Booking maintenance jobs.')
+
+
+@bookings_cli.command('expire')
+@click.option('--ttl', type=int, default=None, help='Pending age in seconds [default: PENDING_BOOKING_TTL].')
+@click.option('--batch-size', type=int, default=None, help='Rows per transaction [default: BOOKING_EXPIRY_BATCH_SIZE].')
+@click.option('--loop', is_flag=True, help='Keep running every --interval seconds (worker process).')
+@click.option('--interval', type=int, default=None, help='Seconds between runs [default: BOOKING_EXPIRY_INTERVAL].')
+def expire_bookings(ttl, batch_size, loop, interval):
+    """Expire pending bookings older than the TTL."""
+    from flask import current_app
+    from app.services.booking_expiry import expire_stale_bookings
+    from app.services.scheduler import PeriodicTask
+
+    def run():
+        result = expire_stale_bookings(ttl=ttl, batch_size=batch_size)
+        click.echo(f"✅ Expired {result['expired']} pending bookings "
+                   f"in {result['batches']} batch(es), {result['seconds']}s")
+        return result
+
+    if not loop:
+        run()
+        return
+
+    task = PeriodicTask(current_app._get_current_object(), 'booking_expiry', run,
+                        interval or current_app.config['BOOKING_EXPIRY_INTERVAL'])
+    try:
+        task.run_forever()
+    except KeyboardInterrupt:
+        click.echo("Stopped")
+
+
+# ============== MAIL OUTBOX ==============
+
+mail_cli = AppGroup('mail', help='Mail outbox delivery.')
+
+
+@mail_cli.command('worker')
+@click.option('--workers', type=int, default=None, help='Worker threads [default: MAIL_OUTBOX_WORKERS].')
+@click.option('--once', is_flag=True, help='Deliver everything currently due, then exit.')
+def mail_worker(workers, once):
+    """Deliver queued mail (run as a separate process when MAIL_OUTBOX_IN_PROCESS is off)."""
+    import time
+    from flask import current_app
+    from app.services.mail_outbox import MailWorkerPool, process_outbox
+
+    if once:
+        totals = {'sent': 0, 'retried': 0, 'dead': 0}
+        while True:
+            stats = process_outbox()
+            for key in totals:
+                totals[key] += stats[key]
+            if not stats['claimed']:
+                break
+        click.echo(f"✅ Sent {totals['sent']}, retrying {totals['retried']}, dead-lettered {totals['dead']}")
+        return
+
+    pool = MailWorkerPool(current_app._get_current_object(), workers=workers).start()
+    click.echo(f"Mail worker running with {pool.workers} thread(s), Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pool.stop(timeout=30)
+        click.echo(f"Stopped: {pool.totals}")
+
+
+@mail_cli.command('reminders')
+@click.option('--days-ahead', default=1, show_default=True, help='Remind guests checking in this many days from today.')
+@click.option('--connections', type=int, default=None, help='SMTP sessions [default: MAIL_BULK_CONNECTIONS].')
+@click.option('--rate', type=float, default=None, help='Messages per second [default: MAIL_BULK_RATE_LIMIT].')
+def mail_reminders(days_ahead, connections, rate):
+    """Send check-in reminders to guests with confirmed bookings."""
+    from app.services.notifications import send_booking_reminders
+    stats = send_booking_reminders(days_ahead, connections=connections, rate_limit=rate)
+    click.echo(f"✅ Sent {stats['sent']} reminder(s), {stats['failed']} failed "
+               f"in {stats['seconds']}s ({stats['messages_per_second']}/s) "
+               f"over {stats['connections']} connection(s), {stats['reconnects']} reconnect(s)")
+    for recipients, error in stats['failures'][:20]:
+        click.echo(f"❌ {', '.join(recipients)}: {error}")
+
+
+@mail_cli.command('status')
+def mail_status():
+    """Show outbox message counts by status."""
+    from app.services.mail_outbox import outbox_counts
+    counts = outbox_counts()
+    for status in ('pending', 'sending', 'sent', 'dead'):
+        click.echo(f"{status:>8}: {counts.get(status, 0)}")
+
+
+@mail_cli.command('retry-dead')
+@click.argument('ids', nargs=-1, type=int)
+def mail_retry_dead(ids):
+    """Re-queue dead-lettered messages (all, or the given IDs)."""
+    from app.services.mail_outbox import retry_dead_messages
+    count = retry_dead_messages(list(ids))
+    click.echo(f"✅ Re-queued {count} message(s)")
+
+
+@mail_cli.command('sweep')
+@click.option('--batch-size', default=1000, show_default=True, help='Messages deleted per transaction.')
+def mail_sweep(batch_size):
+    """Delete sent messages older than MAIL_OUTBOX_SENT_RETENTION."""
+    from flask import current_app
+    from app.models.mail_outbox import OutboxMessage
+    deleted = OutboxMessage.sweep_sent(current_app.config['MAIL_OUTBOX_SENT_RETENTION'], batch_size=batch_size)
+    click.echo(f"✅ Removed {deleted} sent messages")
+
+
+# ============== IDEMPOTENCY ==============
+
+idempotency_cli = AppGroup('idempotency', help='Idempotency-Key store maintenance.')
+
+
+@idempotency_cli.command('sweep')
+@click.option('--batch-size', default=1000, show_default=True, help='Keys deleted per transaction.')
+def sweep_idempotency_keys(batch_size):
+    """Delete expired idempotency keys."""
+    from app.models.idempotency import IdempotencyKey
+    deleted = IdempotencyKey.sweep_expired(batch_size=batch_size)
+    click.echo(f"✅ Removed {deleted} expired idempotency keys")
+
+
+# ============== OTP ==============
+
+otp_cli = AppGroup('otp', help='Password reset code store maintenance.')
+
+
+@otp_cli.command('sweep')
+@click.option('--batch-size', default=1000, show_default=True, help='Codes deleted per transaction.')
+def sweep_otps(batch_size):
+    """Delete expired password reset codes."""
+    from app.models.otp import PasswordResetOTP
+    deleted = PasswordResetOTP.sweep_expired(batch_size=batch_size)
+    click.echo(f"✅ Removed {deleted} expired reset codes")
+
+
+# ============== ASSETS ==============
+
+assets_cli = AppGroup('assets', help='Front-end asset pipeline.')
+
+
+@assets_cli.command('build')
+def build_assets_command():
+    """Fingerprint and precompress static/src into static/dist."""
+    from flask import current_app
+    from app.services.assets import build_assets, brotli
+    stats = build_assets(current_app.static_folder)
+    click.echo(f"✅ Built {stats['files']} asset(s): {stats['bytes']:,} bytes, "
+               f"{stats['gzip_bytes']:,} gzipped, {stats['brotli_bytes']:,} brotli")
+    if brotli is None:
+        click.echo("⚠️ brotli is not installed - skipped .br files")
+
+
+def register_commands(app):
+    """Attach the maintenance CLI groups to the app"""
+    app.cli.add_command(ratings_cli)
+    app.cli.add_command(search_cli)
+    app.cli.add_command(occupancy_cli)
+    app.cli.add_command(stats_cli)
+    app.cli.add_command(bookings_cli)
+    app.cli.add_command(mail_cli)
+    app.cli.add_command(idempotency_cli)
+    app.cli.add_command(otp_cli)
+    app.cli.add_command(assets_cli)
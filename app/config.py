@@ -18,19 +18,123 @@ class Config:
     MAIL_USERNAME = os.getenv('MAIL_USERNAME')
     MAIL_PASSWORD = os.getenv('MAIL_PASSWORD')
     MAIL_DEFAULT_SENDER = ('QuickStay', os.getenv('MAIL_USERNAME'))
+
+    # Mail outbox (delivery off the request path, see app/services/mail_outbox.py)
+    MAIL_OUTBOX_IN_PROCESS = os.getenv('MAIL_OUTBOX_IN_PROCESS', 'true').lower() == 'true'
+    MAIL_OUTBOX_WORKERS = int(os.getenv('MAIL_OUTBOX_WORKERS', 2))
+    MAIL_OUTBOX_BATCH_SIZE = 20
+    MAIL_OUTBOX_POLL_INTERVAL = 5  # seconds
+    MAIL_OUTBOX_LEASE = 120  # seconds a worker may hold a message before it is re-queued
+    MAIL_OUTBOX_MAX_ATTEMPTS = 6
+    MAIL_OUTBOX_BACKOFF_BASE = 30  # seconds, doubled per attempt
+    MAIL_OUTBOX_BACKOFF_MAX = 3600
+    MAIL_OUTBOX_SENT_RETENTION = int(os.getenv('MAIL_OUTBOX_SENT_RETENTION', 7 * 86400))  # `flask mail sweep`
+
+    # Bulk notifications (reminders, marketing) over pooled SMTP sessions
+    MAIL_BULK_CONNECTIONS = int(os.getenv('MAIL_BULK_CONNECTIONS', 4))
+    MAIL_BULK_BATCH_SIZE = 100
+    MAIL_BULK_RATE_LIMIT = float(os.getenv('MAIL_BULK_RATE_LIMIT', 0))  # messages/second, 0 = unlimited
+    MAIL_BULK_MAX_RETRIES = 3
+    MAIL_BULK_RETRY_DELAY = 1.0  # seconds, doubled per retry
+    MAIL_MAX_EMAILS = int(os.getenv('MAIL_MAX_EMAILS', 0)) or None  # messages per SMTP session before reconnecting
     
+    # Password hashing (see app/services/password_hasher.py). Changing the
+    # method re-hashes each user's password on their next successful login.
+    PASSWORD_HASH_METHOD = os.getenv('PASSWORD_HASH_METHOD', 'scrypt:32768:8:1')
+    PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', os.cpu_count() or 1))  # 0 = hash inline
+    PASSWORD_HASH_MAX_PENDING = int(os.getenv('PASSWORD_HASH_MAX_PENDING', 0))  # 0 = 4 per worker
+
+    # Password reset codes (see app/models/otp.py)
+    OTP_TTL = int(os.getenv('OTP_TTL', 600))  # 10 minutes
+    OTP_MAX_ATTEMPTS = int(os.getenv('OTP_MAX_ATTEMPTS', 5))
+
+    # Login / OTP rate limits (see app/services/rate_limiter.py). With the
+    # 'memory' backend every worker process counts on its own, so each budget
+    # below is effectively multiplied by WEB_WORKERS; production uses 'redis'.
+    RATE_LIMIT_ENABLED = os.getenv('RATE_LIMIT_ENABLED', 'true').lower() == 'true'
+    RATE_LIMIT_BACKEND = os.getenv('RATE_LIMIT_BACKEND', 'memory')  # 'memory' (per process) or 'redis'
+    RATE_LIMIT_REDIS_URL = os.getenv('RATE_LIMIT_REDIS_URL', 'redis://localhost:6379/0')
+    RATE_LIMITS = {
+        # scope: {key: (attempts, per seconds)}
+        'login': {'ip': (30, 60), 'account': (10, 900)},
+        'otp_send': {'ip': (10, 900), 'account': (5, 3600)},
+        'otp_verify': {'ip': (30, 900), 'account': (10, 900)},
+    }
+
+    # Production WSGI server (gunicorn.conf.py). Workers default to 2 x CPUs + 1,
+    # each with WEB_THREADS request threads.
+    WEB_BIND = os.getenv('WEB_BIND', '0.0.0.0:5000')
+    WEB_WORKERS = int(os.getenv('WEB_WORKERS', 0)) or (os.cpu_count() or 1) * 2 + 1
+    WEB_THREADS = int(os.getenv('WEB_THREADS', 0)) or 4
+    WEB_MAX_REQUESTS = int(os.getenv('WEB_MAX_REQUESTS', 1000))  # recycle a worker after N requests
+    WEB_MAX_REQUESTS_JITTER = int(os.getenv('WEB_MAX_REQUESTS_JITTER', 100))  # so workers don't recycle together
+    WEB_TIMEOUT = int(os.getenv('WEB_TIMEOUT', 30))
+    WEB_GRACEFUL_TIMEOUT = int(os.getenv('WEB_GRACEFUL_TIMEOUT', 30))  # in-flight requests on restart
+    WEB_KEEPALIVE = int(os.getenv('WEB_KEEPALIVE', 5))
+
+    # Rendered pages for anonymous visitors (see app/services/page_cache.py)
+    PAGE_CACHE_ENABLED = os.getenv('PAGE_CACHE_ENABLED', 'true').lower() == 'true'
+    PAGE_CACHE_MAX_ENTRIES = int(os.getenv('PAGE_CACHE_MAX_ENTRIES', 1000))
+    PAGE_CACHE_MAX_BYTES = int(os.getenv('PAGE_CACHE_MAX_BYTES', 32 * 1024 * 1024))
+    PAGE_CACHE_ROOMS_TTL = int(os.getenv('PAGE_CACHE_ROOMS_TTL', 60))  # seconds; listing reflects room changes
+
+    # Response compression (see app/services/compression.py)
+    COMPRESS_ENABLED = os.getenv('COMPRESS_ENABLED', 'true').lower() == 'true'
+    COMPRESS_MIN_SIZE = 500  # bytes; smaller bodies aren't worth the header overhead
+    COMPRESS_GZIP_LEVEL = 6
+    COMPRESS_BROTLI_QUALITY = 5  # on-the-fly; precompressed assets use 11
+    COMPRESS_STREAM_THRESHOLD = 256 * 1024  # bytes; larger bodies are compressed while sending
+
+    # Jinja compiled templates (see app/services/template_cache.py)
+    # Relative to the instance folder; must be private to the app's user. '' disables.
+    JINJA_BYTECODE_CACHE_DIR = os.getenv('JINJA_BYTECODE_CACHE_DIR', 'jinja-cache')
+    TEMPLATE_WARMUP = os.getenv('TEMPLATE_WARMUP', 'false').lower() == 'true'
+
     # Session
     PERMANENT_SESSION_LIFETIME = 1800 # 30 minutes
 
+    # Per-process cache of logged-in user snapshots (see app/services/identity_cache.py)
+    IDENTITY_CACHE_SIZE = int(os.getenv('IDENTITY_CACHE_SIZE', 10000))
+    IDENTITY_CACHE_TTL = int(os.getenv('IDENTITY_CACHE_TTL', 60))  # seconds; bounds staleness across processes
+
+    # Idempotency-Key replay window for retried POSTs
+    IDEMPOTENCY_KEY_TTL = int(os.getenv('IDEMPOTENCY_KEY_TTL', 86400))  # 24 hours
+    # How long a key stays 'processing' if its request dies without releasing it.
+    # Keep it above WEB_TIMEOUT so a slow request is killed before it's taken over.
+    IDEMPOTENCY_PROCESSING_LEASE = int(os.getenv('IDEMPOTENCY_PROCESSING_LEASE', 60))
+
+    # Pending booking expiry (in-process scheduler or `flask bookings expire`)
+    PENDING_BOOKING_TTL = int(os.getenv('PENDING_BOOKING_TTL', 172800))  # 48 hours
+    BOOKING_EXPIRY_BATCH_SIZE = int(os.getenv('BOOKING_EXPIRY_BATCH_SIZE', 500))
+    BOOKING_EXPIRY_INTERVAL = int(os.getenv('BOOKING_EXPIRY_INTERVAL', 300))  # seconds
+    BOOKING_EXPIRY_IN_PROCESS = os.getenv('BOOKING_EXPIRY_IN_PROCESS', 'false').lower() == 'true'
+
 class DevelopmentConfig(Config):
     DEBUG = True
 
 class ProductionConfig(Config):
     DEBUG = False
+    TEMPLATE_WARMUP = os.getenv('TEMPLATE_WARMUP', 'true').lower() == 'true'
+
+    # Several worker processes: limits must be counted in one shared store
+    RATE_LIMIT_BACKEND = os.getenv('RATE_LIMIT_BACKEND', 'redis')
+
+    # One connection per request thread plus the in-process mail workers
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': Config.WEB_THREADS + Config.MAIL_OUTBOX_WORKERS,
+        'max_overflow': 2,
+        'pool_pre_ping': True,
+        'pool_recycle': 1800
+    }
 
 class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:' 
+    MAIL_OUTBOX_IN_PROCESS = False
+    PASSWORD_HASH_METHOD = 'pbkdf2:sha256:1000'
+    PASSWORD_HASH_WORKERS = 0
+    RATE_LIMIT_ENABLED = False
+    JINJA_BYTECODE_CACHE_DIR = None
     
 config = {
     'development': DevelopmentConfig,
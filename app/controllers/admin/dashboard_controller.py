@@ -1,7 +1,100 @@
-from flask import Blueprint
+from datetime import date, timedelta
+from flask import Blueprint, request, render_template, abort
+from app.controllers.admin import admin_required
+from app.models.booking_stats import dashboard_summary, room_daily_series
+from app.services.booking_service import moderate_bookings, ERROR_INTERNAL
+from app.services.identity_cache import get_identity_cache
+from app.services.page_cache import get_page_cache
+from app.utils import parse_date, parse_number
 
 admin_dashboard = Blueprint('admin_dashboard', __name__, url_prefix='/admin')
 
+DASHBOARD_DEFAULT_DAYS = 30
+DASHBOARD_MAX_DAYS = 366
+
+
+def _stats_window(args):
+    """[start, end) night window from ?start=YYYY-MM-DD&days=N"""
+    start = parse_date(args.get('start', '')) or date.today()
+    days = parse_number(args.get('days'), int) or DASHBOARD_DEFAULT_DAYS
+    days = max(1, min(days, DASHBOARD_MAX_DAYS))
+    return start, start + timedelta(days=days)
+
+
+# ============== DASHBOARD ==============
+
 @admin_dashboard.route('/dashboard')
+@admin_required
 def dashboard():
-    return "Admin dashboard coming soon", 200
\ No newline at end of file
+    try:
+        start, end = _stats_window(request.args)
+        return render_template('admin/dashboard.html', summary=dashboard_summary(start, end))
+    except Exception as e:
+        print(f"Error in admin dashboard route: {str(e)}")
+        abort(500)
+
+
+@admin_dashboard.route('/api/stats')
+@admin_required
+def stats_api():
+    """Dashboard rollup totals as JSON"""
+    try:
+        start, end = _stats_window(request.args)
+        return {'success': True, 'stats': dashboard_summary(start, end)}, 200
+    except Exception as e:
+        print(f"Error in stats API route: {str(e)}")
+        return {'success': False, 'message': 'An error occurred. Please try again.'}, 500
+
+
+@admin_dashboard.route('/api/stats/rooms/<int:room_id>')
+@admin_required
+def room_stats_api(room_id):
+    """Per-night confirmed nights and revenue for one room"""
+    try:
+        start, end = _stats_window(request.args)
+        return {'success': True, 'room_id': room_id, 'days': room_daily_series(room_id, start, end)}, 200
+    except Exception as e:
+        print(f"Error in room stats API route: {str(e)}")
+        return {'success': False, 'message': 'An error occurred. Please try again.'}, 500
+
+
+# ============== BOOKING MODERATION ==============
+
+@admin_dashboard.route('/bookings/moderate', methods=['POST'])
+@admin_required
+def moderate_bookings_bulk():
+    """Approve or reject a batch of pending bookings: {action, booking_ids, reason}"""
+    try:
+        data = request.get_json(silent=True) or {}
+        action = data.get('action')
+        booking_ids = data.get('booking_ids')
+
+        if not isinstance(booking_ids, list) or not all(type(i) is int for i in booking_ids):
+            return {'success': False, 'message': 'booking_ids must be a list of booking IDs.'}, 400
+
+        reason = (data.get('reason') or '').strip() or None
+        success, message, results, error = moderate_bookings(booking_ids, action, reason)
+        if not success:
+            return {'success': False, 'message': message}, 500 if error == ERROR_INTERNAL else 400
+
+        return {'success': True, 'message': message, 'results': results}, 200
+
+    except Exception as e:
+        print(f"Error in bulk moderation route: {str(e)}")
+        return {'success': False, 'message': 'An error occurred. Please try again.'}, 500
+
+
+# ============== CACHE METRICS ==============
+
+@admin_dashboard.route('/api/identity-cache')
+@admin_required
+def identity_cache_stats():
+    """Hit rate and size of this process's logged-in user cache"""
+    return {'success': True, 'stats': get_identity_cache().stats()}, 200
+
+
+@admin_dashboard.route('/api/page-cache')
+@admin_required
+def page_cache_stats():
+    """Hit rate and size of this process's anonymous page cache"""
+    return {'success': True, 'stats': get_page_cache().stats()}, 200
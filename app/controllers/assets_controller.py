@@ -0,0 +1,35 @@
+import mimetypes
+import os
+from flask import Blueprint, current_app, request, send_from_directory, abort
+from app.services.assets import BUILD_DIR
+
+assets = Blueprint('assets', __name__, url_prefix='/assets')
+
+ONE_YEAR = 365 * 24 * 3600
+
+# Precompressed variants written by `flask assets build`, best first
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+# ============== FINGERPRINTED ASSETS ==============
+
+@assets.route('/<path:filename>')
+def serve(filename):
+    """A built asset, precompressed when the client accepts it, cached for a year"""
+    if filename.endswith(('.br', '.gz')):
+        abort(404)
+    directory = os.path.join(current_app.static_folder, BUILD_DIR)
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+
+    for encoding, suffix in ENCODINGS:
+        if request.accept_encodings[encoding] and os.path.isfile(os.path.join(directory, filename + suffix)):
+            response = send_from_directory(directory, filename + suffix, mimetype=mimetype, max_age=ONE_YEAR)
+            response.headers['Content-Encoding'] = encoding
+            break
+    else:
+        response = send_from_directory(directory, filename, mimetype=mimetype, max_age=ONE_YEAR)
+
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    response.vary.add('Accept-Encoding')
+    return response
@@ -1,7 +1,10 @@
-from flask import Blueprint, render_template, abort, request, redirect, url_for, flash
+from flask import Blueprint, render_template, abort, request, redirect, url_for, flash, session
 from flask_login import login_user, logout_user, login_required, current_user
 from app.extensions import db
 from app.models.user import User
+from app.models.otp import PasswordResetOTP
+from app.services.idempotency import idempotent
+from app.services.rate_limiter import rate_limit
 from app.utils import (
     validate_email, 
     validate_password, 
@@ -18,6 +21,7 @@ auth = Blueprint('auth', __name__, url_prefix='/auth')
 # ============== REGISTRATION ==============
 
 @auth.route('/register', methods=['GET', 'POST'])
+@idempotent
 def register():
     try:
         # If user is already logged in, redirect to home
@@ -69,7 +73,7 @@ def register():
                 errors.append('Passwords do not match')
             
             # Check if username already exists
-            if User.query.filter_by(username=username).first():
+            if username and User.username_taken(username):
                 errors.append('Username already exists')
             
             # Check if email already exists
@@ -120,6 +124,7 @@ def register():
 # ============== LOGIN ==============
 
 @auth.route('/login', methods=['GET', 'POST'])
+@rate_limit('login', account=lambda: request.form.get('email'), template='auth/login.html')
 def login():
     try:
         if current_user.is_authenticated:
@@ -144,10 +149,7 @@ def login():
                     flash(error, 'danger')
                 return render_template('auth/login.html')
             
-            user = User.query.filter(
-                (User.username == username_or_email) | 
-                (User.email == username_or_email.lower())
-            ).first()
+            user = User.find_by_login(username_or_email)
             
             if not user or not user.check_password(password):
                 flash('Invalid username/email or password', 'danger')
@@ -158,6 +160,15 @@ def login():
                 flash('Your account has been deactivated. Please contact support.', 'danger')
                 return render_template('auth/login.html')
             
+            # Upgrade hashes made with older PASSWORD_HASH_METHOD parameters
+            if user.password_needs_rehash():
+                try:
+                    user.set_password(password)
+                    db.session.commit()
+                except Exception as e:
+                    db.session.rollback()
+                    print(f"Error rehashing password for user {user.id}: {str(e)}")
+            
             login_user(user, remember=remember_me)
             
             flash(f'Welcome back, {user.get_full_name()}!', 'success')
@@ -191,6 +202,7 @@ def logout():
 # ============== FORGOT PASSWORD - 4 Stages ==============
 
 @auth.route('/forgot-password', methods=['GET', 'POST'])
+@rate_limit('otp_send', account=lambda: request.form.get('email'))
 def forgot_password():
     """Stage 1: Request OTP - User enters email"""
     try:
@@ -224,11 +236,10 @@ def forgot_password():
             
             # Generate OTP
             otp_code = generate_otp()
-            print(f"🔍 DEBUG: Generated OTP: {otp_code}")  # Debug log
             
             # Save OTP to database
             try:
-                user.set_otp(otp_code)
+                PasswordResetOTP.issue(user.id, otp_code)
                 db.session.commit()
                 print(f"✅ DEBUG: OTP saved to database")  # Debug log
             except Exception as e:
@@ -257,6 +268,7 @@ def forgot_password():
         abort(500)
 
 @auth.route('/verify-otp', methods=['POST'])
+@rate_limit('otp_verify', account=lambda: session.get('reset_email'))
 def verify_otp():
     try:
         from flask import session
@@ -280,7 +292,7 @@ def verify_otp():
             return redirect(url_for('auth.forgot_password'))
         
         # Verify OTP
-        if not user.verify_otp(otp):
+        if not PasswordResetOTP.verify(user.id, otp):
             flash('Invalid or expired OTP. Please try again.', 'danger')
             return redirect(url_for('auth.forgot_password'))
         
@@ -330,7 +342,7 @@ def reset_password():
         # Update password
         try:
             user.set_password(new_password)
-            user.clear_otp()
+            PasswordResetOTP.consume(user.id)
             db.session.commit()
         except Exception as e:
             db.session.rollback()
@@ -356,6 +368,7 @@ def reset_password():
 
 
 @auth.route('/resend-otp', methods=['POST'])
+@rate_limit('otp_send', account=lambda: session.get('reset_email'))
 def resend_otp():
     try:
         from flask import session
@@ -374,7 +387,7 @@ def resend_otp():
         otp_code = generate_otp()
         
         try:
-            user.set_otp(otp_code)
+            PasswordResetOTP.issue(user.id, otp_code)
             db.session.commit()
         except Exception as e:
             db.session.rollback()
@@ -1,7 +1,48 @@
-from flask import Blueprint
+from flask import Blueprint, request
+from flask_login import login_required, current_user
+from app.services.booking_service import (
+    create_booking, ERROR_NOT_FOUND, ERROR_CONFLICT, ERROR_BUSY, ERROR_INTERNAL
+)
+from app.services.idempotency import idempotent
+from app.utils import parse_date, parse_number
 
 booking = Blueprint('booking', __name__, url_prefix='/bookings')
 
+# 5xx answers are not stored by @idempotent, so a retry runs again
+ERROR_STATUS = {ERROR_NOT_FOUND: 404, ERROR_CONFLICT: 409, ERROR_BUSY: 503, ERROR_INTERNAL: 500}
+BUSY_RETRY_AFTER = '1'
+
 @booking.route('/')
 def list():
-    return "Bookings page coming soon", 200
\ No newline at end of file
+    return "Bookings page coming soon", 200
+
+
+@booking.route('/create', methods=['POST'])
+@login_required
+@idempotent
+def create():
+    try:
+        data = request.get_json(silent=True) or request.form
+        room_id = parse_number(data.get('room_id'), int)
+        check_in = parse_date(str(data.get('check_in', '')))
+        check_out = parse_date(str(data.get('check_out', '')))
+        guests_count = parse_number(data.get('guests_count'), int) or 1
+
+        if not room_id:
+            return {'success': False, 'message': 'Please choose a room.'}, 400
+        if not check_in or not check_out:
+            return {'success': False, 'message': 'Please provide valid check-in and check-out dates.'}, 400
+
+        success, message, new_booking, error = create_booking(
+            current_user.id, room_id, check_in, check_out, guests_count
+        )
+        if not success:
+            if error == ERROR_BUSY:
+                return {'success': False, 'message': message}, 503, {'Retry-After': BUSY_RETRY_AFTER}
+            return {'success': False, 'message': message}, ERROR_STATUS.get(error, 400)
+
+        return {'success': True, 'message': message, 'booking': new_booking.to_dict()}, 201
+
+    except Exception as e:
+        print(f"Error in booking create route: {str(e)}")
+        return {'success': False, 'message': 'An error occurred. Please try again.'}, 500
@@ -1,9 +1,97 @@
-from flask import Blueprint, render_template, request, flash, redirect, url_for, abort
+from datetime import timedelta
+from flask import Blueprint, render_template, request, flash, redirect, url_for, abort, jsonify
+from app.models.room import Room
+from app.models.amenity import Amenity
+from app.models.occupancy import RoomOccupancy
+from app.models.room_search import search_rooms
+from app.services.page_cache import cached_page
+from app.utils import parse_date, parse_number, encode_cursor, decode_cursor
 
 main = Blueprint('main', __name__)
 
+
+ROOMS_PER_PAGE = 12
+ROOMS_MAX_PER_PAGE = 100
+
+
+def _room_filters(args):
+    """
+    Read the room listing / availability filters from the query string.
+    Returns (filters, error). check_in and check_out are None unless
+    both dates were given.
+    """
+    filters = {
+        'check_in': None,
+        'check_out': None,
+        'guests': parse_number(args.get('guests'), int),
+        'room_type': [t for t in args.getlist('room_type') if t] or None,
+        'min_price': parse_number(args.get('min_price')),
+        'max_price': parse_number(args.get('max_price')),
+        'status': args.get('status', '').strip() or None,
+        'amenities': [a for a in args.getlist('amenity') if a.strip()] or None
+    }
+
+    check_in_raw = args.get('check_in', '').strip()
+    check_out_raw = args.get('check_out', '').strip()
+
+    if not check_in_raw and not check_out_raw:
+        return filters, None
+
+    check_in = parse_date(check_in_raw)
+    check_out = parse_date(check_out_raw)
+
+    if not check_in or not check_out:
+        return None, 'Please provide valid check-in and check-out dates.'
+    if check_out <= check_in:
+        return None, 'Check-out date must be after check-in date.'
+
+    filters['check_in'] = check_in
+    filters['check_out'] = check_out
+    return filters, None
+
+
+def _rooms_query(filters):
+    """Base room query for the filters - availability search when dates are given"""
+    query = Room.query
+    if filters['check_in']:
+        query = Room.search_available(filters['check_in'], filters['check_out'])
+    return Room.apply_filters(
+        query,
+        room_type=filters['room_type'],
+        min_price=filters['min_price'],
+        max_price=filters['max_price'],
+        guests=filters['guests'],
+        status=filters['status'],
+        amenities=filters['amenities']
+    )
+
+
+def _amenity_names():
+    """Catalog amenity names for the filter sidebar"""
+    names = Amenity.names_by_bit()
+    return [names[bit] for bit in sorted(names)]
+
+
+def _rooms_page(args, filters):
+    """Fetch one keyset page of rooms, returning (rooms, sort, next_cursor)"""
+    sort = args.get('sort', 'recommended')
+    if sort not in Room.SORT_OPTIONS:
+        sort = 'recommended'
+
+    per_page = parse_number(args.get('per_page'), int) or ROOMS_PER_PAGE
+    per_page = max(1, min(per_page, ROOMS_MAX_PER_PAGE))
+
+    rooms, next_key = Room.keyset_page(
+        _rooms_query(filters),
+        sort=sort,
+        after=decode_cursor(args.get('after')),
+        per_page=per_page
+    )
+    return rooms, sort, encode_cursor(next_key) if next_key else None
+
 # ==================== HOME ====================
 @main.route('/')
+@cached_page(max_age=300)
 def home():
     try:
         return render_template('main/home.html')
@@ -12,6 +100,7 @@ def home():
 
 # ==================== ABOUT ====================
 @main.route('/about')
+@cached_page(max_age=3600)
 def about():
     try:
         return render_template('main/about.html')
@@ -44,6 +133,7 @@ def contact():
 
 # ==================== FAQ ====================
 @main.route('/faq')
+@cached_page(max_age=3600)
 def faq():
     try:
         return render_template('main/faq.html')
@@ -52,14 +142,146 @@ def faq():
 
 # ==================== ROOMS (Public Listing) ====================
 @main.route('/rooms')
+@cached_page(max_age=60, ttl='PAGE_CACHE_ROOMS_TTL', vary_query=True)
 def rooms():
     try:
-        return render_template('main/rooms.html')
+        filters, error = _room_filters(request.args)
+        if error:
+            flash(error, 'danger')
+            return render_template('main/rooms.html', rooms=[], amenity_names=_amenity_names())
+
+        rooms, sort, next_cursor = _rooms_page(request.args, filters)
+
+        # Keyset pagination only moves forward - offer next and back-to-first links
+        args = request.args.to_dict(flat=False)
+        args.pop('after', None)
+        first_url = url_for('main.rooms', **args) if request.args.get('after') else None
+        next_url = url_for('main.rooms', after=next_cursor, **args) if next_cursor else None
+
+        return render_template(
+            'main/rooms.html',
+            rooms=rooms,
+            sort=sort,
+            next_url=next_url,
+            first_url=first_url,
+            amenity_names=_amenity_names()
+        )
     except Exception as e:
+        print(f"Error in rooms route: {str(e)}")
         abort(500)
 
+# ==================== ROOMS LISTING (JSON) ====================
+@main.route('/api/rooms')
+def rooms_api():
+    try:
+        filters, error = _room_filters(request.args)
+        if error:
+            return {'success': False, 'message': error}, 400
+
+        rooms, sort, next_cursor = _rooms_page(request.args, filters)
+        return jsonify({
+            'success': True,
+            'sort': sort,
+            'count': len(rooms),
+            'next_cursor': next_cursor,
+            'rooms': [room.to_dict() for room in rooms]
+        })
+    except Exception as e:
+        print(f"Error in rooms api: {str(e)}")
+        return {'success': False, 'message': 'An error occurred. Please try again.'}, 500
+
+# ==================== ROOMS SEARCH (JSON) ====================
+@main.route('/api/rooms/search')
+def rooms_search():
+    try:
+        text = request.args.get('q', '').strip()
+        if not text:
+            return {'success': False, 'message': 'Search text (q) is required.'}, 400
+
+        filters, error = _room_filters(request.args)
+        if error:
+            return {'success': False, 'message': error}, 400
+
+        limit = parse_number(request.args.get('per_page'), int) or ROOMS_PER_PAGE
+        limit = max(1, min(limit, ROOMS_MAX_PER_PAGE))
+
+        results = search_rooms(text, _rooms_query(filters)).limit(limit).all()
+        return jsonify({
+            'success': True,
+            'q': text,
+            'count': len(results),
+            'rooms': [dict(room.to_dict(), score=round(float(score), 4)) for room, score in results]
+        })
+    except Exception as e:
+        print(f"Error in rooms search: {str(e)}")
+        return {'success': False, 'message': 'An error occurred. Please try again.'}, 500
+
+# ==================== ROOMS CALENDAR (JSON) ====================
+CALENDAR_MAX_ROOMS = 50
+CALENDAR_MAX_MONTHS = 12
+
+
+@main.route('/api/rooms/calendar')
+def rooms_calendar():
+    try:
+        room_ids = [i for i in (parse_number(v, int) for v in request.args.getlist('room_id')) if i]
+        start = parse_date(request.args.get('month', '') + '-01')
+        months = parse_number(request.args.get('months'), int) or CALENDAR_MAX_MONTHS
+
+        if not room_ids or len(room_ids) > CALENDAR_MAX_ROOMS:
+            return {'success': False, 'message': f'Provide 1-{CALENDAR_MAX_ROOMS} room_id values.'}, 400
+        if not start:
+            return {'success': False, 'message': 'month must be in YYYY-MM format.'}, 400
+        months = max(1, min(months, CALENDAR_MAX_MONTHS))
+
+        occupied = RoomOccupancy.calendar(room_ids, start, months)
+        calendar = {}
+        for room_id in room_ids:
+            month, free_by_month = start, {}
+            for _ in range(months):
+                all_days = (1 << RoomOccupancy.days_in(month)) - 1
+                free = all_days & ~occupied[room_id].get(month, 0)
+                free_by_month[f'{month:%Y-%m}'] = [d + 1 for d in range(free.bit_length()) if free >> d & 1]
+                month = (month + timedelta(days=32)).replace(day=1)
+            calendar[room_id] = free_by_month
+
+        return jsonify({'success': True, 'free_nights': calendar})
+    except Exception as e:
+        print(f"Error in rooms calendar: {str(e)}")
+        return {'success': False, 'message': 'An error occurred. Please try again.'}, 500
+
+# ==================== ROOMS AVAILABILITY (JSON) ====================
+@main.route('/api/rooms/available')
+def rooms_available():
+    try:
+        filters, error = _room_filters(request.args)
+        if error or not filters['check_in']:
+            message = error or 'check_in and check_out are required.'
+            return {'success': False, 'message': message}, 400
+
+        rooms = Room.search_available(
+            filters['check_in'],
+            filters['check_out'],
+            guests=filters['guests'] or 1,
+            room_type=filters['room_type'],
+            min_price=filters['min_price'],
+            max_price=filters['max_price'],
+            amenities=filters['amenities']
+        ).all()
+        return jsonify({
+            'success': True,
+            'check_in': filters['check_in'].isoformat(),
+            'check_out': filters['check_out'].isoformat(),
+            'count': len(rooms),
+            'rooms': [room.to_dict() for room in rooms]
+        })
+    except Exception as e:
+        print(f"Error in rooms availability: {str(e)}")
+        return {'success': False, 'message': 'An error occurred. Please try again.'}, 500
+
 # ==================== PRIVACY POLICY ====================
 @main.route('/privacy')
+@cached_page(max_age=86400)
 def privacy():
     try:
         return render_template('extra/privacy.html')
@@ -68,6 +290,7 @@ def privacy():
 
 # ==================== TERMS OF SERVICE ====================
 @main.route('/terms')
+@cached_page(max_age=86400)
 def terms():
     try:
         return render_template('extra/terms.html')
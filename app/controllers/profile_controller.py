@@ -1,6 +1,7 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify, abort
 from flask_login import login_required, current_user
 from app.extensions import db
+from app.services.identity_cache import load_current_user
 
 profile = Blueprint('profile', __name__, url_prefix='/profile')
 
@@ -58,9 +59,10 @@ def edit():
 
             # Update user profile
             try:
-                current_user.first_name = first_name
-                current_user.last_name = last_name if last_name else None
-                current_user.phone = phone if phone else None
+                user = load_current_user()
+                user.first_name = first_name
+                user.last_name = last_name if last_name else None
+                user.phone = phone if phone else None
 
                 db.session.commit()
 
@@ -94,10 +96,11 @@ def change_password():
             confirm_password = request.form.get('confirm_password', '').strip()
 
             errors = []
+            user = load_current_user()
 
             if not current_password:
                 errors.append('Current password is required.')
-            elif not current_user.check_password(current_password):
+            elif not user.check_password(current_password):
                 errors.append('Current password is incorrect.')
 
             # New password validation
@@ -132,7 +135,7 @@ def change_password():
 
             # Update password
             try:
-                current_user.set_password(new_password)
+                user.set_password(new_password)
                 db.session.commit()
 
                 flash('Password changed successfully!', 'success')
@@ -165,13 +168,14 @@ def delete_account():
             flash('Password is required to delete your account.', 'danger')
             return redirect(url_for('profile.view'))
 
-        if not current_user.check_password(password):
+        user = load_current_user()
+        if not user.check_password(password):
             flash('Incorrect password. Account deletion failed.', 'danger')
             return redirect(url_for('profile.view'))
 
         try:
             # Soft delete - deactivate account instead of hard delete
-            current_user.is_active = False
+            user.is_active = False
             db.session.commit()
 
             # Log out the user
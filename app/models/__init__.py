@@ -2,5 +2,13 @@ from app.models.user import User
 from app.models.room import Room
 from app.models.bookings import Booking
 from app.models.review import Review
+from app.models.amenity import Amenity
+from app.models.occupancy import RoomOccupancy
+from app.models.idempotency import IdempotencyKey
+from app.models.booking_stats import RoomDailyStats, RoomTypeDailyStats
+from app.models.mail_outbox import OutboxMessage
+from app.models.otp import PasswordResetOTP
+from app.models import room_search  # noqa: F401 - registers the search index DDL and listeners
 
-__all__ = ['User', 'Room', 'Booking', 'Review']
\ No newline at end of file
+__all__ = ['User', 'Room', 'Booking', 'Review', 'Amenity', 'RoomOccupancy', 'IdempotencyKey',
+           'RoomDailyStats', 'RoomTypeDailyStats', 'OutboxMessage', 'PasswordResetOTP']
\ No newline at end of file
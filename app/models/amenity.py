@@ -0,0 +1,113 @@
+import time
+from datetime import datetime
+from sqlalchemy.exc import IntegrityError
+from app.extensions import db
+
+# Bits 0..62 of a signed 64-bit integer
+MAX_AMENITIES = 63
+
+# Process-wide copy of the (small, rarely changing) catalog
+CATALOG_CACHE_TTL = 300  # seconds
+_catalog_cache = {'by_name': None, 'by_bit': None, 'loaded_at': 0.0}
+
+# Concurrent admins may pick the same free bit; the loser re-reads and retries
+CREATE_ATTEMPTS = 5
+
+
+class Amenity(db.Model):
+    __tablename__ = 'amenities'
+
+    # ID
+    id = db.Column(db.Integer, primary_key=True)
+
+    # Catalog entry
+    name = db.Column(db.String(50), unique=True, nullable=False)
+    bit = db.Column(db.Integer, unique=True, nullable=False)  # position in Room.amenity_mask
+
+    # Timestamp
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    # --- Catalog Cache ---
+
+    @classmethod
+    def _load_catalog(cls):
+        rows = db.session.execute(db.select(cls.name, cls.bit)).all()
+        _catalog_cache['by_name'] = {name.lower(): (name, bit) for name, bit in rows}
+        _catalog_cache['by_bit'] = {bit: name for name, bit in rows}
+        _catalog_cache['loaded_at'] = time.monotonic()
+
+    @classmethod
+    def _cache_is_fresh(cls):
+        return (_catalog_cache['by_bit'] is not None
+                and time.monotonic() - _catalog_cache['loaded_at'] < CATALOG_CACHE_TTL)
+
+    @classmethod
+    def clear_cache(cls):
+        _catalog_cache['by_name'] = None
+        _catalog_cache['by_bit'] = None
+
+    @classmethod
+    def names_by_bit(cls):
+        if not cls._cache_is_fresh():
+            cls._load_catalog()
+        return _catalog_cache['by_bit']
+
+    @classmethod
+    def lookup(cls, name):
+        """Return (name, bit) for a catalog entry (case-insensitive), or None"""
+        key = name.strip().lower()
+        if not cls._cache_is_fresh() or key not in _catalog_cache['by_name']:
+            # Another process may have added it since we last loaded
+            cls._load_catalog()
+        return _catalog_cache['by_name'].get(key)
+
+    # --- Mask Helpers ---
+
+    @classmethod
+    def get_or_create(cls, name):
+        """Return the bit for an amenity, adding it to the catalog if new"""
+        for _ in range(CREATE_ATTEMPTS):
+            found = cls.lookup(name)
+            if found:
+                return found[1]
+
+            next_bit = db.session.execute(db.select(db.func.coalesce(db.func.max(cls.bit) + 1, 0))).scalar()
+            if next_bit >= MAX_AMENITIES:
+                raise ValueError(f"Amenity catalog is full ({MAX_AMENITIES} entries)")
+
+            try:
+                # Savepoint: a clash (same name or bit added concurrently) only undoes this insert
+                with db.session.begin_nested():
+                    db.session.add(cls(name=name.strip(), bit=next_bit))
+            except IntegrityError:
+                cls.clear_cache()
+                continue
+            cls.clear_cache()
+            return next_bit
+        raise RuntimeError(f"Could not add amenity {name.strip()!r} to the catalog")
+
+    @classmethod
+    def mask_for(cls, names):
+        """Bitmask for existing amenities, or None if any name is unknown"""
+        mask = 0
+        for name in names:
+            found = cls.lookup(name)
+            if not found:
+                return None
+            mask |= 1 << found[1]
+        return mask
+
+    @classmethod
+    def names_for(cls, mask):
+        """Amenity names set in a mask, in catalog order"""
+        if not mask:
+            return []
+        names = cls.names_by_bit()
+        if any(mask >> bit & 1 and bit not in names for bit in range(MAX_AMENITIES)):
+            cls._load_catalog()
+            names = cls.names_by_bit()
+        return [names[bit] for bit in sorted(names) if mask >> bit & 1]
+
+    # --- Representation ---
+    def __repr__(self):
+        return f'<Amenity {self.name} (bit {self.bit})>'
@@ -0,0 +1,210 @@
+from collections import defaultdict
+from datetime import timedelta
+from app.extensions import db
+from app.models.bookings import Booking, on_status_change
+from app.models.room import Room
+from app.models.sql_helpers import upsert
+
+# Rollups are keyed by stay night: a booking adds one night (and its nightly
+# share of total_price) to every night it covers, and one arrival to its
+# check-in night. Summing `arrivals` over a range gives booking counts by
+# status; summing `nights`/`revenue` gives occupancy and revenue.
+
+
+class _DailyStatsMixin:
+    day = db.Column(db.Date, primary_key=True)
+    status = db.Column(db.String(20), primary_key=True)
+    arrivals = db.Column(db.Integer, default=0, nullable=False)
+    nights = db.Column(db.Integer, default=0, nullable=False)
+    revenue = db.Column(db.Float, default=0.0, nullable=False)
+
+    @classmethod
+    def apply(cls, connection, deltas):
+        """Add {(day, key, status): [arrivals, nights, revenue]} onto the stored rows"""
+        table = cls.__table__
+        key = cls.KEY_COLUMN
+        rows = [{'day': day, key: value, 'status': status,
+                 'arrivals': arrivals, 'nights': nights, 'revenue': revenue}
+                for (day, value, status), (arrivals, nights, revenue) in deltas.items()]
+        upsert(connection, table, rows, ['day', key, 'status'], lambda excluded: {
+            'arrivals': table.c.arrivals + excluded.arrivals,
+            'nights': table.c.nights + excluded.nights,
+            'revenue': table.c.revenue + excluded.revenue
+        })
+
+
+class RoomDailyStats(_DailyStatsMixin, db.Model):
+    __tablename__ = 'room_daily_stats'
+    KEY_COLUMN = 'room_id'
+
+    # Primary key (room_id, day, status) also serves per-room date-range reads
+    room_id = db.Column(db.Integer, db.ForeignKey('rooms.id'), primary_key=True)
+
+    def __repr__(self):
+        return f'<RoomDailyStats Room:{self.room_id} {self.day} {self.status}>'
+
+
+class RoomTypeDailyStats(_DailyStatsMixin, db.Model):
+    __tablename__ = 'room_type_daily_stats'
+    KEY_COLUMN = 'room_type'
+
+    room_type = db.Column(db.String(20), primary_key=True)
+
+    def __repr__(self):
+        return f'<RoomTypeDailyStats {self.room_type} {self.day} {self.status}>'
+
+
+# --- Accumulation ---
+
+def _accumulate(room_deltas, type_deltas, room_id, room_type, status, check_in, check_out, total_price, sign,
+                start=None, end=None):
+    """Add a stay's nights to the deltas; start/end limit it to the nights [start, end)"""
+    nights = (check_out - check_in).days
+    if nights <= 0:
+        return
+    nightly = (total_price or 0.0) / nights
+    first = (max(check_in, start) - check_in).days if start else 0
+    last = (min(check_out, end) - check_in).days if end else nights
+    for offset in range(first, last):
+        day = check_in + timedelta(days=offset)
+        arrival = 1 if offset == 0 else 0
+        for deltas, key in ((room_deltas, room_id), (type_deltas, room_type)):
+            entry = deltas[(day, key, status)]
+            entry[0] += sign * arrival
+            entry[1] += sign
+            entry[2] += sign * nightly
+
+
+def _new_deltas():
+    return defaultdict(lambda: [0, 0, 0.0]), defaultdict(lambda: [0, 0, 0.0])
+
+
+def _room_types(connection, room_ids):
+    return dict(connection.execute(
+        db.select(Room.id, Room.room_type).where(Room.id.in_(set(room_ids)))
+    ).all())
+
+
+def rebuild_daily_stats(batch_size=5000, chunk_days=31):
+    """
+    Recompute both rollup tables from the bookings table, chunk_days nights
+    at a time, so memory is bounded by rooms x chunk_days x statuses
+    rather than by the whole history.
+    Returns the number of (room, night, status) rows written.
+    """
+    connection = db.session.connection()
+    room_types = dict(connection.execute(db.select(Room.id, Room.room_type)).all())
+    for model in (RoomDailyStats, RoomTypeDailyStats):
+        db.session.execute(db.delete(model))
+
+    first, last = db.session.execute(
+        db.select(db.func.min(Booking.check_in_date), db.func.max(Booking.check_out_date))
+    ).one()
+    written = 0
+    start = first
+    while first is not None and start < last:
+        end = start + timedelta(days=chunk_days)
+        room_deltas, type_deltas = _new_deltas()
+        bookings = (
+            db.select(Booking.room_id, Booking.status, Booking.check_in_date,
+                      Booking.check_out_date, Booking.total_price)
+            .where(Booking.check_in_date < end, Booking.check_out_date > start)
+            .execution_options(yield_per=batch_size)
+        )
+        for room_id, status, check_in, check_out, total_price in db.session.execute(bookings):
+            _accumulate(room_deltas, type_deltas, room_id, room_types.get(room_id), status,
+                        check_in, check_out, total_price, 1, start, end)
+
+        for model, deltas in ((RoomDailyStats, room_deltas), (RoomTypeDailyStats, type_deltas)):
+            key = model.KEY_COLUMN
+            rows = [{'day': day, key: value, 'status': status,
+                     'arrivals': arrivals, 'nights': nights, 'revenue': revenue}
+                    for (day, value, status), (arrivals, nights, revenue) in deltas.items()]
+            for offset in range(0, len(rows), batch_size):
+                db.session.execute(db.insert(model), rows[offset:offset + batch_size])
+        written += len(room_deltas)
+        start = end
+    db.session.commit()
+    return written
+
+
+# --- Dashboard Queries ---
+
+def _empty_summary():
+    return {'rooms': 0, 'nights_sold': 0, 'revenue': 0.0, 'occupancy': 0.0, 'bookings_by_status': {}}
+
+
+def dashboard_summary(start, end):
+    """
+    Totals for the nights [start, end), read from the per-room_type rollup
+    (days x room types x statuses rows, independent of bookings volume).
+    """
+    rows = db.session.execute(
+        db.select(
+            RoomTypeDailyStats.room_type,
+            RoomTypeDailyStats.status,
+            db.func.sum(RoomTypeDailyStats.arrivals),
+            db.func.sum(RoomTypeDailyStats.nights),
+            db.func.sum(RoomTypeDailyStats.revenue)
+        )
+        .where(RoomTypeDailyStats.day >= start, RoomTypeDailyStats.day < end)
+        .group_by(RoomTypeDailyStats.room_type, RoomTypeDailyStats.status)
+    ).all()
+    rooms_by_type = dict(db.session.execute(
+        db.select(Room.room_type, db.func.count(Room.id)).group_by(Room.room_type)
+    ).all())
+
+    days = (end - start).days
+    by_type = defaultdict(_empty_summary)
+    for room_type, count in rooms_by_type.items():
+        by_type[room_type]['rooms'] = count
+    for room_type, status, arrivals, nights, revenue in rows:
+        stats = by_type[room_type]
+        if arrivals:
+            stats['bookings_by_status'][status] = arrivals
+        if status == 'confirmed':
+            stats['nights_sold'] += nights
+            stats['revenue'] += revenue
+
+    totals = _empty_summary()
+    for stats in by_type.values():
+        stats['revenue'] = round(stats['revenue'], 2)
+        capacity = stats['rooms'] * days
+        stats['occupancy'] = round(stats['nights_sold'] / capacity, 4) if capacity else 0.0
+        totals['rooms'] += stats['rooms']
+        totals['nights_sold'] += stats['nights_sold']
+        totals['revenue'] += stats['revenue']
+        for status, count in stats['bookings_by_status'].items():
+            totals['bookings_by_status'][status] = totals['bookings_by_status'].get(status, 0) + count
+
+    capacity = totals['rooms'] * days
+    totals['revenue'] = round(totals['revenue'], 2)
+    totals['occupancy'] = round(totals['nights_sold'] / capacity, 4) if capacity else 0.0
+    return {'start': start.isoformat(), 'end': end.isoformat(), 'days': days,
+            'totals': totals, 'room_types': dict(sorted(by_type.items()))}
+
+
+def room_daily_series(room_id, start, end):
+    """Per-night confirmed nights and revenue for one room: [{day, nights, revenue}, ...]"""
+    rows = db.session.execute(
+        db.select(RoomDailyStats.day, RoomDailyStats.nights, RoomDailyStats.revenue)
+        .where(RoomDailyStats.room_id == room_id, RoomDailyStats.status == 'confirmed',
+               RoomDailyStats.day >= start, RoomDailyStats.day < end)
+        .order_by(RoomDailyStats.day)
+    ).all()
+    return [{'day': day.isoformat(), 'nights': nights, 'revenue': round(revenue, 2)}
+            for day, nights, revenue in rows if nights]
+
+
+@on_status_change
+def _update_daily_stats(connection, changes):
+    room_types = _room_types(connection, [change.room_id for change in changes])
+    room_deltas, type_deltas = _new_deltas()
+    for change in changes:
+        room_type = room_types.get(change.room_id)
+        for status, sign in ((change.old_status, -1), (change.new_status, 1)):
+            if status is not None:
+                _accumulate(room_deltas, type_deltas, change.room_id, room_type, status,
+                            change.check_in_date, change.check_out_date, change.total_price, sign)
+    RoomDailyStats.apply(connection, room_deltas)
+    RoomTypeDailyStats.apply(connection, type_deltas)
@@ -1,25 +1,50 @@
+from collections import namedtuple
 from datetime import datetime
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import column_property
 from app.extensions import db
 
 class Booking(db.Model):
     __tablename__ = 'bookings'
 
+    # Statuses that hold a room's nights
+    ACTIVE_STATUSES = ('pending', 'confirmed')
+
+    # Indexes for the overlap check and a user's booking history
+    __table_args__ = (
+        db.Index('ix_bookings_room_status_dates', 'room_id', 'status', 'check_in_date', 'check_out_date'),
+        db.Index('ix_bookings_user_created', 'user_id', 'created_at'),
+        # Partial index: only bookings that still block availability
+        db.Index(
+            'ix_bookings_active_room_dates', 'room_id', 'check_in_date', 'check_out_date',
+            postgresql_where=db.text("status IN ('pending', 'confirmed')"),
+            sqlite_where=db.text("status IN ('pending', 'confirmed')")
+        ),
+        # Partial index: the expiry sweep's oldest-pending-first scan
+        db.Index(
+            'ix_bookings_pending_created', 'created_at', 'id',
+            postgresql_where=db.text("status = 'pending'"),
+            sqlite_where=db.text("status = 'pending'")
+        ),
+    )
+
     # Primary Key
     id = db.Column(db.Integer, primary_key=True)
 
     # Foreign Keys
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
-    room_id = db.Column(db.Integer, db.ForeignKey('rooms.id'), nullable=False)
+    # active_history: keep old values on change for the status change hooks below
+    room_id = column_property(db.Column(db.Integer, db.ForeignKey('rooms.id'), nullable=False), active_history=True)
 
     # Booking Details
-    check_in_date = db.Column(db.Date, nullable=False)
-    check_out_date = db.Column(db.Date, nullable=False)
+    check_in_date = column_property(db.Column(db.Date, nullable=False), active_history=True)
+    check_out_date = column_property(db.Column(db.Date, nullable=False), active_history=True)
     guests_count = db.Column(db.Integer, nullable=False, default=1)
-    total_price = db.Column(db.Float, nullable=False)
+    total_price = column_property(db.Column(db.Float, nullable=False), active_history=True)
 
     # Status
-    status = db.Column(db.String(20), default='pending', nullable=False)
-    # 'pending', 'confirmed', 'cancelled', 'rejected'
+    status = column_property(db.Column(db.String(20), default='pending', nullable=False), active_history=True)
+    # 'pending', 'confirmed', 'cancelled', 'rejected', 'expired'
 
     # Admin action
     rejection_reason = db.Column(db.Text, nullable=True)
@@ -124,6 +149,93 @@ class Booking(db.Model):
         except Exception as e:
             return False, f"Error rejecting booking: {str(e)}"
 
+    # --- Serialization ---
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'room_id': self.room_id,
+            'check_in_date': self.check_in_date.isoformat() if self.check_in_date else None,
+            'check_out_date': self.check_out_date.isoformat() if self.check_out_date else None,
+            'nights': self.calculate_nights(),
+            'guests_count': self.guests_count,
+            'total_price': self.total_price,
+            'status': self.status,
+            'rejection_reason': self.rejection_reason,
+            'created_at': self.created_at.strftime('%Y-%m-%d %H:%M:%S') if self.created_at else None
+        }
+
     # --- Representation ---
     def __repr__(self):
-        return f'<Booking {self.id} - Room {self.room_id} ({self.status})>'
\ No newline at end of file
+        return f'<Booking {self.id} - Room {self.room_id} ({self.status})>'
+
+# --- Status Change Hooks ---
+# Derived data (occupancy calendar, ...) registers a handler here. ORM
+# inserts/updates/deletes are dispatched automatically by the mapper events
+# below; set-based UPDATEs that bypass the ORM must call
+# dispatch_status_changes() themselves with the rows they changed.
+
+BookingChange = namedtuple(
+    'BookingChange',
+    ['booking_id', 'room_id', 'check_in_date', 'check_out_date', 'total_price', 'old_status', 'new_status']
+)
+
+_status_change_handlers = []
+
+
+def on_status_change(handler):
+    """Register handler(connection, changes) to run for booking status changes"""
+    _status_change_handlers.append(handler)
+    return handler
+
+
+def dispatch_status_changes(connection, changes):
+    changes = [change for change in changes if change.old_status != change.new_status]
+    if not changes:
+        return
+    for handler in _status_change_handlers:
+        handler(connection, changes)
+
+
+def _change(booking, old_status, new_status, **overrides):
+    values = {
+        'booking_id': booking.id,
+        'room_id': booking.room_id,
+        'check_in_date': booking.check_in_date,
+        'check_out_date': booking.check_out_date,
+        'total_price': booking.total_price,
+        'old_status': old_status,
+        'new_status': new_status
+    }
+    values.update(overrides)
+    return BookingChange(**values)
+
+
+@event.listens_for(Booking, 'after_insert')
+def _booking_inserted(mapper, connection, target):
+    dispatch_status_changes(connection, [_change(target, None, target.status)])
+
+
+@event.listens_for(Booking, 'after_delete')
+def _booking_deleted(mapper, connection, target):
+    dispatch_status_changes(connection, [_change(target, target.status, None)])
+
+
+@event.listens_for(Booking, 'after_update')
+def _booking_updated(mapper, connection, target):
+    state = inspect(target)
+    tracked = ('status', 'room_id', 'check_in_date', 'check_out_date', 'total_price')
+    history = {name: state.attrs[name].history for name in tracked}
+    if not any(h.has_changes() for h in history.values()):
+        return
+
+    old = {name: (h.deleted[0] if h.deleted else getattr(target, name)) for name, h in history.items()}
+    if all(not history[name].has_changes() for name in tracked if name != 'status'):
+        dispatch_status_changes(connection, [_change(target, old['status'], target.status)])
+        return
+
+    # Room, dates or price moved: retract the old stay, then apply the new one
+    dispatch_status_changes(connection, [
+        _change(target, old['status'], None, room_id=old['room_id'], check_in_date=old['check_in_date'],
+                check_out_date=old['check_out_date'], total_price=old['total_price']),
+        _change(target, None, target.status)
+    ])
@@ -0,0 +1,153 @@
+import hashlib
+import json
+from datetime import datetime, timedelta
+from sqlalchemy.exc import IntegrityError
+from app.extensions import db
+
+# Response headers worth replaying (cookies and per-request headers are not)
+REPLAY_HEADERS = ('Content-Type', 'Location')
+
+
+class IdempotencyKey(db.Model):
+    __tablename__ = 'idempotency_keys'
+
+    # One key per client scope (user or anonymous) and endpoint
+    __table_args__ = (
+        db.UniqueConstraint('scope', 'key', name='uq_idempotency_keys_scope_key'),
+        db.Index('ix_idempotency_keys_expires_at', 'expires_at'),
+    )
+
+    # ID
+    id = db.Column(db.Integer, primary_key=True)
+
+    # Key
+    scope = db.Column(db.String(120), nullable=False)
+    key = db.Column(db.String(255), nullable=False)
+    request_hash = db.Column(db.String(64), nullable=False)  # sha256 of method, path and body
+
+    # Stored response ('processing' until the first request finishes)
+    status = db.Column(db.String(20), default='processing', nullable=False)
+    # Processing lease: a request that died without releasing the key
+    # (worker killed, deploy) stops blocking retries once it runs out
+    locked_until = db.Column(db.DateTime, nullable=True)
+    response_code = db.Column(db.Integer, nullable=True)
+    response_headers = db.Column(db.Text, nullable=True)  # JSON object
+    response_body = db.Column(db.LargeBinary, nullable=True)
+
+    # Timestamps
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False)
+
+    # --- Helpers ---
+
+    @staticmethod
+    def fingerprint(method, path, body):
+        digest = hashlib.sha256()
+        digest.update(f"{method} {path}\n".encode())
+        digest.update(body or b'')
+        return digest.hexdigest()
+
+    def is_expired(self):
+        return self.expires_at <= datetime.utcnow()
+
+    def get_headers(self):
+        return json.loads(self.response_headers) if self.response_headers else {}
+
+    def _owned(self):
+        """WHERE clause matching this row only while our lease on it is current"""
+        cls = type(self)
+        return (cls.id == self.id, cls.status == 'processing', cls.locked_until == self.lease)
+
+    # --- Lifecycle ---
+
+    @classmethod
+    def claim(cls, scope, key, request_hash, ttl, lease):
+        """
+        Record that a request with this key has started, holding it for
+        `lease` seconds. Returns (record, created): created is False when
+        the key was already used, in which case record is the existing
+        (live) row. A 'processing' row whose lease ran out is taken over.
+        """
+        for _ in range(3):
+            now = datetime.utcnow()
+            locked_until = now + timedelta(seconds=lease)
+            record = cls(
+                scope=scope,
+                key=key,
+                request_hash=request_hash,
+                locked_until=locked_until,
+                expires_at=now + timedelta(seconds=ttl)
+            )
+            db.session.add(record)
+            try:
+                db.session.commit()
+                record.lease = locked_until
+                return record, True
+            except IntegrityError:
+                db.session.rollback()
+
+            existing = cls.query.filter_by(scope=scope, key=key).first()
+            if existing is None:
+                continue  # swept between the insert and the lookup
+            if existing.status == 'processing' and not existing.is_expired() and (
+                    existing.locked_until is None or existing.locked_until <= now):
+                # The request holding it died: take it over (one winner)
+                taken = db.session.execute(
+                    db.update(cls)
+                    .where(cls.id == existing.id, cls.status == 'processing',
+                           db.or_(cls.locked_until.is_(None), cls.locked_until <= now))
+                    .values(request_hash=request_hash, locked_until=locked_until,
+                            expires_at=now + timedelta(seconds=ttl))
+                ).rowcount
+                db.session.commit()
+                if taken:
+                    db.session.refresh(existing)
+                    existing.lease = locked_until
+                    return existing, True
+                continue
+            if not existing.is_expired():
+                return existing, False
+            # Expired but not swept yet - free the key and claim it again
+            db.session.delete(existing)
+            db.session.commit()
+        raise RuntimeError(f"Could not claim idempotency key {key!r}")
+
+    def complete(self, response):
+        """Store the finished response so retries can be replayed (unless our lease was taken over)"""
+        db.session.execute(
+            db.update(type(self)).where(*self._owned()).values(
+                status='completed',
+                locked_until=None,
+                response_code=response.status_code,
+                response_headers=json.dumps({
+                    name: response.headers[name] for name in REPLAY_HEADERS if name in response.headers
+                }),
+                response_body=response.get_data()
+            )
+        )
+        db.session.commit()
+
+    def release(self):
+        """Forget the key so the client can retry after a failure"""
+        db.session.execute(db.delete(type(self)).where(*self._owned()))
+        db.session.commit()
+
+    @classmethod
+    def sweep_expired(cls, batch_size=1000):
+        """Delete expired keys in batches (short transactions). Returns rows deleted."""
+        deleted = 0
+        while True:
+            ids = db.session.scalars(
+                db.select(cls.id)
+                .where(cls.expires_at <= datetime.utcnow())
+                .order_by(cls.expires_at)
+                .limit(batch_size)
+            ).all()
+            if not ids:
+                return deleted
+            db.session.execute(db.delete(cls).where(cls.id.in_(ids)))
+            db.session.commit()
+            deleted += len(ids)
+
+    def __repr__(self):
+        return f'<IdempotencyKey {self.scope} {self.key} {self.status}>'
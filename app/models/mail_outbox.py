@@ -0,0 +1,87 @@
+import json
+from datetime import datetime, timedelta
+from flask_mail import Message
+from app.extensions import db
+
+
+class OutboxMessage(db.Model):
+    __tablename__ = 'mail_outbox'
+
+    # Index for the workers' "next due message" scan
+    __table_args__ = (
+        db.Index(
+            'ix_mail_outbox_due', 'next_attempt_at', 'id',
+            postgresql_where=db.text("status = 'pending'"),
+            sqlite_where=db.text("status = 'pending'")
+        ),
+        db.Index('ix_mail_outbox_status_locked', 'status', 'locked_until'),
+        # Index for the retention sweep of delivered messages
+        db.Index('ix_mail_outbox_status_sent_at', 'status', 'sent_at'),
+    )
+
+    # ID
+    id = db.Column(db.Integer, primary_key=True)
+
+    # Message (html/body are cleared once sent: they can hold reset codes)
+    subject = db.Column(db.String(255), nullable=False)
+    recipients = db.Column(db.Text, nullable=False)  # JSON list
+    sender = db.Column(db.Text, nullable=True)  # JSON string or [name, address]
+    html = db.Column(db.Text, nullable=True)
+    body = db.Column(db.Text, nullable=True)
+
+    # Delivery state
+    status = db.Column(db.String(20), default='pending', nullable=False)
+    # 'pending', 'sending', 'sent', 'dead'
+    attempts = db.Column(db.Integer, default=0, nullable=False)
+    next_attempt_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    locked_until = db.Column(db.DateTime, nullable=True)  # lease held by a worker while 'sending'
+    last_error = db.Column(db.Text, nullable=True)
+
+    # Timestamps
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    sent_at = db.Column(db.DateTime, nullable=True)
+
+    # --- Conversion ---
+
+    @classmethod
+    def from_message(cls, msg):
+        return cls(
+            subject=msg.subject,
+            recipients=json.dumps(msg.recipients),
+            sender=json.dumps(msg.sender) if msg.sender else None,
+            html=msg.html,
+            body=msg.body
+        )
+
+    def to_message(self):
+        sender = json.loads(self.sender) if self.sender else None
+        return Message(
+            subject=self.subject,
+            recipients=json.loads(self.recipients),
+            sender=tuple(sender) if isinstance(sender, list) else sender,
+            html=self.html,
+            body=self.body
+        )
+
+    # --- Retention ---
+
+    @classmethod
+    def sweep_sent(cls, retention, batch_size=1000):
+        """Delete messages sent more than `retention` seconds ago, in batches. Returns rows deleted."""
+        deleted = 0
+        while True:
+            cutoff = datetime.utcnow() - timedelta(seconds=retention)
+            ids = db.session.scalars(
+                db.select(cls.id)
+                .where(cls.status == 'sent', cls.sent_at <= cutoff)
+                .order_by(cls.sent_at)
+                .limit(batch_size)
+            ).all()
+            if not ids:
+                return deleted
+            db.session.execute(db.delete(cls).where(cls.id.in_(ids)))
+            db.session.commit()
+            deleted += len(ids)
+
+    def __repr__(self):
+        return f'<OutboxMessage {self.id} {self.subject!r} ({self.status})>'
@@ -0,0 +1,143 @@
+import calendar
+from collections import defaultdict
+from datetime import date, timedelta
+from app.extensions import db
+from app.models.bookings import Booking, on_status_change
+from app.models.sql_helpers import upsert
+
+# Bit (day - 1) of `nights` is set when that night is held by an active booking
+FULL_MONTH = (1 << 31) - 1
+
+
+class RoomOccupancy(db.Model):
+    __tablename__ = 'room_occupancy'
+
+    # One row per room per month
+    room_id = db.Column(db.Integer, db.ForeignKey('rooms.id'), primary_key=True)
+    month = db.Column(db.Date, primary_key=True)  # first day of the month
+    nights = db.Column(db.Integer, default=0, nullable=False)
+
+    # --- Bit Helpers ---
+
+    @staticmethod
+    def month_masks(check_in, check_out):
+        """Split the nights [check_in, check_out) into {month_start: bitmask}"""
+        masks = defaultdict(int)
+        night = check_in
+        while night < check_out:
+            masks[night.replace(day=1)] |= 1 << (night.day - 1)
+            night += timedelta(days=1)
+        return dict(masks)
+
+    @staticmethod
+    def days_in(month):
+        return calendar.monthrange(month.year, month.month)[1]
+
+    # --- Incremental Maintenance ---
+
+    @classmethod
+    def mark(cls, connection, room_id, check_in, check_out):
+        """Set the nights of a stay (OR into the month rows, creating them as needed)"""
+        table = cls.__table__
+        rows = [{'room_id': room_id, 'month': month, 'nights': mask}
+                for month, mask in cls.month_masks(check_in, check_out).items()]
+        upsert(connection, table, rows, ['room_id', 'month'],
+               lambda excluded: {'nights': table.c.nights.op('|')(excluded.nights)})
+
+    @classmethod
+    def clear(cls, connection, room_id, check_in, check_out):
+        """Clear the nights of a stay (relies on active bookings never overlapping)"""
+        table = cls.__table__
+        for month, mask in cls.month_masks(check_in, check_out).items():
+            connection.execute(
+                db.update(table)
+                .where(table.c.room_id == room_id, table.c.month == month)
+                .values(nights=table.c.nights.op('&')(FULL_MONTH ^ mask))
+            )
+
+    # --- Queries ---
+
+    @classmethod
+    def free_nights(cls, room_ids, year, month):
+        """
+        Free nights in one month for several rooms: {room_id: [day, ...]}.
+        One indexed read of a row per room, then a single bitwise pass.
+        """
+        month_start = date(year, month, 1)
+        all_days = (1 << cls.days_in(month_start)) - 1
+        occupied = dict(db.session.execute(
+            db.select(cls.room_id, cls.nights).where(cls.room_id.in_(room_ids), cls.month == month_start)
+        ).all())
+
+        result = {}
+        for room_id in room_ids:
+            free = all_days & ~occupied.get(room_id, 0)
+            result[room_id] = [day + 1 for day in range(free.bit_length()) if free >> day & 1]
+        return result
+
+    @classmethod
+    def calendar(cls, room_ids, start_month, months=12):
+        """Occupied-night bitmasks for a window of months: {room_id: {month_start: mask}}"""
+        end = start_month
+        for _ in range(months):
+            end = (end + timedelta(days=32)).replace(day=1)
+
+        rows = db.session.execute(
+            db.select(cls.room_id, cls.month, cls.nights)
+            .where(cls.room_id.in_(room_ids), cls.month >= start_month, cls.month < end)
+        ).all()
+
+        result = {room_id: {} for room_id in room_ids}
+        for room_id, month, nights in rows:
+            result[room_id][month] = nights
+        return result
+
+    @classmethod
+    def is_free(cls, room_id, check_in, check_out):
+        """True if none of the stay's nights are occupied"""
+        masks = cls.month_masks(check_in, check_out)
+        rows = db.session.execute(
+            db.select(cls.month, cls.nights).where(cls.room_id == room_id, cls.month.in_(list(masks)))
+        ).all()
+        return all(not nights & masks[month] for month, nights in rows)
+
+    # --- Rebuild ---
+
+    @classmethod
+    def rebuild(cls, batch_size=5000):
+        """
+        Recompute the whole calendar from the bookings table.
+        Returns the number of month rows written.
+        """
+        masks = defaultdict(int)
+        active = (
+            db.select(Booking.room_id, Booking.check_in_date, Booking.check_out_date)
+            .where(Booking.status.in_(Booking.ACTIVE_STATUSES))
+            .execution_options(yield_per=batch_size)
+        )
+        for room_id, check_in, check_out in db.session.execute(active):
+            for month, mask in cls.month_masks(check_in, check_out).items():
+                masks[(room_id, month)] |= mask
+
+        db.session.execute(db.delete(cls))
+        rows = [{'room_id': room_id, 'month': month, 'nights': nights}
+                for (room_id, month), nights in masks.items()]
+        for offset in range(0, len(rows), batch_size):
+            db.session.execute(db.insert(cls), rows[offset:offset + batch_size])
+        db.session.commit()
+        return len(rows)
+
+    # --- Representation ---
+    def __repr__(self):
+        return f'<RoomOccupancy Room:{self.room_id} {self.month:%Y-%m} {self.nights:031b}>'
+
+
+@on_status_change
+def _update_occupancy(connection, changes):
+    for change in changes:
+        was_active = change.old_status in Booking.ACTIVE_STATUSES
+        now_active = change.new_status in Booking.ACTIVE_STATUSES
+        if now_active and not was_active:
+            RoomOccupancy.mark(connection, change.room_id, change.check_in_date, change.check_out_date)
+        elif was_active and not now_active:
+            RoomOccupancy.clear(connection, change.room_id, change.check_in_date, change.check_out_date)
@@ -0,0 +1,99 @@
+import hashlib
+import hmac
+from datetime import datetime, timedelta
+from flask import current_app
+from app.extensions import db
+from app.models.sql_helpers import upsert
+
+
+class PasswordResetOTP(db.Model):
+    """
+    Short-lived password reset codes, kept off the users table so issuing
+    and sweeping them never writes user rows. Codes are stored as an HMAC
+    (keyed with SECRET_KEY), never in plain text.
+    """
+    __tablename__ = 'password_reset_otps'
+
+    # Index for the expiry sweep
+    __table_args__ = (
+        db.Index('ix_password_reset_otps_expires_at', 'expires_at'),
+    )
+
+    # ID - one live code per user; a resend replaces it
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True)
+
+    # Code
+    code_hash = db.Column(db.String(64), nullable=False)
+    attempts = db.Column(db.Integer, default=0, nullable=False)
+
+    # Timestamps
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False)
+
+    # --- Helpers ---
+
+    @staticmethod
+    def hash_code(user_id, code):
+        key = current_app.config['SECRET_KEY'].encode()
+        return hmac.new(key, f"{user_id}:{code}".encode(), hashlib.sha256).hexdigest()
+
+    # --- Lifecycle ---
+
+    @classmethod
+    def issue(cls, user_id, code, ttl=None):
+        """Store a new code for the user (replacing any previous one). Caller commits."""
+        ttl = ttl or current_app.config['OTP_TTL']
+        now = datetime.utcnow()
+        upsert(
+            db.session.connection(), cls.__table__,
+            [{'user_id': user_id, 'code_hash': cls.hash_code(user_id, code), 'attempts': 0,
+              'created_at': now, 'expires_at': now + timedelta(seconds=ttl)}],
+            ['user_id'],
+            lambda excluded: {
+                'code_hash': excluded.code_hash, 'attempts': 0,
+                'created_at': excluded.created_at, 'expires_at': excluded.expires_at
+            }
+        )
+
+    @classmethod
+    def verify(cls, user_id, code, max_attempts=None):
+        """
+        Check a code. Every check uses up one attempt (counted atomically and
+        committed), so a code locks after OTP_MAX_ATTEMPTS guesses.
+        """
+        max_attempts = max_attempts or current_app.config['OTP_MAX_ATTEMPTS']
+        table = cls.__table__
+        stored = db.session.execute(
+            db.update(table)
+            .where(table.c.user_id == user_id, table.c.expires_at > datetime.utcnow(),
+                   table.c.attempts < max_attempts)
+            .values(attempts=table.c.attempts + 1)
+            .returning(table.c.code_hash)
+        ).scalar()
+        db.session.commit()
+        return stored is not None and hmac.compare_digest(stored, cls.hash_code(user_id, code))
+
+    @classmethod
+    def consume(cls, user_id):
+        """Remove the user's code once it has been used. Caller commits."""
+        db.session.execute(db.delete(cls).where(cls.user_id == user_id))
+
+    @classmethod
+    def sweep_expired(cls, batch_size=1000):
+        """Delete expired codes in batches (short transactions). Returns rows deleted."""
+        deleted = 0
+        while True:
+            ids = db.session.scalars(
+                db.select(cls.user_id)
+                .where(cls.expires_at <= datetime.utcnow())
+                .order_by(cls.expires_at)
+                .limit(batch_size)
+            ).all()
+            if not ids:
+                return deleted
+            db.session.execute(db.delete(cls).where(cls.user_id.in_(ids)))
+            db.session.commit()
+            deleted += len(ids)
+
+    def __repr__(self):
+        return f'<PasswordResetOTP user={self.user_id} attempts={self.attempts}>'
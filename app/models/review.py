@@ -1,18 +1,26 @@
 from datetime import datetime
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import column_property, object_session
 from app.extensions import db
 
 class Review(db.Model):
     __tablename__ = 'reviews'
 
+    # Index for a room's reviews (rating recompute, newest first listing)
+    __table_args__ = (
+        db.Index('ix_reviews_room_created', 'room_id', 'created_at'),
+    )
+
     # Primary Key
     id = db.Column(db.Integer, primary_key=True)
 
     # Foreign Keys
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
-    room_id = db.Column(db.Integer, db.ForeignKey('rooms.id'), nullable=False)
+    # active_history: keep the old value on change so the room aggregate can subtract it
+    room_id = column_property(db.Column(db.Integer, db.ForeignKey('rooms.id'), nullable=False), active_history=True)
 
     # Review Content
-    rating = db.Column(db.Integer, nullable=False)  # 1-5
+    rating = column_property(db.Column(db.Integer, nullable=False), active_history=True)  # 1-5
     comment = db.Column(db.Text, nullable=True)
 
     # Timestamps
@@ -31,4 +39,62 @@ class Review(db.Model):
 
     # --- Representation ---
     def __repr__(self):
-        return f'<Review Room:{self.room_id} Rating:{self.rating}>'
\ No newline at end of file
+        return f'<Review Room:{self.room_id} Rating:{self.rating}>'
+
+
+# --- Room rating aggregate maintenance ---
+# Each review insert/edit/delete applies a +1/-1 delta to rooms.rating_*
+# in a single UPDATE on the flush connection, instead of reloading every
+# review for the room.
+
+def _apply_rating_change(connection, review, room_id, star, sign):
+    from app.models.room import Room
+    connection.execute(
+        db.update(Room.__table__)
+        .where(Room.__table__.c.id == room_id)
+        .values(**Room.rating_change_values(star, sign))
+    )
+    # Make loaded Room objects re-read the aggregate on next access
+    session = object_session(review)
+    if session is not None:
+        session.info.setdefault('stale_room_ratings', set()).add(room_id)
+
+
+@event.listens_for(Review, 'after_insert')
+def _review_inserted(mapper, connection, target):
+    _apply_rating_change(connection, target, target.room_id, target.rating, 1)
+
+
+@event.listens_for(Review, 'after_delete')
+def _review_deleted(mapper, connection, target):
+    state = inspect(target)
+    room_id = state.attrs.room_id.history.deleted or [target.room_id]
+    rating = state.attrs.rating.history.deleted or [target.rating]
+    _apply_rating_change(connection, target, room_id[0], rating[0], -1)
+
+
+@event.listens_for(Review, 'after_update')
+def _review_updated(mapper, connection, target):
+    state = inspect(target)
+    room_history = state.attrs.room_id.history
+    rating_history = state.attrs.rating.history
+    if not room_history.has_changes() and not rating_history.has_changes():
+        return
+
+    old_room = room_history.deleted[0] if room_history.deleted else target.room_id
+    old_rating = rating_history.deleted[0] if rating_history.deleted else target.rating
+    _apply_rating_change(connection, target, old_room, old_rating, -1)
+    _apply_rating_change(connection, target, target.room_id, target.rating, 1)
+
+
+@event.listens_for(db.session, 'after_flush_postexec')
+def _expire_stale_room_ratings(session, flush_context):
+    from app.models.room import Room
+    stale = session.info.pop('stale_room_ratings', None)
+    if not stale:
+        return
+    for room_id in stale:
+        room = session.identity_map.get(session.identity_key(Room, room_id))
+        if room is not None:
+            session.expire(room, ['rating', 'rating_sum', 'rating_count', 'rating_1',
+                                  'rating_2', 'rating_3', 'rating_4', 'rating_5'])
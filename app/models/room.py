@@ -1,6 +1,9 @@
 from datetime import datetime
 from app.extensions import db
 
+RATING_STARS = (1, 2, 3, 4, 5)
+RATING_TOLERANCE = 0.05 + 1e-9  # stored averages are rounded to 1 decimal
+
 class Room(db.Model):
     __tablename__ = 'rooms'
     # ID
@@ -12,13 +15,16 @@ class Room(db.Model):
     room_type = db.Column(db.String(20), nullable=False)  
     description = db.Column(db.Text, nullable=True)
 
+    # Full-text search source: description + amenity names (see models/room_search.py)
+    search_document = db.Column(db.Text, nullable=True)
+
     # Pricing & Capacity
     price_per_night = db.Column(db.Float, nullable=False)
     max_guests = db.Column(db.Integer, nullable=False, default=2)
     room_size = db.Column(db.String(20), nullable=True)  # e.g., "35 sqm"
 
-    # Amenities (comma seperated values)
-    amenities = db.Column(db.Text, nullable=True)  # "WiFi,TV,AC etc"
+    # Amenities - one bit per entry in the amenities catalog (see models/amenity.py)
+    amenity_mask = db.Column(db.BigInteger, default=0, nullable=False)
 
     # Image
     image = db.Column(db.String(256), nullable=True, default='default_room.jpg')
@@ -28,7 +34,23 @@ class Room(db.Model):
     # status = available, booked, maintenance
 
     # Rating
-    rating = db.Column(db.Float, default=0.0)
+    rating = db.Column(db.Float, default=0.0, nullable=False)
+
+    # Rating aggregate - incremented in SQL as reviews change (see models/review.py)
+    rating_sum = db.Column(db.Integer, default=0, nullable=False)
+    rating_count = db.Column(db.Integer, default=0, nullable=False)
+    rating_1 = db.Column(db.Integer, default=0, nullable=False)
+    rating_2 = db.Column(db.Integer, default=0, nullable=False)
+    rating_3 = db.Column(db.Integer, default=0, nullable=False)
+    rating_4 = db.Column(db.Integer, default=0, nullable=False)
+    rating_5 = db.Column(db.Integer, default=0, nullable=False)
+
+    # Keyset pagination indexes (sort column + id tie-breaker), amenity filter index
+    __table_args__ = (
+        db.Index('ix_rooms_price_id', 'price_per_night', 'id'),
+        db.Index('ix_rooms_rating_id', 'rating', 'id'),
+        db.Index('ix_rooms_amenity_mask', 'amenity_mask'),
+    )
 
     #TimeStamps
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
@@ -42,20 +64,23 @@ class Room(db.Model):
     
     def get_amenities_list(self):
         try:
-            if self.amenities:
-                return [a.strip() for a in self.amenities.split(',')]
-            return []
+            from app.models.amenity import Amenity
+            return Amenity.names_for(self.amenity_mask)
         except Exception as e:
             return []
 
     def set_amenities_list(self, amenities_list):
-        try:
-            if amenities_list:
-                self.amenities = ','.join(amenities_list)
-            else:
-                self.amenities = None
-        except Exception as e:
-            self.amenities = None
+        from app.models.amenity import Amenity
+        mask = 0
+        for name in amenities_list or []:
+            if name and name.strip():
+                mask |= 1 << Amenity.get_or_create(name)
+        self.amenity_mask = mask
+
+    def build_search_document(self):
+        """Text indexed for full-text search alongside the room name"""
+        parts = [self.description or ''] + self.get_amenities_list()
+        return ' '.join(part for part in parts if part).strip() or None
 
     # Status
     def is_available(self):
@@ -69,7 +94,7 @@ class Room(db.Model):
         try:
             from app.models.bookings import Booking
             active_count = self.bookings.filter(
-                Booking.status.in_(['confirmed', 'pending'])
+                Booking.status.in_(Booking.ACTIVE_STATUSES)
             ).count()
             return active_count > 0
         except Exception as e:
@@ -79,7 +104,7 @@ class Room(db.Model):
         try:
             from app.models.bookings import Booking
             conflicting = self.bookings.filter(
-                Booking.status.in_(['confirmed', 'pending']),
+                Booking.status.in_(Booking.ACTIVE_STATUSES),
                 Booking.check_in_date < check_out,
                 Booking.check_out_date > check_in
             ).count()
@@ -87,19 +112,265 @@ class Room(db.Model):
         except Exception as e:
             return False
 
+    # Listing & Search
+
+    # sort option -> (column name, descending)
+    SORT_OPTIONS = {
+        'recommended': ('rating', True),
+        'rating': ('rating', True),
+        'price-low': ('price_per_night', False),
+        'price-high': ('price_per_night', True)
+    }
+
+    @classmethod
+    def filter_by_amenities(cls, query, names):
+        """
+        Keep rooms that have every amenity in `names`.
+
+        Evaluated in SQL as `amenity_mask & wanted = wanted` against the
+        current rows, so a room saved by any process matches at once.
+        """
+        from app.models.amenity import Amenity
+        wanted = Amenity.mask_for(names)
+        if wanted is None:
+            return query.filter(db.false())
+        if not wanted:
+            return query
+
+        return query.filter(cls.amenity_mask.op('&')(wanted) == wanted)
+
+    @classmethod
+    def apply_filters(cls, query, room_type=None, min_price=None, max_price=None,
+                      guests=None, status=None, amenities=None):
+        """Narrow a room query by type, price range, capacity, status and amenities"""
+        if room_type:
+            if isinstance(room_type, str):
+                room_type = [room_type]
+            query = query.filter(cls.room_type.in_(room_type))
+        if min_price is not None:
+            query = query.filter(cls.price_per_night >= min_price)
+        if max_price is not None:
+            query = query.filter(cls.price_per_night <= max_price)
+        if guests:
+            query = query.filter(cls.max_guests >= guests)
+        if status:
+            query = query.filter(cls.status == status)
+        if amenities:
+            query = cls.filter_by_amenities(query, amenities)
+        return query
+
+    @classmethod
+    def search_available(cls, check_in, check_out, guests=1, room_type=None,
+                         min_price=None, max_price=None, amenities=None):
+        """
+        Query for every room free between check_in and check_out.
+
+        Overlapping bookings are excluded with a correlated NOT EXISTS
+        (anti-join), so the whole search is a single round-trip no matter
+        how many rooms match.
+        """
+        from app.models.bookings import Booking
+
+        overlapping = db.session.query(Booking.id).filter(
+            Booking.room_id == cls.id,
+            Booking.status.in_(Booking.ACTIVE_STATUSES),
+            Booking.check_in_date < check_out,
+            Booking.check_out_date > check_in
+        )
+
+        query = cls.query.filter(cls.status != 'maintenance', ~overlapping.exists())
+        query = cls.apply_filters(query, room_type=room_type, min_price=min_price,
+                                  max_price=max_price, guests=guests or 1, amenities=amenities)
+
+        return query.order_by(cls.price_per_night, cls.id)
+
+    @classmethod
+    def keyset_page(cls, query, sort='recommended', after=None, per_page=12):
+        """
+        Fetch one page of rooms ordered by `sort`, using keyset (seek)
+        pagination: `after` is the (sort value, id) of the last room on the
+        previous page, so every page is an index range scan rather than an
+        OFFSET that walks all earlier rows.
+
+        Returns (rooms, next_key) - next_key is None on the last page.
+        """
+        column_name, descending = cls.SORT_OPTIONS.get(sort, cls.SORT_OPTIONS['recommended'])
+        column = getattr(cls, column_name)
+        position = db.tuple_(column, cls.id)
+
+        query = query.order_by(None)
+        if after is not None:
+            query = query.filter(position < tuple(after) if descending else position > tuple(after))
+        if descending:
+            query = query.order_by(column.desc(), cls.id.desc())
+        else:
+            query = query.order_by(column.asc(), cls.id.asc())
+
+        rooms = query.limit(per_page + 1).all()
+        next_key = None
+        if len(rooms) > per_page:
+            rooms = rooms[:per_page]
+            last = rooms[-1]
+            next_key = (getattr(last, column_name), last.id)
+        return rooms, next_key
+
     # Rating
     def update_rating(self):
+        """Recompute the average from the stored aggregate (no reviews are loaded)"""
         try:
-            from app.models.review import Review
-            reviews = self.reviews.all()
-            if reviews:
-                total = sum(r.rating for r in reviews)
-                self.rating = round(total / len(reviews), 1)
+            if self.rating_count:
+                self.rating = round(self.rating_sum / self.rating_count, 1)
             else:
                 self.rating = 0.0
         except Exception as e:
             self.rating = 0.0
 
+    def get_rating_histogram(self):
+        return {star: getattr(self, f'rating_{star}') or 0 for star in RATING_STARS}
+
+    @staticmethod
+    def _average_expr(total, count):
+        """SQL average rounded to 1 decimal (the * 1.0 avoids integer division)"""
+        return db.case(
+            (count > 0, db.cast(db.func.round(total * 1.0 / count, 1), db.Float)),
+            else_=0.0
+        )
+
+    @classmethod
+    def rating_change_values(cls, star, sign):
+        """
+        SET values that add (sign=1) or remove (sign=-1) one review of
+        `star` from a room's aggregate. Every expression reads the row's
+        current values, so concurrent reviews never lose an update.
+        """
+        columns = cls.__table__.c
+        new_sum = columns.rating_sum + sign * star
+        new_count = columns.rating_count + sign
+        values = {
+            'rating_sum': new_sum,
+            'rating_count': new_count,
+            'rating': cls._average_expr(new_sum, new_count)
+        }
+        if star in RATING_STARS:
+            values[f'rating_{star}'] = columns[f'rating_{star}'] + sign
+        return values
+
+    @classmethod
+    def _review_aggregates(cls):
+        """Per-room aggregate columns computed from the reviews table"""
+        from app.models.review import Review
+        aggregates = [
+            db.func.coalesce(db.func.sum(Review.rating), 0).label('rating_sum'),
+            db.func.count(Review.id).label('rating_count')
+        ]
+        for star in RATING_STARS:
+            aggregates.append(
+                db.func.coalesce(db.func.sum(db.case((Review.rating == star, 1), else_=0)), 0)
+                .label(f'rating_{star}')
+            )
+        return aggregates
+
+    @classmethod
+    def _room_id_batches(cls, batch_size):
+        """Yield (first_id, last_id) ranges covering all rooms, batch_size rooms each"""
+        last_id = 0
+        while True:
+            ids = db.session.execute(
+                db.select(cls.id).where(cls.id > last_id).order_by(cls.id).limit(batch_size)
+            ).scalars().all()
+            if not ids:
+                return
+            yield ids[0], ids[-1]
+            last_id = ids[-1]
+
+    @classmethod
+    def rebuild_rating_aggregates(cls, batch_size=1000):
+        """
+        Recompute every room's rating aggregate from the reviews table.
+        Works in room id batches, committing each one, so it never holds
+        long locks. Returns the number of rooms processed.
+        """
+        from app.models.review import Review
+        columns = cls.__table__.c
+        processed = 0
+
+        for first_id, last_id in cls._room_id_batches(batch_size):
+            values = {
+                aggregate.name: (
+                    db.select(aggregate.element)
+                    .where(Review.room_id == columns.id)
+                    .scalar_subquery()
+                )
+                for aggregate in cls._review_aggregates()
+            }
+            in_batch = columns.id.between(first_id, last_id)
+            result = db.session.execute(db.update(cls.__table__).where(in_batch).values(**values))
+            db.session.execute(
+                db.update(cls.__table__).where(in_batch)
+                .values(rating=cls._average_expr(columns.rating_sum, columns.rating_count))
+            )
+            db.session.commit()
+            processed += result.rowcount
+        return processed
+
+    @classmethod
+    def find_rating_mismatches(cls, batch_size=1000):
+        """
+        Compare each room's stored aggregate, including the average `rating`
+        that listings sort and filter on, with the reviews table.
+        Returns a list of {'room_id', 'stored', 'actual'} dicts for rooms
+        that disagree.
+        """
+        from app.models.review import Review
+        fields = ['rating_sum', 'rating_count'] + [f'rating_{star}' for star in RATING_STARS]
+        columns = cls.__table__.c
+        mismatches = []
+
+        for first_id, last_id in cls._room_id_batches(batch_size):
+            actual = (
+                db.select(Review.room_id, *cls._review_aggregates())
+                .where(Review.room_id.between(first_id, last_id))
+                .group_by(Review.room_id)
+                .subquery()
+            )
+            rows = db.session.execute(
+                db.select(columns.id, columns.rating, *[columns[f] for f in fields],
+                          *[db.func.coalesce(actual.c[f], 0).label(f'actual_{f}') for f in fields])
+                .outerjoin(actual, actual.c.room_id == columns.id)
+                .where(columns.id.between(first_id, last_id))
+            ).mappings()
+
+            for row in rows:
+                stored = {f: row[f] for f in fields}
+                computed = {f: row[f'actual_{f}'] for f in fields}
+                count = computed['rating_count']
+                average = computed['rating_sum'] / count if count else 0.0
+                stored['rating'] = row['rating']
+                computed['rating'] = round(average, 1)
+                # Any 1-decimal rounding of the true average is within 0.05 of it
+                # (SQL rounds halves up, Python to even)
+                rating_drift = abs((row['rating'] or 0.0) - average) > RATING_TOLERANCE
+                if rating_drift or any(stored[f] != computed[f] for f in fields):
+                    mismatches.append({'room_id': row['id'], 'stored': stored, 'actual': computed})
+        return mismatches
+
+    # Serialization
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'name': self.name,
+            'room_type': self.room_type,
+            'description': self.description,
+            'price_per_night': self.price_per_night,
+            'max_guests': self.max_guests,
+            'room_size': self.room_size,
+            'amenities': self.get_amenities_list(),
+            'image': self.image,
+            'status': self.status,
+            'rating': self.rating,
+            'rating_count': self.rating_count
+        }
+
     # Represenation 
     def __repr__(self):
         return f'<Room {self.name} ({self.room_type})>'
\ No newline at end of file
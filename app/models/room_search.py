@@ -0,0 +1,135 @@
+"""
+Full-text room search.
+
+Postgres: a generated, weighted `rooms.search_vector` tsvector column
+with a GIN index. SQLite (tests, local dev): an external-content FTS5
+table `rooms_fts` kept in step by triggers. Both are maintained per row
+as rooms are inserted or updated, so the index never needs a full rebuild.
+"""
+import re
+from sqlalchemy import event, inspect
+from app.extensions import db
+from app.models.room import Room
+
+SEARCH_CONFIG = 'english'
+
+POSTGRES_DDL = [
+    f"""ALTER TABLE rooms ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(search_document, '')), 'B')
+    ) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_rooms_search_vector ON rooms USING gin (search_vector)",
+]
+
+SQLITE_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS rooms_fts USING fts5(
+        name, search_document, content='rooms', content_rowid='id', tokenize='porter unicode61'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS rooms_fts_ai AFTER INSERT ON rooms BEGIN
+        INSERT INTO rooms_fts(rowid, name, search_document) VALUES (new.id, new.name, new.search_document);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS rooms_fts_ad AFTER DELETE ON rooms BEGIN
+        INSERT INTO rooms_fts(rooms_fts, rowid, name, search_document)
+        VALUES ('delete', old.id, old.name, old.search_document);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS rooms_fts_au AFTER UPDATE OF name, search_document ON rooms BEGIN
+        INSERT INTO rooms_fts(rooms_fts, rowid, name, search_document)
+        VALUES ('delete', old.id, old.name, old.search_document);
+        INSERT INTO rooms_fts(rowid, name, search_document) VALUES (new.id, new.name, new.search_document);
+    END""",
+]
+
+# bm25 column weights for (name, search_document)
+SQLITE_WEIGHTS = (10.0, 1.0)
+
+# Created by the DDL above rather than declared on the models
+SEARCH_TABLE = 'rooms_fts'  # plus FTS5's rooms_fts_* shadow tables
+SEARCH_COLUMN = 'search_vector'
+SEARCH_INDEX = 'ix_rooms_search_vector'
+
+
+def install_search_index(connection):
+    """Create the dialect's full-text index objects for the rooms table"""
+    dialect = connection.dialect.name
+    statements = POSTGRES_DDL if dialect == 'postgresql' else SQLITE_DDL if dialect == 'sqlite' else []
+    for statement in statements:
+        connection.exec_driver_sql(statement)
+
+
+def is_search_index_object(name, type_):
+    """True for schema objects owned by the search DDL (autogenerate must leave them alone)"""
+    if type_ == 'table':
+        return name == SEARCH_TABLE or name.startswith(f'{SEARCH_TABLE}_')
+    if type_ == 'column':
+        return name == SEARCH_COLUMN
+    if type_ == 'index':
+        return name == SEARCH_INDEX
+    return False
+
+
+def rebuild_search_index():
+    """Recompute every room's search_document (e.g. after an amenity rename) and reindex"""
+    for room in Room.query.yield_per(500):
+        room.search_document = room.build_search_document()
+    db.session.commit()
+    if db.engine.dialect.name == 'sqlite':
+        db.session.execute(db.text("INSERT INTO rooms_fts(rooms_fts) VALUES ('rebuild')"))
+        db.session.commit()
+
+
+def _fts5_query(text):
+    """Turn free text into a safe FTS5 query: every word must match (as a prefix)"""
+    words = re.findall(r'\w+', text.lower())
+    return ' '.join(f'"{word}"*' for word in words)
+
+
+def search_rooms(text, query=None):
+    """
+    Rank rooms matching free `text`, best first.
+
+    `query` is an optional Room query to search within (for example
+    Room.search_available(...)) so text and date filters combine in one
+    statement. Returns a query of (Room, score) rows.
+    """
+    query = (query if query is not None else Room.query).order_by(None)
+    dialect = db.engine.dialect.name
+
+    if dialect == 'postgresql':
+        vector = db.literal_column('rooms.search_vector')
+        ts_query = db.func.websearch_to_tsquery(SEARCH_CONFIG, text)
+        score = db.func.ts_rank_cd(vector, ts_query)
+        return (query.filter(vector.op('@@')(ts_query))
+                .add_columns(score.label('score'))
+                .order_by(score.desc(), Room.id))
+    if dialect != 'sqlite':
+        raise NotImplementedError(f"Full-text room search is not supported on {dialect}")
+
+    match = _fts5_query(text)
+    if not match:
+        return query.filter(db.false()).add_columns(db.literal(0.0).label('score'))
+
+    fts = db.table('rooms_fts', db.column('rowid'))
+    # bm25() is lower-is-better; negate so a higher score is a better match
+    score = -db.func.bm25(db.literal_column('rooms_fts'), *SQLITE_WEIGHTS)
+    return (query.join(fts, fts.c.rowid == Room.id)
+            .filter(db.literal_column('rooms_fts').op('MATCH')(match))
+            .add_columns(score.label('score'))
+            .order_by(score.desc(), Room.id))
+
+
+@event.listens_for(Room.__table__, 'after_create')
+def _create_search_index(table, connection, **kwargs):
+    install_search_index(connection)
+
+
+@event.listens_for(db.session, 'before_flush')
+def _refresh_search_documents(session, flush_context, instances):
+    """Recompute search_document for rooms whose searchable fields changed"""
+    for obj in list(session.new) + list(session.dirty):
+        if not isinstance(obj, Room):
+            continue
+        state = inspect(obj)
+        if obj in session.new or any(
+            state.attrs[name].history.has_changes() for name in ('description', 'amenity_mask')
+        ):
+            obj.search_document = obj.build_search_document()
@@ -0,0 +1,22 @@
+"""Small dialect-aware SQL helpers shared by the models"""
+from sqlalchemy.dialects import postgresql, sqlite
+
+
+def upsert(connection, table, rows, key_columns, update_values):
+    """
+    INSERT rows, or on a key conflict apply `update_values` to the existing
+    row. `update_values(excluded)` returns the SET mapping, where `excluded`
+    refers to the values that failed to insert. Postgres and SQLite only.
+    """
+    if not rows:
+        return
+    dialect = {'postgresql': postgresql, 'sqlite': sqlite}.get(connection.dialect.name)
+    if dialect is None:
+        raise NotImplementedError(f"upsert is not supported on {connection.dialect.name}")
+
+    statement = dialect.insert(table)
+    statement = statement.on_conflict_do_update(
+        index_elements=key_columns,
+        set_=update_values(statement.excluded)
+    )
+    connection.execute(statement, rows)
@@ -1,10 +1,15 @@
 from datetime import datetime
-from werkzeug.security import generate_password_hash, check_password_hash
 from flask_login import UserMixin
 from app.extensions import db, login_manager
+from app.services.password_hasher import hash_password, verify_password, needs_rehash
 
 class User(UserMixin, db.Model):
     __tablename__ = 'users'
+
+    # Functional index for case-insensitive username logins (find_by_login)
+    __table_args__ = (
+        db.Index('ix_users_username_lower', db.text('lower(username)')),
+    )
     
     # ID 
     id = db.Column(db.Integer, primary_key=True)
@@ -23,10 +28,6 @@ class User(UserMixin, db.Model):
     role = db.Column(db.String(10), default='user', nullable=False)
     is_active = db.Column(db.Boolean, default=True, nullable=False)
 
-    # OTP for password reset
-    otp_code = db.Column(db.String(6), nullable=True)
-    otp_expires_at = db.Column(db.DateTime, nullable=True)
-
     # Timestamp 
     create_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -39,45 +40,50 @@ class User(UserMixin, db.Model):
 
     def set_password(self, password):
         try:
-            self.password_hash = generate_password_hash(password)
+            self.password_hash = hash_password(password)
         except Exception as e:
             raise ValueError(f"Error setting password{str(e)}")
     
     def check_password(self, password):
         try:
-            return check_password_hash(self.password_hash, password)
+            return verify_password(self.password_hash, password)
         except Exception as e:
             return False
+
+    def password_needs_rehash(self):
+        return needs_rehash(self.password_hash)
     
     def is_admin(self):
         return self.role == 'admin'
+
+    # -- Lookup --
+    @classmethod
+    def find_by_login(cls, identifier):
+        """
+        Resolve a login identifier with one indexed equality lookup:
+        an '@' means email (stored lowercase), otherwise username,
+        matched case-insensitively via the lower(username) index.
+        """
+        identifier = (identifier or '').strip()
+        if not identifier:
+            return None
+        if '@' in identifier:
+            return cls.query.filter(cls.email == identifier.lower()).first()
+        # Legacy usernames may differ only by case: prefer the exact match
+        return cls.query.filter(db.func.lower(cls.username) == identifier.lower()).order_by(
+            (cls.username == identifier).desc(), cls.id
+        ).first()
+
+    @classmethod
+    def username_taken(cls, username):
+        """Case-insensitive check, so 'Alice' can't register next to 'alice'"""
+        return db.session.query(
+            cls.query.filter(db.func.lower(cls.username) == username.lower()).exists()
+        ).scalar()
     
     def is_blocked(self):
         return not self.is_active
     
-    # -- OTP Methods -- 
-    def set_otp(self, otp_code):
-        try:
-            from datetime import timedelta
-            self.otp_code = otp_code
-            self.otp_expires_at = datetime.utcnow() + timedelta(minutes=10)
-        except Exception as e: 
-            raise ValueError(f"Error setting OTP: {str(e)}")
-    
-    def verify_otp(self, otp_code):
-        try:
-            if self.otp_code is None or self.otp_expires_at is None:
-                return False
-            if datetime.utcnow() > self.otp_expires_at:
-                return False
-            return self.otp_code == otp_code
-        except Exception as e:
-            return False
-        
-    def clear_otp(self):
-        self.otp_code = None
-        self.otp_expires_at = None
-    
     # -- Profile Methods -- 
     def get_full_name(self):
         if self.last_name:
@@ -97,4 +103,5 @@ class User(UserMixin, db.Model):
 
     # -- Representation --
     def __repr__(self):
-        return f'<User {self.username}>'
\ No newline at end of file
+        return f'<User {self.username}>'
+
@@ -0,0 +1 @@
+# Application services - multi-model operations that don't belong on a single model
@@ -0,0 +1,99 @@
+import gzip
+import hashlib
+import json
+import os
+from flask import current_app, url_for
+
+try:
+    import brotli
+except ImportError:  # optional: .br files are skipped without it
+    brotli = None
+
+# Front-end assets are written under static/src and built (`flask assets
+# build`) into static/dist as content-hashed copies, e.g. js/base.js ->
+# js/base.3f9a1c0b7d2e.js, each with .gz and .br siblings. The hash changes
+# whenever the content does, so /assets/ responses can be cached forever.
+# Old builds are kept so pages rendered by not-yet-restarted workers still
+# resolve during a rolling deploy.
+
+SOURCE_DIR = 'src'
+BUILD_DIR = 'dist'
+MANIFEST = 'manifest.json'
+COMPRESSIBLE = ('.js', '.css', '.svg', '.json', '.txt')
+
+
+def _fingerprint(path, content):
+    base, ext = os.path.splitext(path)
+    return f"{base}.{hashlib.sha256(content).hexdigest()[:12]}{ext}"
+
+
+def _write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(content)
+
+
+def build_assets(static_folder):
+    """
+    Fingerprint and precompress everything under <static>/src into
+    <static>/dist and write the manifest. Returns
+    {'files', 'bytes', 'gzip_bytes', 'brotli_bytes'}.
+    """
+    source_root = os.path.join(static_folder, SOURCE_DIR)
+    build_root = os.path.join(static_folder, BUILD_DIR)
+    manifest = {}
+    stats = {'files': 0, 'bytes': 0, 'gzip_bytes': 0, 'brotli_bytes': 0}
+
+    for folder, _, files in os.walk(source_root):
+        for name in sorted(files):
+            source = os.path.join(folder, name)
+            logical = os.path.relpath(source, source_root).replace(os.sep, '/')
+            with open(source, 'rb') as f:
+                content = f.read()
+
+            built = _fingerprint(logical, content)
+            target = os.path.join(build_root, built)
+            _write(target, content)
+            stats['files'] += 1
+            stats['bytes'] += len(content)
+
+            if name.endswith(COMPRESSIBLE):
+                # mtime=0 keeps the .gz byte-identical between builds
+                gzipped = gzip.compress(content, compresslevel=9, mtime=0)
+                _write(target + '.gz', gzipped)
+                stats['gzip_bytes'] += len(gzipped)
+                if brotli is not None:
+                    compressed = brotli.compress(content, quality=11)
+                    _write(target + '.br', compressed)
+                    stats['brotli_bytes'] += len(compressed)
+            manifest[logical] = built
+
+    _write(os.path.join(build_root, MANIFEST), json.dumps(manifest, indent=2, sort_keys=True).encode())
+    return stats
+
+
+def load_manifest(app):
+    path = os.path.join(app.static_folder, BUILD_DIR, MANIFEST)
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def init_assets(app):
+    app.extensions['asset_manifest'] = load_manifest(app)
+    app.jinja_env.globals['asset_url'] = asset_url
+
+
+def asset_url(path):
+    """
+    URL of an asset by its source path ('js/base.js'): the fingerprinted
+    build when there is one, else the unbuilt source (development).
+    """
+    app = current_app
+    manifest = load_manifest(app) if app.debug else app.extensions.get('asset_manifest', {})
+    built = manifest.get(path)
+    if built is None:
+        return url_for('static', filename=f'{SOURCE_DIR}/{path}')
+    return url_for('assets.serve', filename=built)
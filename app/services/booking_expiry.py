@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta
+from flask import current_app
+from app.extensions import db
+from app.models.bookings import Booking, BookingChange, dispatch_status_changes
+
+
+def _expire_batch(cutoff, batch_size):
+    """Expire up to batch_size of the oldest stale pending bookings in one short transaction"""
+    table = Booking.__table__
+    stale = (
+        db.select(table.c.id)
+        .where(table.c.status == 'pending', table.c.created_at < cutoff)
+        .order_by(table.c.created_at, table.c.id)
+        .limit(batch_size)
+    )
+    connection = db.session.connection()
+    expired = connection.execute(
+        db.update(table)
+        .where(table.c.id.in_(stale.scalar_subquery()), table.c.status == 'pending')
+        .values(status='expired', updated_at=datetime.utcnow())
+        .returning(table.c.id, table.c.room_id, table.c.check_in_date,
+                   table.c.check_out_date, table.c.total_price)
+    ).all()
+
+    # Set-based UPDATE bypasses the mapper events - release nights directly
+    dispatch_status_changes(connection, [
+        BookingChange(row.id, row.room_id, row.check_in_date, row.check_out_date,
+                      row.total_price, 'pending', 'expired')
+        for row in expired
+    ])
+    db.session.commit()
+    return len(expired)
+
+
+def expire_stale_bookings(ttl=None, batch_size=None, max_batches=None, now=None):
+    """
+    Mark pending bookings older than `ttl` seconds as 'expired', releasing
+    their nights. Works in batches of `batch_size` rows, committing after
+    each, so locks are only held for one small UPDATE at a time.
+    Returns {'expired': rows, 'batches': transactions, 'seconds': elapsed}.
+    """
+    config = current_app.config
+    ttl = ttl if ttl is not None else config['PENDING_BOOKING_TTL']
+    batch_size = batch_size or config['BOOKING_EXPIRY_BATCH_SIZE']
+    cutoff = (now or datetime.utcnow()) - timedelta(seconds=ttl)
+
+    started = datetime.utcnow()
+    result = {'expired': 0, 'batches': 0, 'seconds': 0.0}
+    try:
+        while max_batches is None or result['batches'] < max_batches:
+            count = _expire_batch(cutoff, batch_size)
+            if count:
+                result['batches'] += 1
+                result['expired'] += count
+            if count < batch_size:
+                break
+    except Exception as e:
+        db.session.rollback()
+        print(f"Error expiring pending bookings: {str(e)}")
+        raise
+    finally:
+        result['seconds'] = round((datetime.utcnow() - started).total_seconds(), 3)
+    return result
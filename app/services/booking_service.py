@@ -0,0 +1,211 @@
+from datetime import datetime
+from sqlalchemy.exc import IntegrityError, OperationalError
+from app.extensions import db
+from app.models.room import Room
+from app.models.bookings import Booking, BookingChange, dispatch_status_changes
+
+CONFLICT_MESSAGE = "This room is no longer available for the selected dates"
+BUSY_MESSAGE = "The booking service is busy. Please try again."
+ERROR_MESSAGE = "Could not create the booking. Please try again."
+OVERLAP_CONSTRAINT = 'bookings_no_overlap'
+
+# create_booking error codes (the controller maps them to HTTP statuses)
+ERROR_INVALID = 'invalid'
+ERROR_NOT_FOUND = 'not_found'
+ERROR_CONFLICT = 'conflict'
+ERROR_BUSY = 'busy'
+ERROR_INTERNAL = 'internal'
+
+# Same transitions and messages as Booking.approve() / Booking.reject()
+MODERATION_ACTIONS = {
+    'approve': ('confirmed', "Booking approved successfully", "Only pending bookings can be approved"),
+    'reject': ('rejected', "Booking rejected", "Only pending bookings can be rejected")
+}
+MAX_MODERATION_BATCH = 5000
+MODERATION_ERROR_MESSAGE = "Could not update the bookings. Please try again."
+
+
+def _begin_write(room_id):
+    """
+    Take the write lock for this booking before checking availability.
+
+    Postgres: lock only this room's row, so bookings for different rooms
+    proceed in parallel while same-room requests queue up.
+    SQLite: BEGIN IMMEDIATE takes the (single) writer lock up front instead
+    of upgrading a read lock mid-transaction, which avoids lock-upgrade
+    deadlocks between concurrent writers.
+    """
+    connection = db.session.connection()
+    if connection.dialect.name == 'postgresql':
+        connection.execute(db.select(Room.id).where(Room.id == room_id).with_for_update())
+    elif connection.dialect.name == 'sqlite':
+        driver_connection = connection.connection.driver_connection
+        if not driver_connection.in_transaction:
+            connection.exec_driver_sql('BEGIN IMMEDIATE')
+    return connection
+
+
+def _insert_if_free(connection, values):
+    """
+    INSERT ... SELECT ... WHERE NOT EXISTS (overlapping active booking).
+    The availability check and the insert are one statement, run while
+    holding the lock from _begin_write. Returns the new id, or None.
+    """
+    overlapping = db.select(Booking.id).where(
+        Booking.room_id == values['room_id'],
+        Booking.status.in_(Booking.ACTIVE_STATUSES),
+        Booking.check_in_date < values['check_out_date'],
+        Booking.check_out_date > values['check_in_date']
+    )
+    columns = list(values)
+    source = db.select(*[
+        db.literal(value, Booking.__table__.c[name].type) for name, value in values.items()
+    ]).where(~overlapping.exists())
+
+    statement = db.insert(Booking).from_select(columns, source).returning(Booking.id)
+    return connection.execute(statement).scalar()
+
+
+def _is_overlap_violation(error):
+    """True if an IntegrityError came from the bookings_no_overlap constraint"""
+    diag = getattr(error.orig, 'diag', None)
+    constraint = getattr(diag, 'constraint_name', None)
+    if constraint is not None:
+        return constraint == OVERLAP_CONSTRAINT
+    return OVERLAP_CONSTRAINT in str(error.orig)
+
+
+def create_booking(user_id, room_id, check_in, check_out, guests_count=1):
+    """
+    Create a pending booking, guaranteeing it does not overlap another
+    pending/confirmed booking for the same room, even under concurrency.
+    Returns (success, message, booking, error), where error is one of the
+    ERROR_* codes (None on success).
+    """
+    try:
+        room = db.session.get(Room, room_id)
+        if not room:
+            return False, "Room not found", None, ERROR_NOT_FOUND
+        if room.is_under_maintenance():
+            return False, "This room is not available for booking", None, ERROR_INVALID
+        if guests_count < 1 or guests_count > room.max_guests:
+            return False, f"This room accommodates 1-{room.max_guests} guests", None, ERROR_INVALID
+
+        booking = Booking(
+            user_id=user_id,
+            room_id=room_id,
+            check_in_date=check_in,
+            check_out_date=check_out,
+            guests_count=guests_count
+        )
+        is_valid, message = booking.validate_dates()
+        if not is_valid:
+            return False, message, None, ERROR_INVALID
+        booking.calculate_total_price(room.price_per_night)
+
+        now = datetime.utcnow()
+        values = {
+            'user_id': user_id,
+            'room_id': room_id,
+            'check_in_date': check_in,
+            'check_out_date': check_out,
+            'guests_count': guests_count,
+            'total_price': booking.total_price,
+            'status': 'pending',
+            'created_at': now,
+            'updated_at': now
+        }
+
+        # Release any snapshot/read transaction left by the lookups above
+        db.session.rollback()
+        connection = _begin_write(room_id)
+        booking_id = _insert_if_free(connection, values)
+        if booking_id is None:
+            db.session.rollback()
+            return False, CONFLICT_MESSAGE, None, ERROR_CONFLICT
+
+        # Core INSERT bypasses the mapper events - notify derived data directly
+        dispatch_status_changes(connection, [BookingChange(
+            booking_id, room_id, check_in, check_out, values['total_price'], None, 'pending'
+        )])
+        db.session.commit()
+        return True, "Booking request submitted", db.session.get(Booking, booking_id), None
+
+    except IntegrityError as e:
+        db.session.rollback()
+        if _is_overlap_violation(e):
+            # Postgres exclusion constraint backstop
+            return False, CONFLICT_MESSAGE, None, ERROR_CONFLICT
+        print(f"Error creating booking: {str(e)}")
+        return False, ERROR_MESSAGE, None, ERROR_INTERNAL
+    except OperationalError as e:
+        db.session.rollback()
+        print(f"Booking write contention: {str(e)}")
+        return False, BUSY_MESSAGE, None, ERROR_BUSY
+    except Exception as e:
+        db.session.rollback()
+        print(f"Error creating booking: {str(e)}")
+        return False, ERROR_MESSAGE, None, ERROR_INTERNAL
+
+
+def moderate_bookings(booking_ids, action, reason=None):
+    """
+    Approve or reject many pending bookings with one
+    UPDATE ... WHERE id IN (...) AND status = 'pending' RETURNING ...
+    Returns (success, message, results, error) with one result per
+    requested id; error is ERROR_INVALID or ERROR_INTERNAL on failure.
+    """
+    if action not in MODERATION_ACTIONS:
+        return False, "Action must be 'approve' or 'reject'", [], ERROR_INVALID
+    booking_ids = list(dict.fromkeys(booking_ids))  # de-duplicate, keep order
+    if not booking_ids:
+        return False, "No bookings selected", [], ERROR_INVALID
+    if len(booking_ids) > MAX_MODERATION_BATCH:
+        return False, f"At most {MAX_MODERATION_BATCH} bookings can be moderated at once", [], ERROR_INVALID
+
+    new_status, done_message, skipped_message = MODERATION_ACTIONS[action]
+    values = {'status': new_status, 'updated_at': datetime.utcnow()}
+    if action == 'reject':
+        values['rejection_reason'] = reason
+
+    table = Booking.__table__
+    try:
+        connection = db.session.connection()
+        updated = connection.execute(
+            db.update(table)
+            .where(table.c.id.in_(booking_ids), table.c.status == 'pending')
+            .values(**values)
+            .returning(table.c.id, table.c.room_id, table.c.check_in_date,
+                       table.c.check_out_date, table.c.total_price)
+        ).all()
+
+        # Set-based UPDATE bypasses the mapper events - notify derived data directly
+        dispatch_status_changes(connection, [
+            BookingChange(row.id, row.room_id, row.check_in_date, row.check_out_date,
+                          row.total_price, 'pending', new_status)
+            for row in updated
+        ])
+
+        # Explain the ids that were not updated (missing or not pending)
+        updated_ids = {row.id for row in updated}
+        remaining = [booking_id for booking_id in booking_ids if booking_id not in updated_ids]
+        current = dict(connection.execute(
+            db.select(table.c.id, table.c.status).where(table.c.id.in_(remaining))
+        ).all()) if remaining else {}
+        db.session.commit()
+
+    except Exception as e:
+        db.session.rollback()
+        print(f"Error moderating bookings: {str(e)}")
+        return False, MODERATION_ERROR_MESSAGE, [], ERROR_INTERNAL
+
+    results = []
+    for booking_id in booking_ids:
+        if booking_id in updated_ids:
+            results.append({'id': booking_id, 'success': True, 'status': new_status, 'message': done_message})
+        elif booking_id in current:
+            results.append({'id': booking_id, 'success': False, 'status': current[booking_id], 'message': skipped_message})
+        else:
+            results.append({'id': booking_id, 'success': False, 'status': None, 'message': "Booking not found"})
+
+    return True, f"{len(updated_ids)} of {len(booking_ids)} bookings updated", results, None
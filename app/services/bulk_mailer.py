@@ -0,0 +1,175 @@
+import queue
+import smtplib
+import threading
+import time
+from flask import current_app
+from app.extensions import mail
+
+
+class RateLimiter:
+    """Token bucket shared by the sending threads (rate=None means unlimited)"""
+
+    def __init__(self, rate=None, burst=None):
+        self.rate = rate
+        self.capacity = burst or max(1.0, rate or 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if not self.rate:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class _PooledConnection:
+    """One long-lived SMTP session (flask_mail Connection) with reconnect"""
+
+    def __init__(self, stats, lock):
+        self.connection = None
+        self.stats = stats
+        self.lock = lock
+
+    def open(self):
+        self.close()
+        self.connection = mail.connect().__enter__()
+        with self.lock:
+            self.stats['connections'] += 1
+
+    def close(self):
+        if self.connection is not None and self.connection.host is not None:
+            try:
+                self.connection.host.quit()
+            except (smtplib.SMTPException, OSError):
+                self.connection.host.close()
+        self.connection = None
+
+    def send(self, message):
+        if self.connection is None:
+            self.open()
+        self.connection.send(message)
+
+
+def _failure_action(error):
+    """'retry' (same session), 'reconnect' (new session, then retry) or 'fail'"""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return 'fail'
+    if isinstance(error, smtplib.SMTPConnectError) or getattr(error, 'smtp_code', None) == 421:
+        return 'reconnect'  # could not connect / server closing the session
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 'retry' if 400 <= error.smtp_code < 500 else 'fail'
+    if isinstance(error, (smtplib.SMTPServerDisconnected, OSError)):
+        return 'reconnect'  # dropped connection, timeouts, refused TCP connect
+    return 'fail'
+
+
+class BulkMailer:
+    """
+    Send large numbers of messages over a small pool of long-lived SMTP
+    connections instead of one connection per mail.send().
+
+    Messages are queued in batches; each of `connections` threads takes a
+    batch and sends it on its own session. A shared token bucket caps the
+    overall rate. Dropped connections are re-opened (with backoff) and the
+    message retried; 4xx replies are retried, 5xx/refused recipients fail.
+    """
+
+    def __init__(self, connections=None, batch_size=None, rate_limit=None, max_retries=None,
+                 retry_delay=None):
+        config = current_app.config
+        self.app = current_app._get_current_object()
+        self.connections = connections or config['MAIL_BULK_CONNECTIONS']
+        self.batch_size = batch_size or config['MAIL_BULK_BATCH_SIZE']
+        self.rate_limit = rate_limit if rate_limit is not None else config['MAIL_BULK_RATE_LIMIT']
+        self.max_retries = max_retries if max_retries is not None else config['MAIL_BULK_MAX_RETRIES']
+        self.retry_delay = retry_delay if retry_delay is not None else config['MAIL_BULK_RETRY_DELAY']
+
+    def _send_one(self, connection, message, stats, lock, limiter):
+        for attempt in range(self.max_retries + 1):
+            limiter.acquire()
+            try:
+                connection.send(message)
+                return None
+            except Exception as e:
+                action = _failure_action(e)
+                if action == 'fail' or attempt == self.max_retries:
+                    return e
+                with lock:
+                    stats['retries'] += 1
+                if action == 'reconnect':
+                    connection.close()
+                    with lock:
+                        stats['reconnects'] += 1
+                time.sleep(self.retry_delay * 2 ** attempt)
+
+    def _worker(self, batches, stats, failures, lock, limiter):
+        with self.app.app_context():
+            connection = _PooledConnection(stats, lock)
+            try:
+                while True:
+                    batch = batches.get()
+                    if batch is None:
+                        return
+                    for message in batch:
+                        error = self._send_one(connection, message, stats, lock, limiter)
+                        with lock:
+                            if error is None:
+                                stats['sent'] += 1
+                            else:
+                                stats['failed'] += 1
+                                failures.append((message.recipients, f"{type(error).__name__}: {error}"))
+                    with lock:
+                        stats['batches'] += 1
+            finally:
+                connection.close()
+
+    def send(self, messages):
+        """
+        Send an iterable of flask_mail Messages. Blocks until done.
+        Returns throughput stats: sent, failed, batches, connections,
+        reconnects, retries, seconds, messages_per_second, failures.
+        """
+        # Bounded: messages can be a generator over tens of thousands of rows
+        batches = queue.Queue(maxsize=self.connections * 2)
+        stats = {'sent': 0, 'failed': 0, 'batches': 0, 'connections': 0, 'reconnects': 0, 'retries': 0}
+        failures = []
+        lock = threading.Lock()
+        limiter = RateLimiter(self.rate_limit)
+
+        started = time.perf_counter()
+        threads = [
+            threading.Thread(target=self._worker, args=(batches, stats, failures, lock, limiter),
+                             name=f'bulk-mail-{number}', daemon=True)
+            for number in range(self.connections)
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            batch = []
+            for message in messages:
+                batch.append(message)
+                if len(batch) == self.batch_size:
+                    batches.put(batch)
+                    batch = []
+            if batch:
+                batches.put(batch)
+        finally:
+            for _ in threads:
+                batches.put(None)
+            for thread in threads:
+                thread.join()
+
+        stats['seconds'] = round(time.perf_counter() - started, 3)
+        stats['messages_per_second'] = round(stats['sent'] / stats['seconds'], 1) if stats['seconds'] else 0.0
+        stats['failures'] = failures
+        return stats
@@ -0,0 +1,108 @@
+import zlib
+from flask import current_app, request
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only without it
+    brotli = None
+
+# Response compression (after_request). Bodies are compressed for clients
+# that accept it, except tiny ones, non-text types and responses that are
+# already encoded (precompressed /assets/ files) or passed through (files).
+# Streamed and large bodies are compressed chunk by chunk as they are sent.
+# Cached pages keep their compressed bytes (see page_cache._respond), so
+# repeated hits don't compress again.
+
+COMPRESSIBLE_MIMETYPES = frozenset({
+    'text/html', 'text/plain', 'text/css', 'text/csv', 'text/xml', 'text/javascript',
+    'application/json', 'application/javascript', 'application/xml', 'image/svg+xml'
+})
+
+
+def negotiate_encoding():
+    """'br', 'gzip' or None for the current request's Accept-Encoding"""
+    if not current_app.config['COMPRESS_ENABLED']:
+        return None
+    accepted = request.accept_encodings
+    if brotli is not None and accepted['br'] and accepted['br'] >= accepted['gzip']:
+        return 'br'
+    if accepted['gzip']:
+        return 'gzip'
+    return None
+
+
+class _Compressor:
+    """Incremental br/gzip encoder with the configured levels"""
+
+    def __init__(self, encoding):
+        config = current_app.config
+        if encoding == 'br':
+            self._encoder = brotli.Compressor(quality=config['COMPRESS_BROTLI_QUALITY'])
+            self._process, self._finish = self._encoder.process, self._encoder.finish
+        else:
+            self._encoder = zlib.compressobj(config['COMPRESS_GZIP_LEVEL'], zlib.DEFLATED, 31)
+            self._process, self._finish = self._encoder.compress, self._encoder.flush
+
+    def compress(self, data):
+        return self._process(data)
+
+    def finish(self):
+        return self._finish()
+
+
+def compress_bytes(data, encoding):
+    compressor = _Compressor(encoding)
+    return compressor.compress(data) + compressor.finish()
+
+
+def _compress_stream(chunks, compressor, chunk_size=64 * 1024):
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        for start in range(0, len(chunk), chunk_size):
+            out = compressor.compress(chunk[start:start + chunk_size])
+            if out:
+                yield out
+    yield compressor.finish()
+
+
+def _should_compress(response):
+    if response.status_code < 200 or response.status_code in (204, 206, 304):
+        return False
+    if response.direct_passthrough or 'Content-Encoding' in response.headers:
+        return False
+    if response.mimetype not in COMPRESSIBLE_MIMETYPES or response.cache_control.no_transform:
+        return False
+    length = response.calculate_content_length()
+    return length is None or length >= current_app.config['COMPRESS_MIN_SIZE']
+
+
+def _encoded_etag(response, encoding):
+    """A content-coding changes the bytes, so it must change a strong ETag too"""
+    etag, weak = response.get_etag()
+    if etag:
+        response.set_etag(f'{etag}-{encoding}', weak=weak)
+
+
+def compress_response(response):
+    if not _should_compress(response):
+        return response
+    response.vary.add('Accept-Encoding')
+    encoding = negotiate_encoding()
+    if encoding is None:
+        return response
+
+    length = response.calculate_content_length()
+    if length is None or length > current_app.config['COMPRESS_STREAM_THRESHOLD']:
+        # Streamed or large: compress as the body is sent, without buffering it
+        response.response = _compress_stream(response.iter_encoded(), _Compressor(encoding))
+        response.headers.pop('Content-Length', None)
+    else:
+        response.set_data(compress_bytes(response.get_data(), encoding))
+    response.headers['Content-Encoding'] = encoding
+    _encoded_etag(response, encoding)
+    return response
+
+
+def init_compression(app):
+    app.after_request(compress_response)
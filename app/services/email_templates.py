@@ -0,0 +1,90 @@
+import re
+import threading
+from flask import current_app
+
+# --- CSS Inlining ---
+# Mail clients ignore or strip <style> blocks, so rules are copied onto each
+# element's style attribute. This runs on the template *source*, once per
+# template per process, not on every rendered message. Only the selectors
+# the email templates use are supported: `tag`, `.class` and lists of them.
+
+_STYLE_BLOCK = re.compile(r'<style[^>]*>(.*?)</style>\s*', re.S | re.I)
+_CSS_RULE = re.compile(r'([^{}]+)\{([^}]*)\}')
+_START_TAG = re.compile(r'<([a-zA-Z][a-zA-Z0-9]*)((?:\s+[^<>]*?)?)(\s*/?)>')
+_CLASS_ATTR = re.compile(r'\bclass\s*=\s*"([^"]*)"')
+_STYLE_ATTR = re.compile(r'\bstyle\s*=\s*"([^"]*)"')
+
+
+def _parse_css(css):
+    """[(selector, declarations), ...] in source order, tag rules before class rules"""
+    rules = []
+    for selectors, declarations in _CSS_RULE.findall(css):
+        declarations = '; '.join(d.strip() for d in declarations.split(';') if d.strip())
+        for selector in selectors.split(','):
+            rules.append((selector.strip(), declarations))
+    return sorted(rules, key=lambda rule: rule[0].startswith('.'))  # stable: keeps source order
+
+
+def inline_css(html):
+    """Move <style> rules onto matching elements (existing style attributes win)"""
+    rules = []
+    for css in _STYLE_BLOCK.findall(html):
+        rules.extend(_parse_css(css))
+    if not rules:
+        return html
+    html = _STYLE_BLOCK.sub('', html)
+
+    def apply(match):
+        tag, attrs, close = match.groups()
+        class_attr = _CLASS_ATTR.search(attrs)
+        classes = set(class_attr.group(1).split()) if class_attr else set()
+        matched = [declarations for selector, declarations in rules
+                   if selector == tag.lower() or (selector.startswith('.') and selector[1:] in classes)]
+        if not matched:
+            return match.group(0)
+
+        existing = _STYLE_ATTR.search(attrs)
+        style = '; '.join(matched + ([existing.group(1).strip().rstrip(';')] if existing else []))
+        attrs = _CLASS_ATTR.sub('', attrs)
+        attrs = _STYLE_ATTR.sub('', attrs).rstrip()
+        return f'<{tag}{attrs} style="{style}"{close}>'
+
+    return _START_TAG.sub(apply, html)
+
+
+# --- Compiled Template Cache ---
+
+_lock = threading.Lock()
+
+
+def _compiled(app, filename):
+    """The compiled email template (CSS inlined for .html), built on first use"""
+    cache = app.extensions.setdefault('email_templates', {})
+    entry = cache.get(filename)
+    # In debug (auto_reload) pick up edits to the template file
+    if entry is None or (app.jinja_env.auto_reload and not entry[1]()):
+        with _lock:
+            env = app.jinja_env
+            source, _, uptodate = env.loader.get_source(env, f'email/{filename}')
+            if filename.endswith('.html'):
+                source = inline_css(source)
+            else:
+                # from_string() templates are autoescaped; plain text must not be
+                source = '{% autoescape false %}' + source + '{% endautoescape %}'
+            entry = cache[filename] = (env.from_string(source), uptodate or (lambda: True))
+    return entry[0]
+
+
+def clear_template_cache(app=None):
+    (app or current_app).extensions.pop('email_templates', None)
+
+
+def render_email(name, **context):
+    """
+    Render email/<name>.html (CSS inlined) and email/<name>.txt from the
+    compiled-template cache. Returns (html, text).
+    """
+    app = current_app._get_current_object()
+    html = _compiled(app, f'{name}.html').render(**context)
+    text = _compiled(app, f'{name}.txt').render(**context)
+    return html, text
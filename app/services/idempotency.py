@@ -0,0 +1,81 @@
+from functools import wraps
+from flask import request, current_app, make_response
+from flask_login import current_user
+from app.extensions import db
+from app.models.idempotency import IdempotencyKey
+
+HEADER = 'Idempotency-Key'
+MAX_KEY_LENGTH = 255
+
+
+def _scope():
+    owner = f"user:{current_user.id}" if current_user.is_authenticated else 'anonymous'
+    return f"{owner}:{request.endpoint}"
+
+
+def _error(message, status_code):
+    return {'success': False, 'message': message}, status_code
+
+
+def _release(record):
+    """Free the key after a failure; if that fails too, the processing lease frees it"""
+    try:
+        db.session.rollback()  # the view may have left the session in a failed state
+        record.release()
+    except Exception as e:
+        db.session.rollback()
+        print(f"Error releasing idempotency key: {str(e)}")
+
+
+def _replay(record):
+    response = make_response(record.response_body, record.response_code)
+    for name, value in record.get_headers().items():
+        response.headers[name] = value
+    response.headers['Idempotent-Replayed'] = 'true'
+    return response
+
+
+def idempotent(view):
+    """
+    Honour an Idempotency-Key header on a POST view.
+
+    The first request with a key runs the view and stores its response;
+    retries with the same key (and same body) get the stored response back
+    without running the view again. Requests without the header are
+    unaffected. Server errors release the key so the client can retry; a
+    request that dies without releasing it holds the key only for
+    IDEMPOTENCY_PROCESSING_LEASE seconds.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        key = request.headers.get(HEADER, '').strip()
+        if not key or request.method != 'POST':
+            return view(*args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            return _error(f'{HEADER} must be at most {MAX_KEY_LENGTH} characters.', 400)
+
+        request_hash = IdempotencyKey.fingerprint(request.method, request.path, request.get_data())
+        ttl = current_app.config.get('IDEMPOTENCY_KEY_TTL', 86400)
+        lease = current_app.config.get('IDEMPOTENCY_PROCESSING_LEASE', 60)
+        record, created = IdempotencyKey.claim(_scope(), key, request_hash, ttl, lease)
+
+        if not created:
+            if record.request_hash != request_hash:
+                return _error(f'{HEADER} was already used for a different request.', 422)
+            if record.status != 'completed':
+                return _error('A request with this key is still being processed.', 409)
+            return _replay(record)
+
+        try:
+            response = make_response(view(*args, **kwargs))
+        except Exception:
+            _release(record)
+            raise
+
+        if response.status_code >= 500:
+            _release(record)
+        else:
+            record.complete(response)
+        return response
+
+    return wrapper
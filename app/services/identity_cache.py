@@ -0,0 +1,178 @@
+import threading
+import time
+from collections import OrderedDict
+from flask import current_app, has_app_context
+from flask_login import current_user
+from sqlalchemy import event
+from app.extensions import db
+from app.models.user import User
+
+# Columns copied into the snapshot (never the password hash or OTP)
+SNAPSHOT_FIELDS = (
+    'id', 'first_name', 'last_name', 'username', 'email', 'phone',
+    'role', 'is_active', 'create_at', 'updated_at'
+)
+
+
+class UserSnapshot:
+    """
+    Read-only copy of a user's profile fields, used as `current_user`.
+    Not attached to a session: load the User row (load_current_user())
+    before changing anything.
+    """
+    __slots__ = SNAPSHOT_FIELDS
+
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(self, user):
+        for name in SNAPSHOT_FIELDS:
+            setattr(self, name, getattr(user, name))
+
+    def get_id(self):
+        return str(self.id)
+
+    # Same helpers as the model
+    is_admin = User.is_admin
+    is_blocked = User.is_blocked
+    get_full_name = User.get_full_name
+    get_profile_completion = User.get_profile_completion
+
+    def __eq__(self, other):
+        return isinstance(other, (UserSnapshot, User)) and other.id == self.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def __repr__(self):
+        return f'<UserSnapshot {self.username}>'
+
+
+class IdentityCache:
+    """
+    Per-process LRU + TTL cache of UserSnapshots keyed by user id.
+
+    Each id being loaded has a generation number, bumped by invalidate()
+    and clear(); a load that started before an invalidation is not stored,
+    so a commit racing a cache miss can't leave the old row cached. The
+    generation is dropped when the id's last load finishes (an id with no
+    load in flight has nothing to protect), so it never outgrows the number
+    of concurrent loads.
+    """
+
+    def __init__(self, maxsize=10000, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # user_id -> (expires_at, snapshot)
+        self._loading = {}  # user_id -> [loads in flight, generation]
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def get_or_load(self, user_id, loader):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(user_id)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            loading = self._loading.setdefault(user_id, [0, 0])
+            loading[0] += 1
+            generation = loading[1]
+
+        snapshot = None
+        try:
+            snapshot = loader(user_id)
+        finally:
+            with self._lock:
+                loading[0] -= 1
+                if not loading[0]:
+                    del self._loading[user_id]
+                if snapshot is not None and loading[1] == generation:
+                    self._entries[user_id] = (now + self.ttl, snapshot)
+                    self._entries.move_to_end(user_id)
+                    while len(self._entries) > self.maxsize:
+                        self._entries.popitem(last=False)
+                        self.evictions += 1
+        return snapshot
+
+    def invalidate(self, user_ids):
+        with self._lock:
+            for user_id in user_ids:
+                loading = self._loading.get(user_id)
+                if loading is not None:
+                    loading[1] += 1
+                if self._entries.pop(user_id, None) is not None:
+                    self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            for loading in self._loading.values():
+                loading[1] += 1
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations
+            }
+
+
+def get_identity_cache(app=None):
+    app = app or current_app
+    return app.extensions['identity_cache']
+
+
+def init_identity_cache(app):
+    app.extensions['identity_cache'] = IdentityCache(
+        maxsize=app.config['IDENTITY_CACHE_SIZE'],
+        ttl=app.config['IDENTITY_CACHE_TTL']
+    )
+
+
+def _load_snapshot(user_id):
+    user = db.session.get(User, user_id)
+    return UserSnapshot(user) if user is not None else None
+
+
+def load_user_snapshot(user_id):
+    """Flask-Login user_loader: a cached snapshot, or a DB read on a miss"""
+    return get_identity_cache().get_or_load(user_id, _load_snapshot)
+
+
+def load_current_user():
+    """The logged-in user's User row, for changes that will be committed"""
+    return db.session.get(User, current_user.id)
+
+
+# --- Invalidation ---
+# Any committed change to a users row (profile edit, password change,
+# deactivation, role change) drops that user's cached snapshot.
+
+@event.listens_for(db.session, 'after_flush')
+def _collect_changed_users(session, flush_context):
+    changed = session.info.setdefault('changed_user_ids', set())
+    for obj in list(session.dirty) + list(session.deleted):
+        if isinstance(obj, User) and obj.id is not None:
+            changed.add(obj.id)
+
+
+@event.listens_for(db.session, 'after_commit')
+def _invalidate_changed_users(session):
+    changed = session.info.pop('changed_user_ids', None)
+    if changed and has_app_context() and 'identity_cache' in current_app.extensions:
+        get_identity_cache().invalidate(changed)
+
+
+@event.listens_for(db.session, 'after_rollback')
+def _forget_changed_users(session):
+    session.info.pop('changed_user_ids', None)
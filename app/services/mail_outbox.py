@@ -0,0 +1,215 @@
+import random
+import threading
+from datetime import datetime, timedelta
+from flask import current_app
+from app.extensions import db, mail
+from app.models.mail_outbox import OutboxMessage
+
+
+def queue_mail(msg):
+    """
+    Store a flask_mail Message in the outbox and return immediately.
+    Delivery happens on the worker pool (or `flask mail worker`).
+    """
+    db.session.add(OutboxMessage.from_message(msg))
+    db.session.commit()
+
+    pool = current_app.extensions.get('mail_workers')
+    if pool is not None:
+        pool.wake()
+
+
+def backoff_seconds(attempts, base, cap):
+    """Exponential backoff with +/-20% jitter: base, 2*base, 4*base, ... capped"""
+    delay = min(cap, base * 2 ** max(0, attempts - 1))
+    return delay * random.uniform(0.8, 1.2)
+
+
+# --- Claiming ---
+
+def _reclaim_expired_leases(now):
+    """Put messages back in the queue whose worker died mid-delivery"""
+    db.session.execute(
+        db.update(OutboxMessage)
+        .where(OutboxMessage.status == 'sending', OutboxMessage.locked_until < now)
+        .values(status='pending', locked_until=None)
+    )
+
+
+def _claim_batch(batch_size, lease_seconds, now):
+    """Mark up to batch_size due messages as 'sending' under a lease; returns their ids"""
+    due = (
+        db.select(OutboxMessage.id)
+        .where(OutboxMessage.status == 'pending', OutboxMessage.next_attempt_at <= now)
+        .order_by(OutboxMessage.next_attempt_at, OutboxMessage.id)
+        .limit(batch_size)
+    )
+    if db.session.connection().dialect.name == 'postgresql':
+        due = due.with_for_update(skip_locked=True)
+
+    table = OutboxMessage.__table__
+    claimed = db.session.execute(
+        db.update(table)
+        .where(table.c.id.in_(due.scalar_subquery()), table.c.status == 'pending')
+        .values(status='sending', locked_until=now + timedelta(seconds=lease_seconds),
+                attempts=table.c.attempts + 1)
+        .returning(table.c.id)
+    ).scalars().all()
+    db.session.commit()
+    return claimed
+
+
+# --- Delivery ---
+
+def _record_failure(row, error, now, config):
+    row.last_error = error[:2000]
+    row.locked_until = None
+    if row.attempts >= config['MAIL_OUTBOX_MAX_ATTEMPTS']:
+        row.status = 'dead'
+        print(f"Mail {row.id} dead-lettered after {row.attempts} attempts: {error}")
+    else:
+        row.status = 'pending'
+        row.next_attempt_at = now + timedelta(seconds=backoff_seconds(
+            row.attempts, config['MAIL_OUTBOX_BACKOFF_BASE'], config['MAIL_OUTBOX_BACKOFF_MAX']
+        ))
+
+
+def process_outbox(batch_size=None):
+    """
+    Claim one batch of due messages and deliver it over a single SMTP
+    connection. Failures are retried with backoff, then dead-lettered.
+    Returns {'claimed', 'sent', 'retried', 'dead'}.
+    """
+    config = current_app.config
+    batch_size = batch_size or config['MAIL_OUTBOX_BATCH_SIZE']
+    now = datetime.utcnow()
+    stats = {'claimed': 0, 'sent': 0, 'retried': 0, 'dead': 0}
+
+    _reclaim_expired_leases(now)
+    ids = _claim_batch(batch_size, config['MAIL_OUTBOX_LEASE'], now)
+    if not ids:
+        return stats
+    stats['claimed'] = len(ids)
+
+    rows = db.session.scalars(
+        db.select(OutboxMessage).where(OutboxMessage.id.in_(ids)).order_by(OutboxMessage.id)
+    ).all()
+    try:
+        with mail.connect() as connection:
+            for row in rows:
+                try:
+                    connection.send(row.to_message())
+                    row.status = 'sent'
+                    row.sent_at = datetime.utcnow()
+                    row.locked_until = None
+                    row.last_error = None
+                    row.html = row.body = None  # don't keep reset codes at rest
+                except Exception as e:
+                    _record_failure(row, f"{type(e).__name__}: {str(e)}", now, config)
+    except Exception as e:
+        # Could not connect (or the connection dropped on close)
+        for row in rows:
+            if row.status == 'sending':
+                _record_failure(row, f"{type(e).__name__}: {str(e)}", now, config)
+
+    for row in rows:
+        if row.status == 'sent':
+            stats['sent'] += 1
+        elif row.status == 'dead':
+            stats['dead'] += 1
+        else:
+            stats['retried'] += 1
+    db.session.commit()
+    return stats
+
+
+def retry_dead_messages(ids=None):
+    """Move dead-lettered messages back to the queue; returns how many"""
+    statement = db.update(OutboxMessage).where(OutboxMessage.status == 'dead')
+    if ids:
+        statement = statement.where(OutboxMessage.id.in_(ids))
+    result = db.session.execute(statement.values(
+        status='pending', attempts=0, next_attempt_at=datetime.utcnow(), last_error=None
+    ))
+    db.session.commit()
+    return result.rowcount
+
+
+def outbox_counts():
+    """{status: count} for the outbox"""
+    return dict(db.session.execute(
+        db.select(OutboxMessage.status, db.func.count(OutboxMessage.id)).group_by(OutboxMessage.status)
+    ).all())
+
+
+# --- Worker Pool ---
+
+class MailWorkerPool:
+    """
+    Daemon threads that drain the outbox. Each worker claims its own batch,
+    so several workers (or processes) never send the same message twice.
+    wake() lets a request that just queued mail skip the poll delay.
+    """
+
+    def __init__(self, app, workers=None, poll_interval=None):
+        self.app = app
+        self.workers = workers or app.config['MAIL_OUTBOX_WORKERS']
+        self.poll_interval = poll_interval or app.config['MAIL_OUTBOX_POLL_INTERVAL']
+        self.totals = {'claimed': 0, 'sent': 0, 'retried': 0, 'dead': 0}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._threads = []
+
+    def wake(self):
+        self._wake.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            with self.app.app_context():
+                try:
+                    stats = process_outbox()
+                except Exception as e:
+                    db.session.rollback()
+                    print(f"Error in mail worker: {str(e)}")
+                    stats = {'claimed': 0}
+                finally:
+                    db.session.remove()
+
+            with self._lock:
+                for key, value in stats.items():
+                    self.totals[key] += value
+            if stats['claimed'] < self.app.config['MAIL_OUTBOX_BATCH_SIZE']:
+                self._wake.wait(self.poll_interval)
+                self._wake.clear()
+
+    def start(self):
+        if not self._threads:
+            self._stop.clear()
+            for number in range(self.workers):
+                thread = threading.Thread(target=self._run, name=f'mail-worker-{number}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        return self
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+
+_start_lock = threading.Lock()
+
+
+def start_mail_workers(app):
+    """Start (once per process) the in-process mail worker pool"""
+    pool = app.extensions.get('mail_workers')
+    if pool is not None and pool._threads:
+        return pool
+    with _start_lock:
+        pool = app.extensions.get('mail_workers')
+        if pool is None:
+            pool = app.extensions['mail_workers'] = MailWorkerPool(app)
+        return pool.start()
@@ -0,0 +1,42 @@
+from datetime import date, timedelta
+from flask_mail import Message
+from app.extensions import db
+from app.models.bookings import Booking
+from app.models.room import Room
+from app.models.user import User
+from app.services.bulk_mailer import BulkMailer
+from app.services.email_templates import render_email
+
+
+def booking_reminder_messages(days_ahead=1, batch_size=1000):
+    """
+    Reminder Messages for confirmed bookings checking in `days_ahead` days
+    from today. One streamed query (yield_per), so the recipient list
+    never has to fit in memory.
+    """
+    check_in = date.today() + timedelta(days=days_ahead)
+    rows = db.session.execute(
+        db.select(User.email, User.first_name, Room.name, Booking.check_in_date,
+                  Booking.check_out_date, Booking.guests_count)
+        .join(User, User.id == Booking.user_id)
+        .join(Room, Room.id == Booking.room_id)
+        .where(Booking.status == 'confirmed', Booking.check_in_date == check_in)
+        .order_by(Booking.id)
+        .execution_options(yield_per=batch_size)
+    )
+    for email, first_name, room_name, check_in_date, check_out_date, guests_count in rows:
+        msg = Message(subject='QuickStay - Your Stay Is Coming Up', recipients=[email])
+        msg.html, msg.body = render_email(
+            'booking_reminder',
+            username=first_name,
+            room_name=room_name,
+            check_in=check_in_date.strftime('%B %d, %Y'),
+            check_out=check_out_date.strftime('%B %d, %Y'),
+            guests_count=guests_count
+        )
+        yield msg
+
+
+def send_booking_reminders(days_ahead=1, **mailer_options):
+    """Send check-in reminders in bulk; returns the BulkMailer stats"""
+    return BulkMailer(**mailer_options).send(booking_reminder_messages(days_ahead))
@@ -0,0 +1,197 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from flask import current_app, request, session, make_response
+from flask_login import current_user
+from app.services.compression import COMPRESSIBLE_MIMETYPES, compress_bytes, negotiate_encoding
+
+
+class PageCache:
+    """
+    Per-process LRU cache of rendered pages, bounded by entry count and
+    total body bytes. Entries may carry a TTL for pages built from data.
+    """
+
+    def __init__(self, max_entries=1000, max_bytes=32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self._entries = OrderedDict()  # key -> CachedPage
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            page = self._entries.get(key)
+            if page is None or (page.expires_at is not None and page.expires_at <= time.monotonic()):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return page
+
+    def set(self, key, page):
+        if len(page.body) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size_bytes -= old.size
+            self._entries[key] = page
+            self.size_bytes += page.size
+            self._evict()
+
+    def add_variant(self, key, page, encoding, body):
+        """Keep a compressed copy of a cached page (counted against max_bytes)"""
+        with self._lock:
+            if encoding in page.variants:
+                return
+            page.variants[encoding] = body
+            page.size += len(body)
+            if self._entries.get(key) is page:
+                self.size_bytes += len(body)
+                self._evict()
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries or self.size_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size_bytes -= evicted.size
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'bytes': self.size_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions
+            }
+
+
+class CachedPage:
+    __slots__ = ('body', 'status', 'mimetype', 'etag', 'expires_at', 'variants', 'size')
+
+    def __init__(self, body, status, mimetype, ttl=None):
+        self.body = body
+        self.status = status
+        self.mimetype = mimetype
+        self.etag = hashlib.sha1(body).hexdigest()
+        self.expires_at = time.monotonic() + ttl if ttl else None
+        self.variants = {}  # content-coding -> compressed body
+        self.size = len(body)
+
+
+def init_page_cache(app):
+    app.extensions['page_cache'] = PageCache(
+        max_entries=app.config['PAGE_CACHE_MAX_ENTRIES'],
+        max_bytes=app.config['PAGE_CACHE_MAX_BYTES']
+    )
+
+
+def get_page_cache(app=None):
+    return (app or current_app).extensions['page_cache']
+
+
+_version_lock = threading.Lock()
+
+
+def template_version(app):
+    """Changes whenever a template file changes (checked per call only with auto_reload)"""
+    cached = app.extensions.get('template_version')
+    if cached is not None and not app.jinja_env.auto_reload:
+        return cached
+    with _version_lock:
+        latest = 0.0
+        for folder, _, files in os.walk(os.path.join(app.root_path, app.template_folder)):
+            for name in files:
+                latest = max(latest, os.stat(os.path.join(folder, name)).st_mtime)
+        app.extensions['template_version'] = version = f'{latest:.6f}'
+        return version
+
+
+def _cacheable_request():
+    return (
+        request.method in ('GET', 'HEAD')
+        and current_app.config['PAGE_CACHE_ENABLED']
+        and not current_user.is_authenticated
+        and not session.get('_flashes')
+    )
+
+
+def _encoded_body(key, page):
+    """(body, encoding): the compressed variant the client accepts, compressed once per page"""
+    encoding = negotiate_encoding()
+    if (encoding is None or page.mimetype not in COMPRESSIBLE_MIMETYPES
+            or len(page.body) < current_app.config['COMPRESS_MIN_SIZE']):
+        return page.body, None
+    body = page.variants.get(encoding)
+    if body is None:
+        body = compress_bytes(page.body, encoding)
+        get_page_cache().add_variant(key, page, encoding, body)
+    return body, encoding
+
+
+def _respond(key, page, max_age):
+    body, encoding = _encoded_body(key, page)
+    response = current_app.response_class(body, status=page.status, mimetype=page.mimetype)
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    response.vary.add('Cookie')  # signed-in visitors get a different page
+    if encoding is not None:
+        response.headers['Content-Encoding'] = encoding
+    if page.mimetype in COMPRESSIBLE_MIMETYPES:
+        response.vary.add('Accept-Encoding')
+    if page.status != 200:
+        return response
+    response.set_etag(f'{page.etag}-{encoding}' if encoding else page.etag)
+    return response.make_conditional(request)
+
+
+def cached_page(max_age=300, ttl=None, vary_query=False, name=None):
+    """
+    Serve anonymous GETs of a view from the page cache.
+
+    Pages are keyed on the endpoint (or `name`), the template version and,
+    with vary_query, the query string. `ttl` (seconds or a config key)
+    bounds staleness for pages built from database rows. 200 responses get
+    a strong ETag (If-None-Match answers 304); all get
+    `Cache-Control: public, max-age=<max_age>`. Signed-in
+    users, pending flash messages and responses that write the session
+    bypass the cache.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if not _cacheable_request():
+                return view(*args, **kwargs)
+
+            app = current_app._get_current_object()
+            cache = get_page_cache(app)
+            key = (name or request.endpoint, template_version(app),
+                   request.query_string if vary_query else b'')
+            page = cache.get(key)
+            if page is not None:
+                return _respond(key, page, max_age)
+
+            response = make_response(view(*args, **kwargs))
+            if response.status_code not in (200, 404) or session.modified or response.direct_passthrough:
+                return response
+            seconds = current_app.config[ttl] if isinstance(ttl, str) else ttl
+            page = CachedPage(response.get_data(), response.status_code, response.mimetype, seconds)
+            cache.set(key, page)
+            return _respond(key, page, max_age)
+        return wrapper
+    return decorator
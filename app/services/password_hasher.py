@@ -0,0 +1,85 @@
+import functools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from flask import current_app
+from werkzeug.security import generate_password_hash, check_password_hash
+
+# Password hashing is pure CPU (tens of ms per call at production cost).
+# With PASSWORD_HASH_WORKERS > 0 it runs in a per-process pool of hasher
+# processes, so a login burst uses every core instead of pinning the web
+# worker that received it. In-flight jobs are capped by a semaphore: extra
+# requests wait for a slot rather than queueing unbounded work.
+
+
+class _HasherPool:
+
+    def __init__(self, workers, max_pending):
+        # forkserver: never fork the (threaded) web worker itself
+        context = multiprocessing.get_context('forkserver')
+        context.set_forkserver_preload(['werkzeug.security'])
+        self.executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        self.slots = threading.BoundedSemaphore(max_pending)
+        self.pid = os.getpid()
+
+    def run(self, fn, *args):
+        with self.slots:
+            return self.executor.submit(fn, *args).result()
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool(config):
+    """The hasher pool for this process (re-created after a fork)"""
+    global _pool
+    if _pool is not None and _pool.pid == os.getpid():
+        return _pool
+    with _pool_lock:
+        if _pool is None or _pool.pid != os.getpid():
+            workers = config['PASSWORD_HASH_WORKERS']
+            _pool = _HasherPool(workers, config['PASSWORD_HASH_MAX_PENDING'] or workers * 4)
+        return _pool
+
+
+def shutdown_hasher_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None and _pool.pid == os.getpid():
+            _pool.shutdown()
+        _pool = None
+
+
+def _run(fn, *args):
+    config = current_app.config
+    if not config['PASSWORD_HASH_WORKERS']:
+        return fn(*args)
+    return _get_pool(config).run(fn, *args)
+
+
+# --- Public API ---
+
+def hash_password(password):
+    """Hash with the configured PASSWORD_HASH_METHOD"""
+    return _run(generate_password_hash, password, current_app.config['PASSWORD_HASH_METHOD'])
+
+
+def verify_password(password_hash, password):
+    return _run(check_password_hash, password_hash, password)
+
+
+@functools.lru_cache(maxsize=8)
+def _method_prefix(method):
+    """'scrypt' -> 'scrypt:32768:8:1': the parameters werkzeug actually stores"""
+    return generate_password_hash('', method).split('$', 1)[0]
+
+
+def needs_rehash(password_hash):
+    """True when the hash was made with other parameters than PASSWORD_HASH_METHOD"""
+    stored = (password_hash or '').split('$', 1)[0]
+    return stored != _method_prefix(current_app.config['PASSWORD_HASH_METHOD'])
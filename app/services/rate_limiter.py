@@ -0,0 +1,142 @@
+import math
+import threading
+import time
+from functools import wraps
+from flask import request, current_app, flash, render_template
+
+# Sliding-window counters: each key keeps a count for the current and the
+# previous fixed window, and the estimate weights the previous count by how
+# much of it still overlaps the sliding window. That needs only an INCR per
+# hit, so the same algorithm runs in memory or on a shared store.
+
+LIMITED_MESSAGE = 'Too many attempts. Please wait a few minutes and try again.'
+
+
+class MemoryBackend:
+    """
+    Per-process counters: each worker process limits on its own, so under
+    N workers a client gets up to N times each budget. Development only.
+    """
+
+    def __init__(self, max_keys=100000):
+        self.max_keys = max_keys
+        self._counters = {}  # key -> [window_index, current, previous]
+        self._lock = threading.Lock()
+
+    def hit(self, key, window, index):
+        with self._lock:
+            counter = self._counters.get(key)
+            if counter is None:
+                if len(self._counters) >= self.max_keys:
+                    self._prune(index)
+                counter = self._counters[key] = [index, 0, 0]
+            elif counter[0] != index:
+                counter[2] = counter[1] if counter[0] == index - 1 else 0
+                counter[0], counter[1] = index, 0
+            counter[1] += 1
+            return counter[1], counter[2]
+
+    def _prune(self, index):
+        stale = [key for key, counter in self._counters.items() if counter[0] < index - 1]
+        for key in stale:
+            del self._counters[key]
+        while len(self._counters) >= self.max_keys:
+            del self._counters[next(iter(self._counters))]
+
+
+class SharedBackend:
+    """
+    Counters in a shared key-value store, so limits hold across processes
+    and hosts. `client` needs the redis-py pipeline API (incr, expire, get,
+    execute); tests and benchmarks pass an in-process stand-in.
+    """
+
+    def __init__(self, client, prefix='ratelimit:'):
+        self.client = client
+        self.prefix = prefix
+
+    def hit(self, key, window, index):
+        current_key = f'{self.prefix}{key}:{index}'
+        pipe = self.client.pipeline()
+        pipe.incr(current_key)
+        pipe.expire(current_key, window * 2)
+        pipe.get(f'{self.prefix}{key}:{index - 1}')
+        current, _, previous = pipe.execute()
+        return int(current), int(previous or 0)
+
+
+class RateLimiter:
+
+    def __init__(self, backend, rules):
+        self.backend = backend
+        self.rules = rules  # {scope: {key_type: (limit, window_seconds)}}
+
+    def hit(self, scope, keys, now=None):
+        """
+        Count one attempt for each key ({key_type: value}) under `scope`.
+        Returns None if allowed, else the seconds to wait (Retry-After).
+        """
+        now = time.time() if now is None else now
+        retry_after = None
+        for key_type, value in keys.items():
+            rule = self.rules.get(scope, {}).get(key_type)
+            if rule is None or not value:
+                continue
+            limit, window = rule
+            index = int(now // window)
+            elapsed = (now % window) / window
+            current, previous = self.backend.hit(f'{scope}:{key_type}:{value}', window, index)
+            if previous * (1 - elapsed) + current > limit:
+                wait = math.ceil(window * (1 - elapsed))
+                retry_after = max(retry_after or 0, wait)
+        return retry_after
+
+
+def init_rate_limiter(app, client=None):
+    """Build the limiter from config; `client` overrides the shared store connection"""
+    if app.config['RATE_LIMIT_BACKEND'] == 'redis' or client is not None:
+        if client is None:
+            import redis  # optional: only needed for RATE_LIMIT_BACKEND=redis
+            client = redis.Redis.from_url(app.config['RATE_LIMIT_REDIS_URL'])
+        backend = SharedBackend(client)
+    else:
+        backend = MemoryBackend()
+    app.extensions['rate_limiter'] = RateLimiter(backend, app.config['RATE_LIMITS'])
+
+
+def get_rate_limiter(app=None):
+    return (app or current_app).extensions['rate_limiter']
+
+
+def rate_limit(scope, account=None, template=None):
+    """
+    Reject POSTs over the RATE_LIMITS[scope] budget with a 429 before the
+    view runs (so before any query or password hash). Limits apply per
+    client IP and, if `account` returns an identifier, per account.
+    `template` renders a page with a flash instead of a JSON error.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method != 'POST' or not current_app.config['RATE_LIMIT_ENABLED']:
+                return view(*args, **kwargs)
+
+            keys = {'ip': request.remote_addr or 'unknown'}
+            if account is not None:
+                keys['account'] = (account() or '').strip().lower()[:255]
+            try:
+                retry_after = get_rate_limiter().hit(scope, keys)
+            except Exception as e:
+                # Fail open: a store outage must not lock everyone out
+                print(f"Error in rate limiter: {str(e)}")
+                retry_after = None
+            if retry_after is None:
+                return view(*args, **kwargs)
+
+            headers = {'Retry-After': str(retry_after)}
+            if template:
+                flash(LIMITED_MESSAGE, 'danger')
+                return render_template(template), 429, headers
+            return {'success': False, 'message': LIMITED_MESSAGE}, 429, headers
+        return wrapper
+    return decorator
@@ -0,0 +1,117 @@
+import threading
+import time
+from datetime import datetime
+from app.extensions import db
+
+
+class PeriodicTask:
+    """
+    Run fn() every `interval` seconds on a daemon thread inside an app
+    context. The last result and run count are kept for inspection.
+    """
+
+    def __init__(self, app, name, fn, interval):
+        self.app = app
+        self.name = name
+        self.fn = fn
+        self.interval = interval
+        self.runs = 0
+        self.last_run_at = None
+        self.last_result = None
+        self.last_error = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def run_once(self):
+        with self.app.app_context():
+            try:
+                self.last_result = self.fn()
+                self.last_error = None
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"Error in scheduled task {self.name}: {str(e)}")
+            finally:
+                self.runs += 1
+                self.last_run_at = datetime.utcnow()
+                db.session.remove()
+        return self.last_result
+
+    def run_forever(self):
+        while not self._stop.is_set():
+            started = time.monotonic()
+            self.run_once()
+            self._stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self.run_forever, name=f'task-{self.name}', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def status(self):
+        return {
+            'name': self.name,
+            'interval': self.interval,
+            'runs': self.runs,
+            'last_run_at': self.last_run_at.isoformat() if self.last_run_at else None,
+            'last_result': self.last_result,
+            'last_error': self.last_error
+        }
+
+
+_start_lock = threading.Lock()
+
+
+def start_periodic_tasks(app):
+    """Start (once per process) the periodic tasks enabled in config; returns them by name"""
+    tasks = app.extensions['periodic_tasks']
+    if tasks or not app.config.get('BOOKING_EXPIRY_IN_PROCESS'):
+        return tasks
+    with _start_lock:
+        if not tasks:
+            from app.services.booking_expiry import expire_stale_bookings
+            tasks['booking_expiry'] = PeriodicTask(
+                app, 'booking_expiry', expire_stale_bookings, app.config['BOOKING_EXPIRY_INTERVAL']
+            ).start()
+    return tasks
+
+
+def start_background_tasks(app):
+    """
+    Arrange for the in-process periodic tasks and mail pool to start with
+    the first request, so CLI processes (migrations, `flask bookings
+    expire`, `flask mail worker`) and pre-fork parents never run them.
+    """
+    app.extensions['periodic_tasks'] = {}
+    if app.config.get('BOOKING_EXPIRY_IN_PROCESS'):
+        @app.before_request
+        def _ensure_periodic_tasks():
+            start_periodic_tasks(app)
+
+    if app.config.get('MAIL_OUTBOX_IN_PROCESS'):
+        from app.services.mail_outbox import start_mail_workers
+
+        @app.before_request
+        def _ensure_mail_workers():
+            start_mail_workers(app)
+
+
+# --- Pre-fork servers ---
+# Threads don't survive fork(). Tasks start with a process's first request,
+# so a preloaded master (gunicorn preload_app) normally has none; if it did,
+# it stops them before forking and each worker restarts them.
+
+def stop_background_tasks(app, timeout=10):
+    for task in app.extensions.get('periodic_tasks', {}).values():
+        task.stop(timeout)
+
+
+def resume_background_tasks(app):
+    for task in app.extensions.get('periodic_tasks', {}).values():
+        task.start()
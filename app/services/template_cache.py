@@ -0,0 +1,62 @@
+import os
+import stat
+import time
+from jinja2 import FileSystemBytecodeCache
+
+# Jinja parses and compiles each template to Python on first use, in every
+# process. The bytecode cache stores the compiled code on disk (shared by
+# all workers, keyed by a checksum of the source so edits invalidate it),
+# and warm_templates() compiles everything at boot. Under a preloading
+# server (gunicorn.conf.py) the warm-up runs once in the master and every
+# forked or recycled worker inherits the compiled templates.
+
+
+def _private_directory(directory):
+    """
+    Create the cache directory (mode 0700) and check it is ours: Jinja
+    unmarshals and runs whatever code it finds there, so a directory another
+    user owns or can write to is refused. Raises OSError.
+    """
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    st = os.lstat(directory)
+    if not stat.S_ISDIR(st.st_mode):
+        raise OSError(f"{directory} is not a directory")
+    if hasattr(os, 'getuid') and st.st_uid != os.getuid():
+        raise OSError(f"{directory} is owned by another user")
+    if st.st_mode & 0o077:
+        raise OSError(f"{directory} is accessible to other users (mode {stat.S_IMODE(st.st_mode):o})")
+
+
+def init_template_cache(app):
+    """
+    Attach the filesystem bytecode cache (JINJA_BYTECODE_CACHE_DIR, relative
+    to the instance folder; empty = off)
+    """
+    directory = app.config.get('JINJA_BYTECODE_CACHE_DIR')
+    if not directory:
+        return
+    directory = os.path.join(app.instance_path, directory)
+    try:
+        _private_directory(directory)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory, pattern='quickstay-%s.cache')
+    except OSError as e:
+        print(f"Error setting up Jinja bytecode cache in {directory}: {str(e)}")
+
+
+def warm_templates(app):
+    """Compile every template now instead of on each page's first request; returns stats"""
+    from app.services.email_templates import _compiled
+
+    started = time.perf_counter()
+    compiled = failed = 0
+    for name in app.jinja_env.list_templates():
+        try:
+            if name.startswith('email/'):
+                _compiled(app, name.split('/', 1)[1])  # the CSS-inlined email cache
+            else:
+                app.jinja_env.get_template(name)
+            compiled += 1
+        except Exception as e:
+            failed += 1
+            print(f"Error compiling template {name}: {str(e)}")
+    return {'templates': compiled, 'failed': failed, 'seconds': round(time.perf_counter() - started, 3)}
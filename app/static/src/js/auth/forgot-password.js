@@ -0,0 +1,624 @@
+// URLs and CSRF token come from the <script> tag's data-* attributes
+const resetConfig = document.currentScript.dataset;
+
+// Initialize Lucide icons
+lucide.createIcons();
+
+// ===== Stage Navigation =====
+function goToStep(step) {
+    try {
+        // Hide all stages
+        document.getElementById('stage-1').classList.add('hidden');
+        document.getElementById('stage-2').classList.add('hidden');
+        document.getElementById('stage-3').classList.add('hidden');
+        document.getElementById('stage-4').classList.add('hidden');
+
+        // Show selected stage
+        document.getElementById('stage-' + step).classList.remove('hidden');
+
+        // Update progress indicator
+        for (let i = 1; i <= 3; i++) {
+            const indicator = document.getElementById('step-' + i + '-indicator');
+            const text = document.getElementById('step-' + i + '-text');
+            const line = document.getElementById('line-' + i);
+
+            if (i < step) {
+                // Completed steps
+                indicator.classList.remove('bg-line', 'dark:bg-line-dark', 'bg-brand', 'text-white');
+                indicator.classList.add('bg-green-500', 'text-white');
+                indicator.innerHTML = '<i data-lucide="check" class="w-4 h-4"></i>';
+                text.classList.remove('text-content-secondary', 'dark:text-content-dark-secondary');
+                text.classList.add('text-green-500');
+                if (line) {
+                    line.classList.remove('bg-line', 'dark:bg-line-dark');
+                    line.classList.add('bg-green-500');
+                }
+            } else if (i === step) {
+                // Current step
+                indicator.classList.remove('bg-line', 'dark:bg-line-dark', 'bg-green-500');
+                indicator.classList.add('bg-brand', 'text-white');
+                indicator.textContent = i;
+                text.classList.remove('text-content-secondary', 'dark:text-content-dark-secondary', 'text-green-500');
+                text.classList.add('text-brand', 'dark:text-brand-light');
+            } else {
+                // Future steps
+                indicator.classList.remove('bg-brand', 'bg-green-500', 'text-white');
+                indicator.classList.add('bg-line', 'dark:bg-line-dark', 'text-content-secondary', 'dark:text-content-dark-secondary');
+                indicator.textContent = i;
+                text.classList.remove('text-brand', 'dark:text-brand-light', 'text-green-500');
+                text.classList.add('text-content-secondary', 'dark:text-content-dark-secondary');
+                if (line) {
+                    line.classList.remove('bg-green-500');
+                    line.classList.add('bg-line', 'dark:bg-line-dark');
+                }
+            }
+        }
+
+        lucide.createIcons();
+    } catch (error) {
+        console.error('Stage navigation error:', error);
+    }
+}
+
+// ===== STAGE 1: Email Form =====
+(function() {
+    try {
+        const emailForm = document.getElementById('email-form');
+        const sendOtpBtn = document.getElementById('send-otp-btn');
+        const emailInput = document.getElementById('email');
+        const emailError = document.getElementById('email-error');
+
+        if (emailForm) {
+            emailForm.addEventListener('submit', function(e) {
+                e.preventDefault();
+                try {
+                    const email = emailInput.value.trim();
+
+                    // Clear previous errors
+                    emailError.classList.add('hidden');
+
+                    // Basic validation
+                    if (!email) {
+                        emailError.textContent = 'Please enter your email address.';
+                        emailError.classList.remove('hidden');
+                        return;
+                    }
+
+                    const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+                    if (!emailRegex.test(email)) {
+                        emailError.textContent = 'Please enter a valid email address.';
+                        emailError.classList.remove('hidden');
+                        return;
+                    }
+
+                    // Loading state
+                    sendOtpBtn.disabled = true;
+                    sendOtpBtn.innerHTML = '<i data-lucide="loader-2" class="w-4 h-4 animate-spin"></i><span>Sending code...</span>';
+                    lucide.createIcons();
+
+                    // Send POST request
+                    fetch(resetConfig.forgotUrl, {
+                        method: 'POST',
+                        headers: {
+                            'Content-Type': 'application/x-www-form-urlencoded',
+                        },
+                        body: new URLSearchParams({
+                            'csrf_token': resetConfig.csrfToken,
+                            'email': email
+                        })
+                    })
+                    .then(response => response.json())
+                    .then(data => {
+                        if (data.success) {
+                            // Success - move to stage 2
+                            document.getElementById('display-email').textContent = email;
+                            goToStep(2);
+                            startTimer();
+                        } else {
+                            // Error - show message
+                            emailError.textContent = data.message;
+                            emailError.classList.remove('hidden');
+                        }
+
+                        // Reset button
+                        sendOtpBtn.disabled = false;
+                        sendOtpBtn.innerHTML = '<i data-lucide="send" class="w-4 h-4"></i><span>Send Verification Code</span>';
+                        lucide.createIcons();
+                    })
+                    .catch(error => {
+                        console.error('Error:', error);
+                        emailError.textContent = 'Network error. Please try again.';
+                        emailError.classList.remove('hidden');
+
+                        // Reset button
+                        sendOtpBtn.disabled = false;
+                        sendOtpBtn.innerHTML = '<i data-lucide="send" class="w-4 h-4"></i><span>Send Verification Code</span>';
+                        lucide.createIcons();
+                    });
+
+                } catch (error) {
+                    console.error('Email form error:', error);
+                }
+            });
+        }
+
+        // Clear error on input
+        if (emailInput) {
+            emailInput.addEventListener('input', function() {
+                emailError.classList.add('hidden');
+            });
+        }
+    } catch (error) {
+        console.error('Stage 1 error:', error);
+    }
+})();
+
+// ===== STAGE 2: OTP Input =====
+(function() {
+    try {
+        const otpInputs = document.querySelectorAll('.otp-input');
+        const otpForm = document.getElementById('otp-form');
+        const verifyBtn = document.getElementById('verify-otp-btn');
+        const otpError = document.getElementById('otp-error');
+        const changeEmailBtn = document.getElementById('change-email-btn');
+
+        // OTP Input Logic
+        otpInputs.forEach(function(input, index) {
+            // Only allow numbers
+            input.addEventListener('input', function(e) {
+                try {
+                    this.value = this.value.replace(/[^0-9]/g, '');
+
+                    if (this.value.length === 1 && index < otpInputs.length - 1) {
+                        otpInputs[index + 1].focus();
+                    }
+
+                    // Update hidden input
+                    let otp = '';
+                    otpInputs.forEach(function(inp) {
+                        otp += inp.value;
+                    });
+                    document.getElementById('otp-value').value = otp;
+
+                    // Clear error
+                    otpError.classList.add('hidden');
+                    input.classList.remove('border-red-500', 'dark:border-red-500');
+                    input.classList.add('border-line', 'dark:border-line-dark');
+                } catch (error) {
+                    console.error('OTP input error:', error);
+                }
+            });
+
+            // Handle backspace
+            input.addEventListener('keydown', function(e) {
+                try {
+                    if (e.key === 'Backspace' && !this.value && index > 0) {
+                        otpInputs[index - 1].focus();
+                    }
+                } catch (error) {
+                    console.error('OTP backspace error:', error);
+                }
+            });
+
+            // Handle paste
+            input.addEventListener('paste', function(e) {
+                try {
+                    e.preventDefault();
+                    const pastedData = e.clipboardData.getData('text').replace(/[^0-9]/g, '').slice(0, 6);
+
+                    pastedData.split('').forEach(function(char, i) {
+                        if (otpInputs[i]) {
+                            otpInputs[i].value = char;
+                        }
+                    });
+
+                    const nextEmpty = pastedData.length < 6 ? pastedData.length : 5;
+                    otpInputs[nextEmpty].focus();
+
+                    // Update hidden input
+                    document.getElementById('otp-value').value = pastedData;
+                } catch (error) {
+                    console.error('OTP paste error:', error);
+                }
+            });
+        });
+
+        // OTP Form Submit
+        if (otpForm) {
+            otpForm.addEventListener('submit', function(e) {
+                e.preventDefault();
+                try {
+                    const otp = document.getElementById('otp-value').value;
+
+                    // Clear previous errors
+                    otpError.classList.add('hidden');
+
+                    if (!otp || otp.length !== 6) {
+                        otpError.textContent = 'Please enter the complete 6-digit code.';
+                        otpError.classList.remove('hidden');
+                        otpInputs.forEach(function(inp) {
+                            if (!inp.value) {
+                                inp.classList.add('border-red-500', 'dark:border-red-500');
+                                inp.classList.remove('border-line', 'dark:border-line-dark');
+                            }
+                        });
+                        return;
+                    }
+
+                    // Loading state
+                    verifyBtn.disabled = true;
+                    verifyBtn.innerHTML = '<i data-lucide="loader-2" class="w-4 h-4 animate-spin"></i><span>Verifying...</span>';
+                    lucide.createIcons();
+
+                    // Send POST request
+                    fetch(resetConfig.verifyUrl, {
+                        method: 'POST',
+                        headers: {
+                            'Content-Type': 'application/x-www-form-urlencoded',
+                        },
+                        body: new URLSearchParams({
+                            'csrf_token': resetConfig.csrfToken,
+                            'otp': otp
+                        })
+                    })
+                    .then(response => response.json())
+                    .then(data => {
+                        if (data.success) {
+                            // Success - move to stage 3
+                            goToStep(3);
+                        } else {
+                            // Error - show message
+                            otpError.textContent = data.message;
+                            otpError.classList.remove('hidden');
+                            otpInputs.forEach(function(inp) {
+                                inp.classList.add('border-red-500', 'dark:border-red-500');
+                                inp.classList.remove('border-line', 'dark:border-line-dark');
+                            });
+                        }
+
+                        // Reset button
+                        verifyBtn.disabled = false;
+                        verifyBtn.innerHTML = '<i data-lucide="shield-check" class="w-4 h-4"></i><span>Verify Code</span>';
+                        lucide.createIcons();
+                    })
+                    .catch(error => {
+                        console.error('Error:', error);
+                        otpError.textContent = 'Network error. Please try again.';
+                        otpError.classList.remove('hidden');
+
+                        // Reset button
+                        verifyBtn.disabled = false;
+                        verifyBtn.innerHTML = '<i data-lucide="shield-check" class="w-4 h-4"></i><span>Verify Code</span>';
+                        lucide.createIcons();
+                    });
+
+                } catch (error) {
+                    console.error('OTP verify error:', error);
+                }
+            });
+        }
+
+        // Resend OTP
+        const resendBtn = document.getElementById('resend-btn');
+        if (resendBtn) {
+            resendBtn.addEventListener('click', function() {
+                try {
+                    this.classList.add('hidden');
+
+                    // Send resend request
+                    fetch(resetConfig.resendUrl, {
+                        method: 'POST',
+                        headers: {
+                            'Content-Type': 'application/x-www-form-urlencoded',
+                        },
+                        body: new URLSearchParams({
+                            'csrf_token': resetConfig.csrfToken
+                        })
+                    })
+                    .then(response => response.json())
+                    .then(data => {
+                        if (data.success) {
+                            startTimer();
+                            // Clear OTP inputs
+                            otpInputs.forEach(function(inp) {
+                                inp.value = '';
+                                inp.classList.remove('border-red-500', 'dark:border-red-500');
+                                inp.classList.add('border-line', 'dark:border-line-dark');
+                            });
+                            document.getElementById('otp-value').value = '';
+                            otpInputs[0].focus();
+                            otpError.classList.add('hidden');
+                        } else {
+                            otpError.textContent = data.message;
+                            otpError.classList.remove('hidden');
+                        }
+                    })
+                    .catch(error => {
+                        console.error('Error:', error);
+                        otpError.textContent = 'Failed to resend code. Please try again.';
+                        otpError.classList.remove('hidden');
+                    });
+                } catch (error) {
+                    console.error('Resend OTP error:', error);
+                }
+            });
+        }
+
+        // Change Email Button
+        if (changeEmailBtn) {
+            changeEmailBtn.addEventListener('click', function() {
+                goToStep(1);
+            });
+        }
+    } catch (error) {
+        console.error('Stage 2 error:', error);
+    }
+})();
+
+// ===== Timer Function =====
+function startTimer() {
+    try {
+        let timeLeft = 600; // 10 minutes
+        const timerEl = document.getElementById('timer');
+        const timerText = document.getElementById('timer-text');
+        const resendBtn = document.getElementById('resend-btn');
+
+        timerText.classList.remove('hidden');
+        resendBtn.classList.add('hidden');
+
+        const interval = setInterval(function() {
+            try {
+                const minutes = Math.floor(timeLeft / 60);
+                const seconds = timeLeft % 60;
+                timerEl.textContent = minutes.toString().padStart(2, '0') + ':' + seconds.toString().padStart(2, '0');
+
+                if (timeLeft <= 0) {
+                    clearInterval(interval);
+                    timerText.classList.add('hidden');
+                    resendBtn.classList.remove('hidden');
+                }
+
+                timeLeft--;
+            } catch (error) {
+                clearInterval(interval);
+                console.error('Timer tick error:', error);
+            }
+        }, 1000);
+    } catch (error) {
+        console.error('Timer error:', error);
+    }
+}
+
+// ===== STAGE 3: Password Reset =====
+(function() {
+    try {
+        const newPasswordInput = document.getElementById('new_password');
+        const confirmPasswordInput = document.getElementById('confirm_new_password');
+        const passwordForm = document.getElementById('password-form');
+        const resetBtn = document.getElementById('reset-password-btn');
+
+        // Password Toggle Function
+        function setupToggle(btnId, inputId, eyeOpenId, eyeClosedId) {
+            try {
+                const btn = document.getElementById(btnId);
+                const input = document.getElementById(inputId);
+                const eyeOpen = document.getElementById(eyeOpenId);
+                const eyeClosed = document.getElementById(eyeClosedId);
+
+                if (btn && input && eyeOpen && eyeClosed) {
+                    btn.addEventListener('click', function(e) {
+                        try {
+                            e.preventDefault();
+                            e.stopPropagation();
+
+                            if (input.type === 'password') {
+                                input.type = 'text';
+                                eyeOpen.classList.add('hidden');
+                                eyeClosed.classList.remove('hidden');
+                            } else {
+                                input.type = 'password';
+                                eyeOpen.classList.remove('hidden');
+                                eyeClosed.classList.add('hidden');
+                            }
+                        } catch (error) {
+                            console.error('Toggle error:', error);
+                        }
+                    });
+                }
+            } catch (error) {
+                console.error('Setup toggle error:', error);
+            }
+        }
+
+        // Setup both toggles
+        setupToggle('toggle-new-password', 'new_password', 'new-eye-open', 'new-eye-closed');
+        setupToggle('toggle-confirm-new-password', 'confirm_new_password', 'confirm-new-eye-open', 'confirm-new-eye-closed');
+
+        // Password Strength Indicator
+        if (newPasswordInput) {
+            const bars = [
+                document.getElementById('reset-bar-1'),
+                document.getElementById('reset-bar-2'),
+                document.getElementById('reset-bar-3'),
+                document.getElementById('reset-bar-4')
+            ];
+            const strengthText = document.getElementById('reset-strength-text');
+
+            function updateReq(id, met) {
+                try {
+                    const el = document.getElementById(id);
+                    const icon = el.querySelector('[data-lucide]');
+                    const text = el.querySelector('span');
+
+                    if (met) {
+                        icon.setAttribute('data-lucide', 'check-circle');
+                        icon.classList.remove('text-content-secondary', 'dark:text-content-dark-secondary');
+                        icon.classList.add('text-state-success');
+                        text.classList.remove('text-content-secondary', 'dark:text-content-dark-secondary');
+                        text.classList.add('text-state-success');
+                    } else {
+                        icon.setAttribute('data-lucide', 'circle');
+                        icon.classList.add('text-content-secondary', 'dark:text-content-dark-secondary');
+                        icon.classList.remove('text-state-success');
+                        text.classList.add('text-content-secondary', 'dark:text-content-dark-secondary');
+                        text.classList.remove('text-state-success');
+                    }
+                    lucide.createIcons();
+                } catch (error) {
+                    console.error('Update req error:', error);
+                }
+            }
+
+            function resetBars() {
+                bars.forEach(function(bar) {
+                    bar.classList.remove('bg-red-500', 'bg-amber-500', 'bg-yellow-500', 'bg-state-success');
+                    bar.classList.add('bg-line', 'dark:bg-line-dark');
+                });
+            }
+
+            function setStrength(level, color, text) {
+                resetBars();
+                for (let i = 0; i < level; i++) {
+                    bars[i].classList.remove('bg-line', 'dark:bg-line-dark');
+                    bars[i].classList.add(color);
+                }
+                strengthText.textContent = text;
+            }
+
+            newPasswordInput.addEventListener('input', function() {
+                try {
+                    const password = this.value;
+                    let score = 0;
+
+                    const hasLength = password.length >= 8;
+                    const hasUpper = /[A-Z]/.test(password);
+                    const hasLower = /[a-z]/.test(password);
+                    const hasNumber = /[0-9]/.test(password);
+
+                    updateReq('reset-req-length', hasLength);
+                    updateReq('reset-req-upper', hasUpper);
+                    updateReq('reset-req-lower', hasLower);
+                    updateReq('reset-req-number', hasNumber);
+
+                    if (hasLength) score++;
+                    if (hasUpper) score++;
+                    if (hasLower) score++;
+                    if (hasNumber) score++;
+
+                    if (password.length === 0) {
+                        resetBars();
+                        strengthText.textContent = 'Enter password';
+                    } else if (score === 1) setStrength(1, 'bg-red-500', 'Weak');
+                    else if (score === 2) setStrength(2, 'bg-amber-500', 'Fair');
+                    else if (score === 3) setStrength(3, 'bg-yellow-500', 'Good');
+                    else if (score === 4) setStrength(4, 'bg-state-success', 'Strong');
+                } catch (error) {
+                    console.error('Password strength error:', error);
+                }
+            });
+        }
+
+        // Password Form Submit
+        if (passwordForm) {
+            passwordForm.addEventListener('submit', function(e) {
+                e.preventDefault();
+                try {
+                    const newPassword = newPasswordInput.value;
+                    const confirmPassword = confirmPasswordInput.value;
+                    const newPassError = document.getElementById('new_password-error');
+                    const confirmPassError = document.getElementById('confirm_new_password-error');
+                    let isValid = true;
+
+                    // Clear errors
+                    newPassError.classList.add('hidden');
+                    confirmPassError.classList.add('hidden');
+
+                    // Validate new password
+                    if (!newPassword) {
+                        newPassError.textContent = 'Please enter a new password.';
+                        newPassError.classList.remove('hidden');
+                        isValid = false;
+                    } else if (newPassword.length < 8) {
+                        newPassError.textContent = 'Minimum 8 characters required.';
+                        newPassError.classList.remove('hidden');
+                        isValid = false;
+                    } else if (!/[A-Z]/.test(newPassword)) {
+                        newPassError.textContent = 'Need an uppercase letter.';
+                        newPassError.classList.remove('hidden');
+                        isValid = false;
+                    } else if (!/[a-z]/.test(newPassword)) {
+                        newPassError.textContent = 'Need a lowercase letter.';
+                        newPassError.classList.remove('hidden');
+                        isValid = false;
+                    } else if (!/[0-9]/.test(newPassword)) {
+                        newPassError.textContent = 'Need a number.';
+                        newPassError.classList.remove('hidden');
+                        isValid = false;
+                    }
+
+                    // Validate confirm password
+                    if (!confirmPassword) {
+                        confirmPassError.textContent = 'Please confirm your password.';
+                        confirmPassError.classList.remove('hidden');
+                        isValid = false;
+                    } else if (confirmPassword !== newPassword) {
+                        confirmPassError.textContent = 'Passwords do not match.';
+                        confirmPassError.classList.remove('hidden');
+                        isValid = false;
+                    }
+
+                    if (!isValid) return;
+
+                    // Loading state
+                    resetBtn.disabled = true;
+                    resetBtn.innerHTML = '<i data-lucide="loader-2" class="w-4 h-4 animate-spin"></i><span>Resetting password...</span>';
+                    lucide.createIcons();
+
+                    // Send POST request
+                    fetch(resetConfig.resetUrl, {
+                        method: 'POST',
+                        headers: {
+                            'Content-Type': 'application/x-www-form-urlencoded',
+                        },
+                        body: new URLSearchParams({
+                            'csrf_token': resetConfig.csrfToken,
+                            'new_password': newPassword,
+                            'confirm_new_password': confirmPassword
+                        })
+                    })
+                    .then(response => response.json())
+                    .then(data => {
+                        if (data.success) {
+                            // Success - move to stage 4
+                            goToStep(4);
+                        } else {
+                            // Error - show message
+                            newPassError.textContent = data.message;
+                            newPassError.classList.remove('hidden');
+                        }
+
+                        // Reset button
+                        resetBtn.disabled = false;
+                        resetBtn.innerHTML = '<i data-lucide="check" class="w-4 h-4"></i><span>Reset Password</span>';
+                        lucide.createIcons();
+                    })
+                    .catch(error => {
+                        console.error('Error:', error);
+                        newPassError.textContent = 'Network error. Please try again.';
+                        newPassError.classList.remove('hidden');
+
+                        // Reset button
+                        resetBtn.disabled = false;
+                        resetBtn.innerHTML = '<i data-lucide="check" class="w-4 h-4"></i><span>Reset Password</span>';
+                        lucide.createIcons();
+                    });
+
+                } catch (error) {
+                    console.error('Password form error:', error);
+                }
+            });
+        }
+    } catch (error) {
+        console.error('Stage 3 error:', error);
+    }
+})();
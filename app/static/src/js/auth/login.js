@@ -0,0 +1,92 @@
+// Initialize Lucide icons
+lucide.createIcons();
+
+// Password Toggle
+(function() {
+    try {
+        const toggleBtn = document.getElementById('toggle-password');
+        const passwordInput = document.getElementById('password');
+        const eyeOpen = document.getElementById('eye-open');
+        const eyeClosed = document.getElementById('eye-closed');
+
+        if (toggleBtn && passwordInput && eyeOpen && eyeClosed) {
+            toggleBtn.addEventListener('click', function(e) {
+                e.preventDefault();
+                e.stopPropagation();
+
+                if (passwordInput.type === 'password') {
+                    passwordInput.type = 'text';
+                    eyeOpen.classList.add('hidden');
+                    eyeClosed.classList.remove('hidden');
+                } else {
+                    passwordInput.type = 'password';
+                    eyeOpen.classList.remove('hidden');
+                    eyeClosed.classList.add('hidden');
+                }
+            });
+        }
+    } catch (error) {
+        console.error('Password toggle error:', error);
+    }
+})();
+
+// Form Validation
+(function() {
+    try {
+        const form = document.getElementById('login-form');
+        const loginBtn = document.getElementById('login-btn');
+        const emailInput = document.getElementById('email');
+        const passwordInput = document.getElementById('password');
+        const emailError = document.getElementById('email-error');
+        const passwordError = document.getElementById('password-error');
+
+        if (form) {
+            form.addEventListener('submit', function(e) {
+                let isValid = true;
+
+                // Clear previous errors
+                emailError.classList.add('hidden');
+                passwordError.classList.add('hidden');
+
+                // Validate email/username
+                if (!emailInput.value.trim()) {
+                    emailError.textContent = 'Please enter your email or username.';
+                    emailError.classList.remove('hidden');
+                    isValid = false;
+                }
+
+                // Validate password
+                if (!passwordInput.value) {
+                    passwordError.textContent = 'Please enter your password.';
+                    passwordError.classList.remove('hidden');
+                    isValid = false;
+                }
+
+                if (!isValid) {
+                    e.preventDefault();
+                    return;
+                }
+
+                // Show loading state
+                loginBtn.disabled = true;
+                loginBtn.innerHTML = '<i data-lucide="loader-2" class="w-4 h-4 animate-spin"></i><span>Signing in...</span>';
+                lucide.createIcons();
+            });
+        }
+
+        // Clear errors on input
+        if (emailInput) {
+            emailInput.addEventListener('input', function() {
+                emailError.classList.add('hidden');
+            });
+        }
+
+        if (passwordInput) {
+            passwordInput.addEventListener('input', function() {
+                passwordError.classList.add('hidden');
+            });
+        }
+    } catch (error) {
+        console.error('Form validation error:', error);
+    }
+})();
@@ -0,0 +1,329 @@
+// Initialize Lucide icons
+lucide.createIcons();
+
+// Password Toggle - Main Password
+(function() {
+    try {
+        const toggleBtn = document.getElementById('toggle-password');
+        const passwordInput = document.getElementById('password');
+        const eyeOpen = document.getElementById('eye-open');
+        const eyeClosed = document.getElementById('eye-closed');
+
+        if (toggleBtn && passwordInput && eyeOpen && eyeClosed) {
+            toggleBtn.addEventListener('click', function(e) {
+                e.preventDefault();
+                e.stopPropagation();
+
+                if (passwordInput.type === 'password') {
+                    passwordInput.type = 'text';
+                    eyeOpen.classList.add('hidden');
+                    eyeClosed.classList.remove('hidden');
+                } else {
+                    passwordInput.type = 'password';
+                    eyeOpen.classList.remove('hidden');
+                    eyeClosed.classList.add('hidden');
+                }
+            });
+        }
+    } catch (error) {
+        console.error('Password toggle error:', error);
+    }
+})();
+
+// Password Toggle - Confirm Password
+(function() {
+    try {
+        const toggleBtn = document.getElementById('toggle-confirm-password');
+        const passwordInput = document.getElementById('confirm_password');
+        const eyeOpen = document.getElementById('confirm-eye-open');
+        const eyeClosed = document.getElementById('confirm-eye-closed');
+
+        if (toggleBtn && passwordInput && eyeOpen && eyeClosed) {
+            toggleBtn.addEventListener('click', function(e) {
+                e.preventDefault();
+                e.stopPropagation();
+
+                if (passwordInput.type === 'password') {
+                    passwordInput.type = 'text';
+                    eyeOpen.classList.add('hidden');
+                    eyeClosed.classList.remove('hidden');
+                } else {
+                    passwordInput.type = 'password';
+                    eyeOpen.classList.remove('hidden');
+                    eyeClosed.classList.add('hidden');
+                }
+            });
+        }
+    } catch (error) {
+        console.error('Confirm password toggle error:', error);
+    }
+})();
+
+// Password Strength Checker
+(function() {
+    try {
+        const passwordInput = document.getElementById('password');
+        const bars = [
+            document.getElementById('strength-bar-1'),
+            document.getElementById('strength-bar-2'),
+            document.getElementById('strength-bar-3'),
+            document.getElementById('strength-bar-4')
+        ];
+        const strengthText = document.getElementById('strength-text');
+
+        if (passwordInput && strengthText) {
+            passwordInput.addEventListener('input', function() {
+                const password = this.value;
+                let strength = 0;
+
+                if (password.length === 0) {
+                    // Reset all bars
+                    bars.forEach(function(bar) {
+                        bar.className = 'h-1 flex-1 rounded-full bg-gray-200 dark:bg-gray-700 transition-all duration-300';
+                    });
+                    strengthText.textContent = '';
+                    return;
+                }
+
+                // Check strength criteria
+                if (password.length >= 8) strength++;
+                if (/[a-z]/.test(password) && /[A-Z]/.test(password)) strength++;
+                if (/\d/.test(password)) strength++;
+                if (/[!@#$%^&*(),.?":{}|<>]/.test(password)) strength++;
+
+                // Define strength levels
+                var levels = [
+                    { color: 'bg-red-500', text: 'Weak', textColor: 'text-red-500' },
+                    { color: 'bg-orange-500', text: 'Fair', textColor: 'text-orange-500' },
+                    { color: 'bg-yellow-500', text: 'Good', textColor: 'text-yellow-500' },
+                    { color: 'bg-green-500', text: 'Strong', textColor: 'text-green-500' }
+                ];
+
+                var level = levels[strength - 1] || levels[0];
+
+                // Update bars
+                bars.forEach(function(bar, index) {
+                    if (index < strength) {
+                        bar.className = 'h-1 flex-1 rounded-full ' + level.color + ' transition-all duration-300';
+                    } else {
+                        bar.className = 'h-1 flex-1 rounded-full bg-gray-200 dark:bg-gray-700 transition-all duration-300';
+                    }
+                });
+
+                // Update text
+                strengthText.textContent = 'Password strength: ' + level.text;
+                strengthText.className = 'text-xs ' + level.textColor;
+            });
+        }
+    } catch (error) {
+        console.error('Password strength error:', error);
+    }
+})();
+
+// Password Match Checker
+(function() {
+    try {
+        const passwordInput = document.getElementById('password');
+        const confirmInput = document.getElementById('confirm_password');
+        const matchDiv = document.getElementById('password-match');
+        const matchText = document.getElementById('match-text');
+        const matchSuccess = document.getElementById('match-icon-success');
+        const matchError = document.getElementById('match-icon-error');
+
+        function checkMatch() {
+            if (!confirmInput.value) {
+                matchDiv.classList.add('hidden');
+                return;
+            }
+
+            matchDiv.classList.remove('hidden');
+
+            if (passwordInput.value === confirmInput.value) {
+                matchSuccess.classList.remove('hidden');
+                matchError.classList.add('hidden');
+                matchText.textContent = 'Passwords match';
+                matchText.className = 'text-xs text-green-500';
+            } else {
+                matchSuccess.classList.add('hidden');
+                matchError.classList.remove('hidden');
+                matchText.textContent = 'Passwords do not match';
+                matchText.className = 'text-xs text-red-500';
+            }
+            lucide.createIcons();
+        }
+
+        if (passwordInput && confirmInput) {
+            confirmInput.addEventListener('input', checkMatch);
+            passwordInput.addEventListener('input', checkMatch);
+        }
+    } catch (error) {
+        console.error('Password match error:', error);
+    }
+})();
+
+// Form Validation
+(function() {
+    try {
+        const form = document.getElementById('register-form');
+        const registerBtn = document.getElementById('register-btn');
+
+        // Input elements
+        const firstNameInput = document.getElementById('first_name');
+        const usernameInput = document.getElementById('username');
+        const emailInput = document.getElementById('email');
+        const phoneInput = document.getElementById('phone');
+        const passwordInput = document.getElementById('password');
+        const confirmInput = document.getElementById('confirm_password');
+        const agreeTerms = document.getElementById('agree_terms');
+
+        // Error elements
+        const firstNameError = document.getElementById('first-name-error');
+        const usernameError = document.getElementById('username-error');
+        const emailError = document.getElementById('email-error');
+        const phoneError = document.getElementById('phone-error');
+        const passwordError = document.getElementById('password-error');
+        const confirmError = document.getElementById('confirm-password-error');
+        const termsError = document.getElementById('terms-error');
+
+        // Helper function to show error
+        function showError(element, message) {
+            element.textContent = message;
+            element.classList.remove('hidden');
+        }
+
+        // Helper function to hide error
+        function hideError(element) {
+            element.classList.add('hidden');
+        }
+
+        if (form) {
+            form.addEventListener('submit', function(e) {
+                let isValid = true;
+
+                // Clear all previous errors
+                [firstNameError, usernameError, emailError, phoneError, passwordError, confirmError, termsError].forEach(hideError);
+
+                // First name validation
+                if (!firstNameInput.value.trim()) {
+                    showError(firstNameError, 'First name is required.');
+                    isValid = false;
+                } else if (firstNameInput.value.trim().length < 2) {
+                    showError(firstNameError, 'First name must be at least 2 characters.');
+                    isValid = false;
+                }
+
+                // Username validation
+                var username = usernameInput.value.trim();
+                if (!username) {
+                    showError(usernameError, 'Username is required.');
+                    isValid = false;
+                } else if (username.length < 3) {
+                    showError(usernameError, 'Username must be at least 3 characters.');
+                    isValid = false;
+                } else if (username.length > 50) {
+                    showError(usernameError, 'Username must not exceed 50 characters.');
+                    isValid = false;
+                } else if (!/^[a-zA-Z0-9_]+$/.test(username)) {
+                    showError(usernameError, 'Username can only contain letters, numbers, and underscores.');
+                    isValid = false;
+                }
+
+                // Email validation
+                var email = emailInput.value.trim();
+                if (!email) {
+                    showError(emailError, 'Email address is required.');
+                    isValid = false;
+                } else if (!/^[^\s@]+@[^\s@]+\.[^\s@]+$/.test(email)) {
+                    showError(emailError, 'Please enter a valid email address.');
+                    isValid = false;
+                }
+
+                // Phone validation (optional but if provided, validate)
+                var phone = phoneInput.value.trim();
+                if (phone && !/^[+]?[\d\s\-()]{7,20}$/.test(phone)) {
+                    showError(phoneError, 'Please enter a valid phone number.');
+                    isValid = false;
+                }
+
+                // Password validation
+                var password = passwordInput.value;
+                if (!password) {
+                    showError(passwordError, 'Password is required.');
+                    isValid = false;
+                } else if (password.length < 8) {
+                    showError(passwordError, 'Password must be at least 8 characters.');
+                    isValid = false;
+                } else if (!/[A-Z]/.test(password)) {
+                    showError(passwordError, 'Password must contain at least one uppercase letter.');
+                    isValid = false;
+                } else if (!/[a-z]/.test(password)) {
+                    showError(passwordError, 'Password must contain at least one lowercase letter.');
+                    isValid = false;
+                } else if (!/\d/.test(password)) {
+                    showError(passwordError, 'Password must contain at least one number.');
+                    isValid = false;
+                } else if (!/[!@#$%^&*(),.?":{}|<>]/.test(password)) {
+                    showError(passwordError, 'Password must contain at least one special character.');
+                    isValid = false;
+                }
+
+                // Confirm password validation
+                if (!confirmInput.value) {
+                    showError(confirmError, 'Please confirm your password.');
+                    isValid = false;
+                } else if (password !== confirmInput.value) {
+                    showError(confirmError, 'Passwords do not match.');
+                    isValid = false;
+                }
+
+                // Terms agreement
+                if (!agreeTerms.checked) {
+                    showError(termsError, 'You must agree to the Terms of Service and Privacy Policy.');
+                    isValid = false;
+                }
+
+                if (!isValid) {
+                    e.preventDefault();
+                    // Scroll to first error
+                    var firstError = document.querySelector('.text-red-500:not(.hidden)');
+                    if (firstError) {
+                        firstError.scrollIntoView({ behavior: 'smooth', block: 'center' });
+                    }
+                    return;
+                }
+
+                // Show loading state
+                registerBtn.disabled = true;
+                registerBtn.innerHTML = '<i data-lucide="loader-2" class="w-4 h-4 animate-spin"></i><span>Creating Account...</span>';
+                lucide.createIcons();
+            });
+        }
+
+        // Clear errors on input
+        var inputErrorPairs = [
+            [firstNameInput, firstNameError],
+            [usernameInput, usernameError],
+            [emailInput, emailError],
+            [phoneInput, phoneError],
+            [passwordInput, passwordError],
+            [confirmInput, confirmError]
+        ];
+
+        inputErrorPairs.forEach(function(pair) {
+            if (pair[0] && pair[1]) {
+                pair[0].addEventListener('input', function() {
+                    hideError(pair[1]);
+                });
+            }
+        });
+
+        // Clear terms error on change
+        if (agreeTerms && termsError) {
+            agreeTerms.addEventListener('change', function() {
+                hideError(termsError);
+            });
+        }
+    } catch (error) {
+        console.error('Form validation error:', error);
+    }
+})();
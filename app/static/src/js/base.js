@@ -0,0 +1,132 @@
+// ===== Initialize Lucide Icons =====
+try {
+    lucide.createIcons();
+} catch (error) {
+    console.error('Lucide icons initialization error:', error);
+}
+
+// ===== Dark/Light Mode Toggle =====
+function toggleTheme() {
+    try {
+        const html = document.documentElement;
+        const isDark = html.classList.contains('dark');
+
+        if (isDark) {
+            html.classList.remove('dark');
+            localStorage.setItem('theme', 'light');
+        } else {
+            html.classList.add('dark');
+            localStorage.setItem('theme', 'dark');
+        }
+
+        // Re-initialize icons after theme change
+        lucide.createIcons();
+    } catch (error) {
+        console.error('Theme toggle error:', error);
+    }
+}
+
+// Desktop theme toggle
+try {
+    document.getElementById('theme-toggle').addEventListener('click', toggleTheme);
+} catch (error) {
+    console.error('Desktop theme toggle error:', error);
+}
+
+// Mobile theme toggle
+try {
+    document.getElementById('theme-toggle-mobile').addEventListener('click', toggleTheme);
+} catch (error) {
+    console.error('Mobile theme toggle error:', error);
+}
+
+// ===== Mobile Menu Toggle =====
+(function() {
+    try {
+        const mobileMenuBtn = document.getElementById('mobile-menu-btn');
+        const mobileMenu = document.getElementById('mobile-menu');
+        const menuIconOpen = document.getElementById('menu-icon-open');
+        const menuIconClose = document.getElementById('menu-icon-close');
+
+        if (mobileMenuBtn && mobileMenu) {
+            mobileMenuBtn.addEventListener('click', function() {
+                const isOpen = !mobileMenu.classList.contains('hidden');
+
+                if (isOpen) {
+                    mobileMenu.classList.add('hidden');
+                    menuIconOpen.classList.remove('hidden');
+                    menuIconClose.classList.add('hidden');
+                } else {
+                    mobileMenu.classList.remove('hidden');
+                    menuIconOpen.classList.add('hidden');
+                    menuIconClose.classList.remove('hidden');
+                }
+
+                lucide.createIcons();
+            });
+        }
+    } catch (error) {
+        console.error('Mobile menu error:', error);
+    }
+})();
+
+// ===== User Dropdown Toggle =====
+(function() {
+    try {
+        const userMenuBtn = document.getElementById('user-menu-btn');
+        const userDropdown = document.getElementById('user-dropdown');
+
+        if (userMenuBtn && userDropdown) {
+            userMenuBtn.addEventListener('click', function(e) {
+                e.stopPropagation();
+                userDropdown.classList.toggle('hidden');
+            });
+
+            // Close dropdown when clicking outside
+            document.addEventListener('click', function(e) {
+                const container = document.getElementById('user-menu-container');
+                if (container && !container.contains(e.target)) {
+                    userDropdown.classList.add('hidden');
+                }
+            });
+        }
+    } catch (error) {
+        console.error('User dropdown error:', error);
+    }
+})();
+
+// ===== Auto-dismiss Flash Messages =====
+(function() {
+    try {
+        const flashMessages = document.querySelectorAll('.flash-message');
+        flashMessages.forEach(function(msg) {
+            setTimeout(function() {
+                msg.style.opacity = '0';
+                msg.style.transform = 'translateY(-10px)';
+                msg.style.transition = 'all 0.3s ease';
+                setTimeout(function() {
+                    msg.remove();
+                }, 300);
+            }, 5000);
+        });
+    } catch (error) {
+        console.error('Flash message error:', error);
+    }
+})();
+
+// ===== Active Navigation Link =====
+(function() {
+    try {
+        const currentPath = window.location.pathname;
+        const navLinks = document.querySelectorAll('nav a[href]');
+
+        navLinks.forEach(function(link) {
+            if (link.getAttribute('href') === currentPath) {
+                link.classList.add('text-brand', 'dark:text-brand-light');
+                link.classList.remove('text-content-secondary', 'dark:text-content-dark-secondary');
+            }
+        });
+    } catch (error) {
+        console.error('Active nav error:', error);
+    }
+})();
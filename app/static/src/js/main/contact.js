@@ -0,0 +1,79 @@
+// ===== Form Validation =====
+(function() {
+    try {
+        const form = document.getElementById('contact-form');
+        const submitBtn = document.getElementById('submit-btn');
+
+        if (form) {
+            form.addEventListener('submit', function(e) {
+                try {
+                    const name = document.getElementById('name').value.trim();
+                    const email = document.getElementById('email').value.trim();
+                    const subject = document.getElementById('subject').value.trim();
+                    const message = document.getElementById('message').value.trim();
+
+                    // Validation
+                    if (!name || !email || !subject || !message) {
+                        e.preventDefault();
+                        alert('Please fill in all fields.');
+                        return;
+                    }
+
+                    // Email validation
+                    const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+                    if (!emailRegex.test(email)) {
+                        e.preventDefault();
+                        alert('Please enter a valid email address.');
+                        return;
+                    }
+
+                    // Disable button to prevent double submit
+                    submitBtn.disabled = true;
+                    submitBtn.innerHTML = '<i data-lucide="loader-2" class="w-4 h-4 animate-spin"></i><span>Sending...</span>';
+                    lucide.createIcons();
+
+                } catch (error) {
+                    console.error('Form validation error:', error);
+                }
+            });
+        }
+    } catch (error) {
+        console.error('Contact form error:', error);
+    }
+})();
+
+// ===== Real-time Input Validation =====
+(function() {
+    try {
+        const inputs = document.querySelectorAll('#contact-form input, #contact-form textarea');
+
+        inputs.forEach(function(input) {
+            input.addEventListener('blur', function() {
+                try {
+                    if (this.required && !this.value.trim()) {
+                        this.classList.add('border-red-500', 'dark:border-red-500');
+                        this.classList.remove('border-line', 'dark:border-line-dark');
+                    } else {
+                        this.classList.remove('border-red-500', 'dark:border-red-500');
+                        this.classList.add('border-line', 'dark:border-line-dark');
+                    }
+                } catch (error) {
+                    console.error('Input validation error:', error);
+                }
+            });
+
+            input.addEventListener('input', function() {
+                try {
+                    if (this.value.trim()) {
+                        this.classList.remove('border-red-500', 'dark:border-red-500');
+                        this.classList.add('border-line', 'dark:border-line-dark');
+                    }
+                } catch (error) {
+                    console.error('Input clear error:', error);
+                }
+            });
+        });
+    } catch (error) {
+        console.error('Real-time validation error:', error);
+    }
+})();
@@ -0,0 +1,83 @@
+// ===== FAQ Accordion =====
+(function() {
+    try {
+        const toggles = document.querySelectorAll('.faq-toggle');
+
+        toggles.forEach(function(toggle) {
+            toggle.addEventListener('click', function() {
+                try {
+                    const item = this.closest('.faq-item');
+                    const answer = item.querySelector('.faq-answer');
+                    const icon = item.querySelector('.faq-icon');
+                    const isOpen = !answer.classList.contains('hidden');
+
+                    // Close all others
+                    document.querySelectorAll('.faq-item').forEach(function(otherItem) {
+                        if (otherItem !== item) {
+                            otherItem.querySelector('.faq-answer').classList.add('hidden');
+                            otherItem.querySelector('.faq-icon').classList.remove('rotate-180');
+                            otherItem.classList.remove('border-brand/30', 'dark:border-brand-light/30');
+                        }
+                    });
+
+                    // Toggle current
+                    if (isOpen) {
+                        answer.classList.add('hidden');
+                        icon.classList.remove('rotate-180');
+                        item.classList.remove('border-brand/30', 'dark:border-brand-light/30');
+                    } else {
+                        answer.classList.remove('hidden');
+                        icon.classList.add('rotate-180');
+                        item.classList.add('border-brand/30', 'dark:border-brand-light/30');
+                    }
+                } catch (error) {
+                    console.error('FAQ toggle error:', error);
+                }
+            });
+        });
+    } catch (error) {
+        console.error('FAQ accordion error:', error);
+    }
+})();
+
+// ===== FAQ Category Filter =====
+(function() {
+    try {
+        const categoryBtns = document.querySelectorAll('.faq-cat-btn');
+        const faqItems = document.querySelectorAll('.faq-item');
+
+        categoryBtns.forEach(function(btn) {
+            btn.addEventListener('click', function() {
+                try {
+                    const category = this.getAttribute('data-category');
+
+                    // Update active button
+                    categoryBtns.forEach(function(b) {
+                        b.classList.remove('bg-brand', 'dark:bg-brand-light', 'text-white');
+                        b.classList.add('bg-bg-main', 'dark:bg-bg-dark-main', 'text-content-secondary', 'dark:text-content-dark-secondary', 'border', 'border-line', 'dark:border-line-dark');
+                    });
+                    this.classList.add('bg-brand', 'dark:bg-brand-light', 'text-white');
+                    this.classList.remove('bg-bg-main', 'dark:bg-bg-dark-main', 'text-content-secondary', 'dark:text-content-dark-secondary', 'border', 'border-line', 'dark:border-line-dark');
+
+                    // Filter items
+                    faqItems.forEach(function(item) {
+                        if (category === 'all' || item.getAttribute('data-category') === category) {
+                            item.classList.remove('hidden');
+                        } else {
+                            item.classList.add('hidden');
+                        }
+
+                        // Close all answers when filtering
+                        item.querySelector('.faq-answer').classList.add('hidden');
+                        item.querySelector('.faq-icon').classList.remove('rotate-180');
+                        item.classList.remove('border-brand/30', 'dark:border-brand-light/30');
+                    });
+                } catch (error) {
+                    console.error('FAQ filter error:', error);
+                }
+            });
+        });
+    } catch (error) {
+        console.error('FAQ category error:', error);
+    }
+})();
@@ -0,0 +1,26 @@
+// ===== Set minimum date for check-in to today =====
+(function() {
+    try {
+        const today = new Date().toISOString().split('T')[0];
+        const checkInInput = document.querySelector('input[name="check_in"]');
+        const checkOutInput = document.querySelector('input[name="check_out"]');
+
+        if (checkInInput) {
+            checkInInput.setAttribute('min', today);
+            checkInInput.addEventListener('change', function() {
+                if (checkOutInput) {
+                    checkOutInput.setAttribute('min', this.value);
+                    if (checkOutInput.value && checkOutInput.value <= this.value) {
+                        checkOutInput.value = '';
+                    }
+                }
+            });
+        }
+
+        if (checkOutInput) {
+            checkOutInput.setAttribute('min', today);
+        }
+    } catch (error) {
+        console.error('Date picker error:', error);
+    }
+})();
@@ -0,0 +1,59 @@
+// ===== Mobile Filter Toggle =====
+(function() {
+    try {
+        const filterToggle = document.getElementById('filter-toggle');
+        const filterPanel = document.getElementById('filter-panel');
+        const filterIcon = document.getElementById('filter-icon');
+
+        if (filterToggle && filterPanel) {
+            filterToggle.addEventListener('click', function() {
+                filterPanel.classList.toggle('hidden');
+                filterIcon.classList.toggle('rotate-180');
+            });
+        }
+    } catch (error) {
+        console.error('Filter toggle error:', error);
+    }
+})();
+
+// ===== Server-side Sorting =====
+(function() {
+    try {
+        const sortSelect = document.getElementById('sort-select');
+        const filterForm = document.getElementById('filter-form');
+
+        if (sortSelect && filterForm) {
+            sortSelect.addEventListener('change', function() {
+                filterForm.submit();
+            });
+        }
+    } catch (error) {
+        console.error('Sort init error:', error);
+    }
+})();
+
+// ===== Date Validation =====
+(function() {
+    try {
+        const today = new Date().toISOString().split('T')[0];
+        const checkIn = document.querySelector('input[name="check_in"]');
+        const checkOut = document.querySelector('input[name="check_out"]');
+
+        if (checkIn) {
+            checkIn.setAttribute('min', today);
+            checkIn.addEventListener('change', function() {
+                if (checkOut) {
+                    checkOut.setAttribute('min', this.value);
+                    if (checkOut.value && checkOut.value <= this.value) {
+                        checkOut.value = '';
+                    }
+                }
+            });
+        }
+        if (checkOut) {
+            checkOut.setAttribute('min', today);
+        }
+    } catch (error) {
+        console.error('Date validation error:', error);
+    }
+})();
@@ -0,0 +1,305 @@
+// Initialize Lucide icons
+lucide.createIcons();
+
+// ================================
+// Password Toggle Helper
+// ================================
+function setupToggle(toggleId, inputId, eyeOpenId, eyeClosedId) {
+    try {
+        var toggleBtn = document.getElementById(toggleId);
+        var input = document.getElementById(inputId);
+        var eyeOpen = document.getElementById(eyeOpenId);
+        var eyeClosed = document.getElementById(eyeClosedId);
+
+        if (toggleBtn && input && eyeOpen && eyeClosed) {
+            toggleBtn.addEventListener('click', function(e) {
+                e.preventDefault();
+                e.stopPropagation();
+
+                if (input.type === 'password') {
+                    input.type = 'text';
+                    eyeOpen.classList.add('hidden');
+                    eyeClosed.classList.remove('hidden');
+                } else {
+                    input.type = 'password';
+                    eyeOpen.classList.remove('hidden');
+                    eyeClosed.classList.add('hidden');
+                }
+            });
+        }
+    } catch (error) {
+        console.error('Toggle error:', error);
+    }
+}
+
+// Setup all three toggles
+setupToggle('toggle-current', 'current_password', 'current-eye-open', 'current-eye-closed');
+setupToggle('toggle-new', 'new_password', 'new-eye-open', 'new-eye-closed');
+setupToggle('toggle-confirm', 'confirm_password', 'confirm-eye-open', 'confirm-eye-closed');
+
+// ================================
+// Password Strength Checker
+// ================================
+(function() {
+    try {
+        var newPasswordInput = document.getElementById('new_password');
+        var bars = [
+            document.getElementById('strength-bar-1'),
+            document.getElementById('strength-bar-2'),
+            document.getElementById('strength-bar-3'),
+            document.getElementById('strength-bar-4')
+        ];
+        var strengthText = document.getElementById('strength-text');
+
+        if (newPasswordInput && strengthText) {
+            newPasswordInput.addEventListener('input', function() {
+                var password = this.value;
+                var strength = 0;
+
+                if (password.length === 0) {
+                    bars.forEach(function(bar) {
+                        bar.className = 'h-1 flex-1 rounded-full bg-gray-200 dark:bg-gray-700 transition-all duration-300';
+                    });
+                    strengthText.textContent = '';
+                    return;
+                }
+
+                if (password.length >= 8) strength++;
+                if (/[a-z]/.test(password) && /[A-Z]/.test(password)) strength++;
+                if (/\d/.test(password)) strength++;
+                if (/[!@#$%^&*(),.?":{}|<>]/.test(password)) strength++;
+
+                var levels = [
+                    { color: 'bg-red-500', text: 'Weak', textColor: 'text-red-500' },
+                    { color: 'bg-orange-500', text: 'Fair', textColor: 'text-orange-500' },
+                    { color: 'bg-yellow-500', text: 'Good', textColor: 'text-yellow-500' },
+                    { color: 'bg-green-500', text: 'Strong', textColor: 'text-green-500' }
+                ];
+
+                var level = levels[strength - 1] || levels[0];
+
+                bars.forEach(function(bar, index) {
+                    if (index < strength) {
+                        bar.className = 'h-1 flex-1 rounded-full ' + level.color + ' transition-all duration-300';
+                    } else {
+                        bar.className = 'h-1 flex-1 rounded-full bg-gray-200 dark:bg-gray-700 transition-all duration-300';
+                    }
+                });
+
+                strengthText.textContent = 'Password strength: ' + level.text;
+                strengthText.className = 'text-xs ' + level.textColor;
+            });
+        }
+    } catch (error) {
+        console.error('Password strength error:', error);
+    }
+})();
+
+// ================================
+// Live Password Requirements Check
+// ================================
+(function() {
+    try {
+        var newPasswordInput = document.getElementById('new_password');
+
+        var requirements = [
+            { id: 'req-length', iconId: 'req-length-icon', test: function(p) { return p.length >= 8; } },
+            { id: 'req-upper', iconId: 'req-upper-icon', test: function(p) { return /[A-Z]/.test(p); } },
+            { id: 'req-lower', iconId: 'req-lower-icon', test: function(p) { return /[a-z]/.test(p); } },
+            { id: 'req-number', iconId: 'req-number-icon', test: function(p) { return /\d/.test(p); } },
+            { id: 'req-special', iconId: 'req-special-icon', test: function(p) { return /[!@#$%^&*(),.?":{}|<>]/.test(p); } }
+        ];
+
+        if (newPasswordInput) {
+            newPasswordInput.addEventListener('input', function() {
+                var password = this.value;
+
+                requirements.forEach(function(req) {
+                    var li = document.getElementById(req.id);
+                    var icon = document.getElementById(req.iconId);
+
+                    if (!li || !icon) return;
+
+                    if (password.length === 0) {
+                        // Reset to default
+                        li.className = 'flex items-center space-x-2 text-xs text-content-secondary dark:text-content-dark-secondary';
+                        icon.setAttribute('data-lucide', 'circle');
+                        icon.className = 'w-3 h-3 flex-shrink-0';
+                    } else if (req.test(password)) {
+                        // Passed
+                        li.className = 'flex items-center space-x-2 text-xs text-green-600 dark:text-green-400';
+                        icon.setAttribute('data-lucide', 'check-circle');
+                        icon.className = 'w-3 h-3 flex-shrink-0 text-green-500';
+                    } else {
+                        // Failed
+                        li.className = 'flex items-center space-x-2 text-xs text-red-500 dark:text-red-400';
+                        icon.setAttribute('data-lucide', 'x-circle');
+                        icon.className = 'w-3 h-3 flex-shrink-0 text-red-500';
+                    }
+                });
+
+                // Re-render icons
+                lucide.createIcons();
+            });
+        }
+    } catch (error) {
+        console.error('Requirements check error:', error);
+    }
+})();
+
+// ================================
+// Password Match Checker
+// ================================
+(function() {
+    try {
+        var newPasswordInput = document.getElementById('new_password');
+        var confirmInput = document.getElementById('confirm_password');
+        var matchDiv = document.getElementById('password-match');
+        var matchText = document.getElementById('match-text');
+        var matchSuccess = document.getElementById('match-icon-success');
+        var matchError = document.getElementById('match-icon-error');
+
+        function checkMatch() {
+            if (!confirmInput.value) {
+                matchDiv.classList.add('hidden');
+                return;
+            }
+
+            matchDiv.classList.remove('hidden');
+
+            if (newPasswordInput.value === confirmInput.value) {
+                matchSuccess.classList.remove('hidden');
+                matchError.classList.add('hidden');
+                matchText.textContent = 'Passwords match';
+                matchText.className = 'text-xs text-green-500';
+            } else {
+                matchSuccess.classList.add('hidden');
+                matchError.classList.remove('hidden');
+                matchText.textContent = 'Passwords do not match';
+                matchText.className = 'text-xs text-red-500';
+            }
+            lucide.createIcons();
+        }
+
+        if (newPasswordInput && confirmInput) {
+            confirmInput.addEventListener('input', checkMatch);
+            newPasswordInput.addEventListener('input', checkMatch);
+        }
+    } catch (error) {
+        console.error('Password match error:', error);
+    }
+})();
+
+// ================================
+// Form Validation
+// ================================
+(function() {
+    try {
+        var form = document.getElementById('change-password-form');
+        var updateBtn = document.getElementById('update-btn');
+
+        // Input elements
+        var currentInput = document.getElementById('current_password');
+        var newInput = document.getElementById('new_password');
+        var confirmInput = document.getElementById('confirm_password');
+
+        // Error elements
+        var currentError = document.getElementById('current-password-error');
+        var newError = document.getElementById('new-password-error');
+        var confirmError = document.getElementById('confirm-password-error');
+
+        function showError(element, message) {
+            element.textContent = message;
+            element.classList.remove('hidden');
+        }
+
+        function hideError(element) {
+            element.classList.add('hidden');
+        }
+
+        if (form) {
+            form.addEventListener('submit', function(e) {
+                var isValid = true;
+
+                // Clear previous errors
+                hideError(currentError);
+                hideError(newError);
+                hideError(confirmError);
+
+                // Current password validation
+                if (!currentInput.value) {
+                    showError(currentError, 'Current password is required.');
+                    isValid = false;
+                }
+
+                // New password validation
+                var newPassword = newInput.value;
+                if (!newPassword) {
+                    showError(newError, 'New password is required.');
+                    isValid = false;
+                } else if (newPassword.length < 8) {
+                    showError(newError, 'Password must be at least 8 characters.');
+                    isValid = false;
+                } else if (!/[A-Z]/.test(newPassword)) {
+                    showError(newError, 'Password must contain at least one uppercase letter.');
+                    isValid = false;
+                } else if (!/[a-z]/.test(newPassword)) {
+                    showError(newError, 'Password must contain at least one lowercase letter.');
+                    isValid = false;
+                } else if (!/\d/.test(newPassword)) {
+                    showError(newError, 'Password must contain at least one number.');
+                    isValid = false;
+                } else if (!/[!@#$%^&*(),.?":{}|<>]/.test(newPassword)) {
+                    showError(newError, 'Password must contain at least one special character.');
+                    isValid = false;
+                }
+
+                // Check new !== current (client-side basic check)
+                if (currentInput.value && newPassword && currentInput.value === newPassword) {
+                    showError(newError, 'New password must be different from your current password.');
+                    isValid = false;
+                }
+
+                // Confirm password validation
+                if (!confirmInput.value) {
+                    showError(confirmError, 'Please confirm your new password.');
+                    isValid = false;
+                } else if (newPassword !== confirmInput.value) {
+                    showError(confirmError, 'Passwords do not match.');
+                    isValid = false;
+                }
+
+                if (!isValid) {
+                    e.preventDefault();
+                    var firstError = document.querySelector('.text-red-500:not(.hidden)');
+                    if (firstError) {
+                        firstError.scrollIntoView({ behavior: 'smooth', block: 'center' });
+                    }
+                    return;
+                }
+
+                // Show loading state
+                updateBtn.disabled = true;
+                updateBtn.innerHTML = '<i data-lucide="loader-2" class="w-4 h-4 animate-spin"></i><span>Updating...</span>';
+                lucide.createIcons();
+            });
+        }
+
+        // Clear errors on input
+        var inputErrorPairs = [
+            [currentInput, currentError],
+            [newInput, newError],
+            [confirmInput, confirmError]
+        ];
+
+        inputErrorPairs.forEach(function(pair) {
+            if (pair[0] && pair[1]) {
+                pair[0].addEventListener('input', function() {
+                    hideError(pair[1]);
+                });
+            }
+        });
+    } catch (error) {
+        console.error('Form validation error:', error);
+    }
+})();
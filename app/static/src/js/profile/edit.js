@@ -0,0 +1,133 @@
+// Initialize Lucide icons
+lucide.createIcons();
+
+// ================================
+// Unsaved Changes Detection
+// ================================
+(function() {
+    try {
+        var form = document.getElementById('edit-form');
+        var hasChanges = false;
+        var isSubmitting = false;
+
+        // Track original values
+        var originalValues = {};
+        var editableInputs = form.querySelectorAll('input:not([type="hidden"]):not([disabled])');
+
+        editableInputs.forEach(function(input) {
+            originalValues[input.name] = input.value;
+
+            input.addEventListener('input', function() {
+                hasChanges = false;
+                editableInputs.forEach(function(inp) {
+                    if (inp.value !== originalValues[inp.name]) {
+                        hasChanges = true;
+                    }
+                });
+            });
+        });
+
+        // Mark as submitting on form submit
+        form.addEventListener('submit', function() {
+            isSubmitting = true;
+        });
+
+        // Warn on page leave
+        window.addEventListener('beforeunload', function(e) {
+            if (hasChanges && !isSubmitting) {
+                e.preventDefault();
+                e.returnValue = '';
+            }
+        });
+    } catch (error) {
+        console.error('Unsaved changes detection error:', error);
+    }
+})();
+
+// ================================
+// Form Validation
+// ================================
+(function() {
+    try {
+        var form = document.getElementById('edit-form');
+        var saveBtn = document.getElementById('save-btn');
+
+        // Input elements
+        var firstNameInput = document.getElementById('first_name');
+        var phoneInput = document.getElementById('phone');
+
+        // Error elements
+        var firstNameError = document.getElementById('first-name-error');
+        var phoneError = document.getElementById('phone-error');
+
+        // Helper functions
+        function showError(element, message) {
+            element.textContent = message;
+            element.classList.remove('hidden');
+        }
+
+        function hideError(element) {
+            element.classList.add('hidden');
+        }
+
+        if (form) {
+            form.addEventListener('submit', function(e) {
+                var isValid = true;
+
+                // Clear previous errors
+                hideError(firstNameError);
+                hideError(phoneError);
+
+                // First name validation
+                var firstName = firstNameInput.value.trim();
+                if (!firstName) {
+                    showError(firstNameError, 'First name is required.');
+                    isValid = false;
+                } else if (firstName.length < 2) {
+                    showError(firstNameError, 'First name must be at least 2 characters.');
+                    isValid = false;
+                } else if (firstName.length > 50) {
+                    showError(firstNameError, 'First name must not exceed 50 characters.');
+                    isValid = false;
+                }
+
+                // Phone validation (optional)
+                var phone = phoneInput.value.trim();
+                if (phone && !/^[+]?[\d\s\-()]{7,20}$/.test(phone)) {
+                    showError(phoneError, 'Please enter a valid phone number.');
+                    isValid = false;
+                }
+
+                if (!isValid) {
+                    e.preventDefault();
+                    // Scroll to first error
+                    var firstError = document.querySelector('.text-red-500:not(.hidden)');
+                    if (firstError) {
+                        firstError.scrollIntoView({ behavior: 'smooth', block: 'center' });
+                    }
+                    return;
+                }
+
+                // Show loading state
+                saveBtn.disabled = true;
+                saveBtn.innerHTML = '<i data-lucide="loader-2" class="w-4 h-4 animate-spin"></i><span>Saving...</span>';
+                lucide.createIcons();
+            });
+        }
+
+        // Clear errors on input
+        if (firstNameInput && firstNameError) {
+            firstNameInput.addEventListener('input', function() {
+                hideError(firstNameError);
+            });
+        }
+
+        if (phoneInput && phoneError) {
+            phoneInput.addEventListener('input', function() {
+                hideError(phoneError);
+            });
+        }
+    } catch (error) {
+        console.error('Form validation error:', error);
+    }
+})();
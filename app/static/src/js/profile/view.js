@@ -0,0 +1,76 @@
+// Initialize Lucide icons
+lucide.createIcons();
+
+// ================================
+// Delete Account Modal
+// ================================
+(function() {
+    try {
+        const deleteBtn = document.getElementById('delete-account-btn');
+        const modal = document.getElementById('delete-modal');
+        const backdrop = document.getElementById('delete-modal-backdrop');
+        const closeBtn = document.getElementById('close-modal-btn');
+        const cancelBtn = document.getElementById('cancel-delete-btn');
+        const deleteForm = document.getElementById('delete-form');
+        const deletePassword = document.getElementById('delete_password');
+        const deletePasswordError = document.getElementById('delete-password-error');
+        const confirmDeleteBtn = document.getElementById('confirm-delete-btn');
+
+        // Open modal
+        if (deleteBtn && modal) {
+            deleteBtn.addEventListener('click', function() {
+                modal.classList.remove('hidden');
+                document.body.style.overflow = 'hidden';
+                deletePassword.value = '';
+                deletePasswordError.classList.add('hidden');
+                deletePassword.focus();
+            });
+        }
+
+        // Close modal function
+        function closeModal() {
+            modal.classList.add('hidden');
+            document.body.style.overflow = '';
+            deletePassword.value = '';
+            deletePasswordError.classList.add('hidden');
+        }
+
+        // Close modal events
+        if (closeBtn) closeBtn.addEventListener('click', closeModal);
+        if (cancelBtn) cancelBtn.addEventListener('click', closeModal);
+        if (backdrop) backdrop.addEventListener('click', closeModal);
+
+        // Close on Escape key
+        document.addEventListener('keydown', function(e) {
+            if (e.key === 'Escape' && !modal.classList.contains('hidden')) {
+                closeModal();
+            }
+        });
+
+        // Form validation
+        if (deleteForm) {
+            deleteForm.addEventListener('submit', function(e) {
+                if (!deletePassword.value.trim()) {
+                    e.preventDefault();
+                    deletePasswordError.textContent = 'Password is required to delete your account.';
+                    deletePasswordError.classList.remove('hidden');
+                    return;
+                }
+
+                // Show loading state
+                confirmDeleteBtn.disabled = true;
+                confirmDeleteBtn.innerHTML = '<i data-lucide="loader-2" class="w-4 h-4 animate-spin"></i><span>Deleting...</span>';
+                lucide.createIcons();
+            });
+        }
+
+        // Clear error on input
+        if (deletePassword) {
+            deletePassword.addEventListener('input', function() {
+                deletePasswordError.classList.add('hidden');
+            });
+        }
+    } catch (error) {
+        console.error('Delete modal error:', error);
+    }
+})();
@@ -0,0 +1,47 @@
+tailwind.config = {
+    darkMode: 'class',
+    theme: {
+        extend: {
+            colors: {
+                brand: {
+                    DEFAULT: '#3B82F6',
+                    hover: '#2563EB',
+                    light: '#60A5FA',
+                    'light-hover': '#3B82F6'
+                },
+                bg: {
+                    main: '#F8FAFC',
+                    surface: '#FFFFFF',
+                    'dark-main': '#0B1220',
+                    'dark-surface': '#111827'
+                },
+                content: {
+                    primary: '#0F172A',
+                    secondary: '#475569',
+                    'dark-primary': '#E5E7EB',
+                    'dark-secondary': '#9CA3AF'
+                },
+                line: {
+                    DEFAULT: '#E2E8F0',
+                    dark: '#1F2937'
+                },
+                state: {
+                    success: '#22C55E'
+                },
+                logo: {
+                    primary: '#3B82F6',
+                    'text-light': '#0F172A',
+                    'text-dark': '#FFFFFF',
+                    'gradient-start': '#3B82F6',
+                    'gradient-end': '#06B6D4'
+                }
+            },
+            fontFamily: {
+                sans: ['Inter', 'system-ui', 'sans-serif'],
+            },
+            backgroundImage: {
+                'logo-gradient': 'linear-gradient(to right, #3B82F6, #06B6D4)',
+            },
+        }
+    }
+}
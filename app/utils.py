@@ -1,9 +1,13 @@
 import re
-import random
+import json
+import base64
+import secrets
 import string
-from flask import flash, url_for
+from datetime import datetime
+from flask import current_app, flash, url_for
 from flask_mail import Message
-from app.extensions import mail
+from app.services.email_templates import render_email
+from app.services.mail_outbox import queue_mail
 
 
 # ============== VALIDATION FUNCTIONS ==============
@@ -72,11 +76,52 @@ def validate_username(username):
     return True, ""
 
 
+# ============== PARSING FUNCTIONS ==============
+
+def parse_date(value):
+    """Parse a YYYY-MM-DD string, returning None if missing or invalid"""
+    try:
+        return datetime.strptime(value.strip(), '%Y-%m-%d').date()
+    except (AttributeError, ValueError):
+        return None
+
+
+def parse_number(value, cast=float):
+    """Parse an optional numeric query arg, returning None if missing or invalid"""
+    try:
+        if value is None or str(value).strip() == '':
+            return None
+        return cast(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def encode_cursor(values):
+    """Encode a keyset position (e.g. sort value + id) as an opaque URL-safe token"""
+    raw = json.dumps(list(values), separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    """Decode a token from encode_cursor, returning None if missing or tampered with"""
+    if not token:
+        return None
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if (isinstance(values, list) and len(values) == 2
+                and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values)):
+            return values
+    except (ValueError, TypeError):
+        pass
+    return None
+
+
 # ============== OTP FUNCTIONS ==============
 
 def generate_otp(length=6):
     """Generate a random OTP code"""
-    return ''.join(random.choices(string.digits, k=length))
+    return ''.join(secrets.choice(string.digits) for _ in range(length))
 
 
 # ============== EMAIL FUNCTIONS ==============
@@ -88,43 +133,14 @@ def send_otp_email(email, otp_code, username):
             subject='QuickStay - Password Reset OTP',
             recipients=[email]
         )
-        
-        msg.html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .otp-box {{ background: #f4f4f4; padding: 20px; text-align: center; font-size: 24px; font-weight: bold; letter-spacing: 5px; }}
-                .footer {{ margin-top: 20px; font-size: 12px; color: #666; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h2>Password Reset Request</h2>
-                <p>Hello {username},</p>
-                <p>You requested to reset your password. Use the OTP code below:</p>
-                
-                <div class="otp-box">{otp_code}</div>
-                
-                <p><strong>This code will expire in 10 minutes.</strong></p>
-                
-                <p>If you didn't request this, please ignore this email.</p>
-                
-                <div class="footer">
-                    <p>© 2026 QuickStay. All rights reserved.</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        
-        mail.send(msg)
-        return True, "OTP sent successfully"
-    
+        msg.html, msg.body = render_email('otp', username=username, otp_code=otp_code,
+                                           expires_minutes=current_app.config['OTP_TTL'] // 60)
+
+        queue_mail(msg)
+        return True, "OTP email queued"
+
     except Exception as e:
-        return False, f"Failed to send email: {str(e)}"
+        return False, f"Failed to queue email: {str(e)}"
 
 
 def send_welcome_email(email, username):
@@ -134,115 +150,31 @@ def send_welcome_email(email, username):
             subject='Welcome to QuickStay!',
             recipients=[email]
         )
-        
-        msg.html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .header {{ background: #4F46E5; color: white; padding: 20px; text-align: center; }}
-                .content {{ padding: 20px; }}
-                .footer {{ margin-top: 20px; font-size: 12px; color: #666; text-align: center; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>Welcome to QuickStay!</h1>
-                </div>
-                <div class="content">
-                    <p>Hello {username},</p>
-                    <p>Thank you for registering with QuickStay. Your account has been successfully created!</p>
-                    <p>You can now:</p>
-                    <ul>
-                        <li>Browse available rooms</li>
-                        <li>Make bookings</li>
-                        <li>Manage your profile</li>
-                        <li>Leave reviews</li>
-                    </ul>
-                    <p>If you have any questions, feel free to contact our support team.</p>
-                </div>
-                <div class="footer">
-                    <p>© 2026 QuickStay. All rights reserved.</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        
-        mail.send(msg)
-        return True, "Welcome email sent"
-    
+        msg.html, msg.body = render_email('welcome', username=username)
+
+        queue_mail(msg)
+        return True, "Welcome email queued"
+
     except Exception as e:
-        return False, f"Failed to send email: {str(e)}"
-    
+        return False, f"Failed to queue email: {str(e)}"
+
+
 def send_password_reset_confirmation_email(email, username):
     """Send confirmation email after password reset"""
     try:
-        from datetime import datetime
-        
         msg = Message(
             subject='QuickStay - Password Reset Successful',
             recipients=[email]
         )
-        
-        current_time = datetime.utcnow().strftime('%B %d, %Y at %I:%M %p UTC')
-        
-        msg.html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .header {{ background: #4F46E5; color: white; padding: 30px; text-align: center; border-radius: 10px 10px 0 0; }}
-                .content {{ background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px; }}
-                .success-icon {{ font-size: 48px; margin-bottom: 10px; }}
-                .info-box {{ background: #fff; border-left: 4px solid #4F46E5; padding: 15px; margin: 20px 0; }}
-                .warning-box {{ background: #FEF3C7; border-left: 4px solid #F59E0B; padding: 15px; margin: 20px 0; }}
-                .button {{ display: inline-block; background: #4F46E5; color: #ffffff !important; padding: 12px 30px; text-decoration: none; border-radius: 5px; margin-top: 20px; font-weight: bold; }}
-                .footer {{ margin-top: 30px; font-size: 12px; color: #666; text-align: center; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <div class="success-icon">🔐</div>
-                    <h1>Password Reset Successful</h1>
-                </div>
-                <div class="content">
-                    <p>Hello {username},</p>
-                    
-                    <p>Your password has been successfully reset on <strong>{current_time}</strong>.</p>
-                    
-                    <div class="info-box">
-                        <strong>✅ What happened:</strong>
-                        <p style="margin: 5px 0 0 0;">Your QuickStay account password was changed. You can now log in with your new password.</p>
-                    </div>
-                    
-                    <div class="warning-box">
-                        <strong>⚠️ Didn't make this change?</strong>
-                        <p style="margin: 5px 0 0 0;">If you didn't reset your password, please contact our support team immediately or reset your password again to secure your account.</p>
-                    </div>
-                    
-                    <center>
-                        <a href="{url_for('auth.login')}" class="button" style="color: #ffffff !important;">Login to Your Account</a>
-                    </center>
-                    
-                    <div class="footer">
-                        <p>This is an automated security notification from QuickStay.</p>
-                        <p>© 2026 QuickStay. All rights reserved.</p>
-                    </div>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        
-        mail.send(msg)
-        return True, "Password reset confirmation email sent"
-    
+        msg.html, msg.body = render_email(
+            'password_reset',
+            username=username,
+            reset_time=datetime.utcnow().strftime('%B %d, %Y at %I:%M %p UTC'),
+            login_url=url_for('auth.login', _external=True)
+        )
+
+        queue_mail(msg)
+        return True, "Password reset confirmation email queued"
+
     except Exception as e:
-        return False, f"Failed to send email: {str(e)}"
\ No newline at end of file
+        return False, f"Failed to queue email: {str(e)}"
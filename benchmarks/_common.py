@@ -0,0 +1,75 @@
+"""Shared helpers for the benchmark scripts"""
+import os
+import random
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+from app import create_app
+from app.config import config, TestingConfig
+from app.extensions import db
+
+ROOM_TYPES = ['Standard', 'Deluxe', 'Premium', 'Family']
+
+
+def make_app(db_path=None, **settings):
+    """Create an app bound to a throwaway on-disk SQLite database (settings override config)"""
+    if db_path is None:
+        db_path = os.path.join(tempfile.mkdtemp(prefix='quickstay-bench-'), 'bench.db')
+
+    class BenchmarkConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{db_path}'
+
+    for name, value in settings.items():
+        setattr(BenchmarkConfig, name, value)
+
+    config['benchmark'] = BenchmarkConfig
+    app = create_app('benchmark')
+    return app
+
+
+def timed(fn, repeat=5):
+    """Run fn `repeat` times, returning (best_seconds, last_result)"""
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def seed_inventory(rooms=10_000, bookings=1_000_000, horizon_days=365, chunk=50_000, seed=42):
+    """Bulk insert a user, `rooms` rooms and `bookings` bookings spread over the horizon"""
+    from app.models.user import User
+    from app.models.room import Room
+    from app.models.bookings import Booking
+
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    today = date.today()
+
+    db.session.execute(db.insert(User), [{
+        'first_name': 'Bench', 'username': 'bench', 'email': 'bench@example.com',
+        'password_hash': 'x', 'role': 'user', 'is_active': True, 'create_at': now
+    }])
+    db.session.execute(db.insert(Room), [{
+        'name': f'Room {i}', 'room_type': ROOM_TYPES[i % len(ROOM_TYPES)],
+        'price_per_night': float(50 + (i * 7) % 450), 'max_guests': 1 + i % 6,
+        'status': 'available', 'rating': 0.0, 'created_at': now
+    } for i in range(1, rooms + 1)])
+
+    statuses = ['confirmed', 'confirmed', 'pending', 'cancelled', 'rejected']
+    for offset in range(0, bookings, chunk):
+        batch = []
+        for _ in range(min(chunk, bookings - offset)):
+            check_in = today + timedelta(days=rng.randrange(horizon_days))
+            nights = rng.randint(1, 7)
+            batch.append({
+                'user_id': 1, 'room_id': rng.randint(1, rooms),
+                'check_in_date': check_in, 'check_out_date': check_in + timedelta(days=nights),
+                'guests_count': 1, 'total_price': nights * 100.0,
+                'status': rng.choice(statuses), 'created_at': now
+            })
+        db.session.execute(db.insert(Booking), batch)
+    db.session.commit()
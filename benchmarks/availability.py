@@ -0,0 +1,51 @@
+"""
+Availability search benchmark.
+
+Compares the per-room `Room.is_available_for_dates` loop (one query per
+room) with the single anti-join `Room.search_available` query as the room
+count grows, over 10k rooms / 1M bookings by default.
+
+Usage: python -m benchmarks.availability [--rooms N] [--bookings N]
+"""
+import argparse
+from datetime import date, timedelta
+
+from app.extensions import db
+from app.models.room import Room
+from benchmarks._common import make_app, seed_inventory, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rooms', type=int, default=10_000)
+    parser.add_argument('--bookings', type=int, default=1_000_000)
+    parser.add_argument('--skip-loop-above', type=int, default=2_500,
+                        help='skip the slow per-room loop above this many rooms')
+    args = parser.parse_args()
+
+    app = make_app()
+    with app.app_context():
+        db.create_all()
+        print(f"Seeding {args.rooms:,} rooms / {args.bookings:,} bookings...")
+        seed_inventory(rooms=args.rooms, bookings=args.bookings)
+
+        check_in = date.today() + timedelta(days=30)
+        check_out = check_in + timedelta(days=3)
+
+        print(f"{'rooms':>8} {'anti-join (ms)':>16} {'free':>7} {'per-room loop (ms)':>20}")
+        for count in sorted({args.rooms // 10, args.rooms // 4, args.rooms // 2, args.rooms}):
+            search = Room.search_available(check_in, check_out).filter(Room.id <= count)
+            joined, free = timed(lambda: search.all())
+
+            loop_ms = '-'
+            if count <= args.skip_loop_above:
+                rooms = Room.query.filter(Room.id <= count).all()
+                loop, _ = timed(lambda: [r for r in rooms if r.is_available_for_dates(check_in, check_out)],
+                                repeat=1)
+                loop_ms = f"{loop * 1000:.1f}"
+
+            print(f"{count:>8,} {joined * 1000:>16.1f} {len(free):>7,} {loop_ms:>20}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Bulk mail throughput benchmark.
+
+Sends N messages to a local SMTP stand-in, first with one mail.send()
+(= one SMTP connection) per message, then with BulkMailer over a small
+pool of long-lived connections. A local server has no network latency
+or TLS handshake, so the gap against a real provider is much larger.
+
+Usage: python -m benchmarks.bulk_mail [--messages N] [--connections N]
+"""
+import argparse
+import time
+
+from flask_mail import Message
+
+from app.extensions import mail
+from app.services.bulk_mailer import BulkMailer
+from benchmarks._common import make_app
+from tests.smtp_server import SMTPServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--messages', type=int, default=2_000)
+    parser.add_argument('--connections', type=int, default=4)
+    args = parser.parse_args()
+
+    server = SMTPServer().start()
+    app = make_app()
+    app.config.update(MAIL_SERVER='127.0.0.1', MAIL_PORT=server.port, MAIL_USE_TLS=False,
+                      MAIL_SUPPRESS_SEND=False, MAIL_DEFAULT_SENDER=('QuickStay', 'noreply@quickstay.test'))
+    mail.init_app(app)
+
+    def messages():
+        return (Message(subject=f'Offer {i}', recipients=[f'guest{i}@example.com'], body='Hi')
+                for i in range(args.messages))
+
+    with app.app_context():
+        start = time.perf_counter()
+        for message in messages():
+            mail.send(message)
+        single = time.perf_counter() - start
+        single_connections = server.connections
+
+        server.connections = 0
+        stats = BulkMailer(connections=args.connections).send(messages())
+
+    print(f"{args.messages:,} messages")
+    print(f"mail.send() per message: {args.messages / single:8.0f} msg/s  ({single_connections:,} connections)")
+    print(f"BulkMailer:              {stats['messages_per_second']:8.0f} msg/s  ({stats['connections']} connections)")
+    server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Response compression benchmark.
+
+Renders the public pages, then reports for each content-coding the CPU time
+to compress a page against the bytes it saves, and the per-request cost of
+a cached page whose compressed bytes are kept (page cache) versus
+compressing on every hit.
+
+Usage: python -m benchmarks.compression [--repeat N]
+"""
+import argparse
+import time
+import zlib
+
+from app.extensions import db
+from app.services.compression import brotli
+from benchmarks._common import make_app, timed
+
+PAGES = ['/', '/about', '/faq', '/rooms', '/auth/login', '/auth/register', '/auth/forgot-password']
+
+
+def _codecs():
+    codecs = {f'gzip-{level}': (lambda data, level=level: _gzip(data, level)) for level in (1, 6, 9)}
+    if brotli is not None:
+        for quality in (4, 5, 11):
+            codecs[f'br-{quality}'] = lambda data, quality=quality: brotli.compress(data, quality=quality)
+    return codecs
+
+
+def _gzip(data, level):
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _per_request(client, path, headers, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        client.get(path, headers=headers)
+    return (time.perf_counter() - start) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    app = make_app()
+    with app.app_context():
+        db.create_all()
+        client = app.test_client()
+        bodies = {path: client.get(path).data for path in PAGES}
+        total = sum(len(body) for body in bodies.values())
+
+        print(f"{len(PAGES)} pages, {total / 1024:.1f} KB uncompressed")
+        print(f"{'codec':<8} {'bytes':>9} {'saved':>7} {'CPU/page':>10} {'us per KB saved':>16}")
+        for name, codec in _codecs().items():
+            seconds = 0.0
+            size = 0
+            for body in bodies.values():
+                best, compressed = timed(lambda: codec(body), repeat=args.repeat)
+                seconds += best
+                size += len(compressed)
+            saved = total - size
+            print(f"{name:<8} {size:9,} {saved / total:7.1%} {seconds / len(PAGES) * 1e6:8.0f} us "
+                  f"{seconds * 1e6 / (saved / 1024):13.2f}")
+        if brotli is None:
+            print("(brotli not installed - br rows skipped)")
+
+        gzip_headers = {'Accept-Encoding': 'gzip'}
+        cached = _per_request(client, '/faq', gzip_headers, args.repeat)
+        app.config['PAGE_CACHE_ENABLED'] = False
+        uncached = _per_request(client, '/faq', gzip_headers, args.repeat)
+        app.config['COMPRESS_ENABLED'] = False
+        plain = _per_request(client, '/faq', {}, args.repeat)
+
+    print("GET /faq (gzip accepted):")
+    print(f"  page cache hit, stored gzip bytes: {cached * 1e6:9.0f} us")
+    print(f"  render + compress every request:   {uncached * 1e6:9.0f} us")
+    print(f"  render, no compression:            {plain * 1e6:9.0f} us")
+
+
+if __name__ == '__main__':
+    main()
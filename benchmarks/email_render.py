@@ -0,0 +1,77 @@
+"""
+Email rendering benchmark.
+
+Per-message cost of building the OTP email for a bulk send:
+  - legacy:   the old per-call f-string document (no text part, CSS in <style>)
+  - uncached: load + inline CSS + compile the template for every message
+  - cached:   render_email(), compiled once with CSS already inlined
+
+Usage: python -m benchmarks.email_render [--messages N]
+"""
+import argparse
+
+from app.services.email_templates import inline_css, render_email, clear_template_cache
+from benchmarks._common import make_app, timed
+
+
+def _legacy_html(username, otp_code):
+    return f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <style>
+                body {{ font-family: Arial, sans-serif; line-height: 1.6; }}
+                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
+                .otp-box {{ background: #f4f4f4; padding: 20px; text-align: center; font-size: 24px; font-weight: bold; letter-spacing: 5px; }}
+                .footer {{ margin-top: 20px; font-size: 12px; color: #666; }}
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <h2>Password Reset Request</h2>
+                <p>Hello {username},</p>
+                <p>You requested to reset your password. Use the OTP code below:</p>
+                <div class="otp-box">{otp_code}</div>
+                <p><strong>This code will expire in 10 minutes.</strong></p>
+                <p>If you didn't request this, please ignore this email.</p>
+                <div class="footer"><p>© 2026 QuickStay. All rights reserved.</p></div>
+            </div>
+        </body>
+        </html>
+        """
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--messages', type=int, default=10_000)
+    args = parser.parse_args()
+
+    app = make_app()
+    with app.app_context():
+        env = app.jinja_env
+        recipients = [(f'guest{i}', f'{i:06d}') for i in range(args.messages)]
+
+        def legacy():
+            return [_legacy_html(name, code) for name, code in recipients]
+
+        def uncached():
+            for name, code in recipients:
+                source, _, _ = env.loader.get_source(env, 'email/otp.html')
+                env.from_string(inline_css(source)).render(username=name, otp_code=code, expires_minutes=10)
+
+        def cached():
+            for name, code in recipients:
+                render_email('otp', username=name, otp_code=code, expires_minutes=10)
+
+        clear_template_cache(app)
+        results = [('legacy f-string (html only)', legacy), ('uncached template', uncached),
+                   ('cached template (html + text)', cached)]
+
+        print(f"{args.messages:,} messages")
+        for label, fn in results:
+            seconds, _ = timed(fn, repeat=3)
+            print(f"{label:<32} {seconds * 1e6 / args.messages:10.1f} us/message")
+
+
+if __name__ == '__main__':
+    main()
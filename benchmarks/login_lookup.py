@@ -0,0 +1,72 @@
+"""
+Login lookup benchmark.
+
+Times the old `username = :x OR email = :x` login query against
+User.find_by_login (one indexed equality probe: email when the
+identifier has an '@', lower(username) otherwise) on a large users table.
+
+Usage: python -m benchmarks.login_lookup [--users N] [--lookups N]
+"""
+import argparse
+import random
+import time
+from datetime import datetime
+
+from app.extensions import db
+from app.models.user import User
+from benchmarks._common import make_app
+
+
+def seed_users(count, chunk=100_000):
+    now = datetime.utcnow()
+    for offset in range(0, count, chunk):
+        db.session.execute(db.insert(User), [{
+            'first_name': 'User', 'username': f'User{i}', 'email': f'user{i}@example.com',
+            'password_hash': 'x', 'role': 'user', 'is_active': True, 'create_at': now
+        } for i in range(offset, min(offset + chunk, count))])
+        db.session.commit()
+
+
+def _or_query(identifier):
+    return User.query.filter(
+        (User.username == identifier) | (User.email == identifier.lower())
+    ).first()
+
+
+def _per_lookup(fn, identifiers):
+    db.session.expunge_all()
+    start = time.perf_counter()
+    for identifier in identifiers:
+        fn(identifier)
+        db.session.expunge_all()
+    return (time.perf_counter() - start) / len(identifiers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--users', type=int, default=5_000_000)
+    parser.add_argument('--lookups', type=int, default=2_000)
+    args = parser.parse_args()
+
+    app = make_app()
+    with app.app_context():
+        db.create_all()
+        start = time.perf_counter()
+        seed_users(args.users)
+        print(f"seeded {args.users:,} users in {time.perf_counter() - start:.1f} s")
+
+        rng = random.Random(7)
+        picks = [rng.randrange(args.users) for _ in range(args.lookups)]
+        cases = {
+            'username': [f'User{i}' for i in picks],
+            'username (other case)': [f'user{i}' for i in picks],
+            'email': [f'User{i}@Example.com' for i in picks],
+        }
+        for label, identifiers in cases.items():
+            old = _per_lookup(_or_query, identifiers)
+            new = _per_lookup(User.find_by_login, identifiers)
+            print(f"{label:<22} OR query: {old * 1e6:9.1f} us   find_by_login: {new * 1e6:9.1f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Bulk booking moderation benchmark.
+
+Approves a queue of pending bookings one ORM instance at a time
+(`Booking.approve()` + commit, as the admin UI would) and then with the
+set-based `moderate_bookings` UPDATE ... RETURNING.
+
+Usage: python -m benchmarks.moderation [--pending N]
+"""
+import argparse
+import time
+
+from app.extensions import db
+from app.models.bookings import Booking
+from app.services.booking_service import moderate_bookings
+from benchmarks._common import make_app, seed_inventory
+
+
+def _reset_to_pending():
+    db.session.execute(db.update(Booking.__table__).values(status='pending'))
+    db.session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--pending', type=int, default=2_000)
+    parser.add_argument('--rooms', type=int, default=500)
+    args = parser.parse_args()
+
+    app = make_app()
+    with app.app_context():
+        db.create_all()
+        seed_inventory(rooms=args.rooms, bookings=args.pending)
+        ids = db.session.scalars(db.select(Booking.id)).all()
+
+        _reset_to_pending()
+        start = time.perf_counter()
+        for booking_id in ids:
+            booking = db.session.get(Booking, booking_id)
+            booking.approve()
+            db.session.commit()
+        per_row = time.perf_counter() - start
+
+        _reset_to_pending()
+        start = time.perf_counter()
+        _, message, _ = moderate_bookings(ids, 'approve')
+        bulk = time.perf_counter() - start
+
+        print(f"{len(ids):,} pending bookings")
+        print(f"per-instance approve: {per_row * 1000:10.1f} ms")
+        print(f"bulk UPDATE:          {bulk * 1000:10.1f} ms  ({message})")
+
+
+if __name__ == '__main__':
+    main()
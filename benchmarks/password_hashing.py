@@ -0,0 +1,67 @@
+"""
+Password hashing throughput benchmark.
+
+Simulates `--clients` concurrent login requests, each verifying a password
+with PASSWORD_HASH_METHOD, first hashing inline on the request thread and
+then through the hasher process pool. Reports logins/sec overall and per core.
+
+Usage: python -m benchmarks.password_hashing [--logins N] [--clients N] [--method M]
+"""
+import argparse
+import os
+import threading
+import time
+
+from app.services.password_hasher import hash_password, verify_password, shutdown_hasher_pool
+from benchmarks._common import make_app
+
+
+def _run_logins(app, password_hash, logins, clients):
+    remaining = iter(range(logins))
+    lock = threading.Lock()
+
+    def client():
+        with app.app_context():
+            while True:
+                with lock:
+                    if next(remaining, None) is None:
+                        return
+                verify_password(password_hash, 'Password1!')
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return logins / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--logins', type=int, default=200)
+    parser.add_argument('--clients', type=int, default=16)
+    parser.add_argument('--method', default='scrypt:32768:8:1')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    app = make_app()
+    app.config['PASSWORD_HASH_METHOD'] = args.method
+    with app.app_context():
+        app.config['PASSWORD_HASH_WORKERS'] = 0
+        password_hash = hash_password('Password1!')
+        inline = _run_logins(app, password_hash, args.logins, args.clients)
+
+        app.config['PASSWORD_HASH_WORKERS'] = args.workers
+        verify_password(password_hash, 'warm-up')  # start the pool outside the timing
+        pooled = _run_logins(app, password_hash, args.logins, args.clients)
+        shutdown_hasher_pool()
+
+    print(f"{args.method}, {args.clients} concurrent clients, {cores} core(s)")
+    print(f"inline:               {inline:8.1f} logins/s  ({inline / cores:7.1f} per core)")
+    print(f"pool ({args.workers} workers):     {pooled:8.1f} logins/s  ({pooled / cores:7.1f} per core)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Login rate limiting load test.
+
+Fires a credential-stuffing burst of wrong-password logins at /auth/login
+and compares the cost of a request that reaches the view (user lookup +
+password hash) with one the limiter rejects, plus the raw cost of a limiter
+check on the memory and shared (in-process stand-in) backends.
+
+Usage: python -m benchmarks.rate_limit [--requests N] [--method M]
+"""
+import argparse
+import time
+
+from app.extensions import db
+from app.services.rate_limiter import RateLimiter, MemoryBackend, SharedBackend, init_rate_limiter
+from benchmarks._common import make_app
+from tests.factories import make_user
+from tests.redis_stub import RedisStub
+
+
+def _per_request(client, count, form):
+    statuses = {}
+    start = time.perf_counter()
+    for _ in range(count):
+        status = client.post('/auth/login', data=form).status_code
+        statuses[status] = statuses.get(status, 0) + 1
+    return (time.perf_counter() - start) / count, statuses
+
+
+def _per_check(limiter, count):
+    start = time.perf_counter()
+    for i in range(count):
+        limiter.hit('login', {'ip': f'10.0.{i % 250}.1', 'account': 'victim'})
+    return (time.perf_counter() - start) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--method', default='scrypt:32768:8:1')
+    args = parser.parse_args()
+
+    app = make_app()
+    app.config.update(PASSWORD_HASH_METHOD=args.method, RATE_LIMIT_ENABLED=True, WTF_CSRF_ENABLED=False)
+    with app.app_context():
+        db.create_all()
+        make_user('victim', email='victim@example.com')
+        client = app.test_client()
+        form = {'email': 'victim', 'password': 'guess'}
+
+        app.config['RATE_LIMITS'] = {'login': {}}
+        init_rate_limiter(app)
+        reached, _ = _per_request(client, args.requests, form)
+
+        app.config['RATE_LIMITS'] = {'login': {'ip': (1, 3600)}}
+        init_rate_limiter(app)
+        client.post('/auth/login', data=form)
+        rejected, statuses = _per_request(client, args.requests, form)
+
+        checks = args.requests * 100
+        rules = {'login': {'ip': (5, 60), 'account': (5, 900)}}
+        memory = _per_check(RateLimiter(MemoryBackend(), rules), checks)
+        shared = _per_check(RateLimiter(SharedBackend(RedisStub()), rules), checks)
+
+    print(f"{args.requests} wrong-password logins ({args.method})")
+    print(f"reaches view (lookup + hash): {reached * 1e6:10.1f} us/request")
+    print(f"rejected by limiter (429):    {rejected * 1e6:10.1f} us/request  {statuses}")
+    print(f"limiter check, memory:        {memory * 1e6:10.2f} us")
+    print(f"limiter check, shared stub:   {shared * 1e6:10.2f} us (plus one network round trip)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""
+Serving mode load test.
+
+Starts the app under the Werkzeug development server (`python run.py`, the
+old container command) and under gunicorn with gunicorn.conf.py, then
+drives both with concurrent clients and reports requests/sec and latency.
+
+Usage: python -m benchmarks.serving [--clients N] [--requests N] [--path /]
+"""
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+
+from app.extensions import db
+from benchmarks._common import make_app
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _wait_until_up(url, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(url, timeout=1).read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server at {url} did not start")
+
+
+def _load(url, clients, requests):
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+
+    def client():
+        for _ in range(requests):
+            start = time.perf_counter()
+            try:
+                urllib.request.urlopen(url, timeout=30).read()
+            except OSError as e:
+                with lock:
+                    errors.append(e)
+                continue
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        'rps': len(latencies) / elapsed,
+        'p50': statistics.median(latencies) * 1000 if latencies else 0,
+        'p99': latencies[int(len(latencies) * 0.99) - 1] * 1000 if latencies else 0,
+        'errors': len(errors)
+    }
+
+
+def _serve(command, env, url, clients, requests):
+    server = subprocess.Popen(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        _wait_until_up(url)
+        _load(url, clients, 5)  # warm up every worker
+        return _load(url, clients, requests)
+    finally:
+        server.terminate()
+        server.wait(10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--clients', type=int, default=32)
+    parser.add_argument('--requests', type=int, default=50, help='per client')
+    parser.add_argument('--path', default='/')
+    args = parser.parse_args()
+
+    db_path = os.path.join(tempfile.mkdtemp(prefix='quickstay-serving-'), 'bench.db')
+    with make_app(db_path).app_context():
+        db.create_all()
+
+    env = dict(os.environ, FLASK_ENV='production', DATABASE_URL=f'sqlite:///{db_path}',
+               MAIL_OUTBOX_IN_PROCESS='false', RATE_LIMIT_BACKEND='memory', WEB_BIND='127.0.0.1:5001')
+    results = {
+        'python run.py (Werkzeug)': _serve([sys.executable, 'run.py'], env,
+                                           f'http://127.0.0.1:5000{args.path}', args.clients, args.requests)
+    }
+    if shutil.which('gunicorn'):
+        results['gunicorn (gunicorn.conf.py)'] = _serve(
+            ['gunicorn', '--config', 'gunicorn.conf.py', 'run:app'], env,
+            f'http://127.0.0.1:5001{args.path}', args.clients, args.requests
+        )
+    else:
+        print("gunicorn is not installed (pip install -r requirements.txt) - skipping it")
+
+    print(f"GET {args.path}: {args.clients} clients x {args.requests} requests, {os.cpu_count()} CPU(s)")
+    for mode, result in results.items():
+        print(f"{mode:<28} {result['rps']:8.1f} req/s   p50 {result['p50']:7.1f} ms   "
+              f"p99 {result['p99']:7.1f} ms   errors {result['errors']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Cold worker startup benchmark.
+
+Each measurement runs in a fresh Python process (a newly forked or recycled
+worker): create the app, then time the first request to one page. Modes:
+  no-cache     parse + compile on first request (previous behaviour)
+  bytecode     compiled code loaded from a populated FileSystemBytecodeCache
+  warm-up      TEMPLATE_WARMUP at boot (from the bytecode cache), so the
+               first request only renders
+
+Usage: python -m benchmarks.template_startup [--runs N]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+PAGES = ['/', '/about', '/faq', '/rooms', '/auth/login', '/auth/register', '/auth/forgot-password']
+MODES = ('no-cache', 'bytecode', 'warm-up')
+
+
+def child(mode, page, db_path, cache_dir):
+    """Runs in the fresh process: prints {'boot': s, 'ttfb': s} as JSON"""
+    from benchmarks._common import make_app
+
+    started = time.perf_counter()
+    app = make_app(db_path, JINJA_BYTECODE_CACHE_DIR=cache_dir if mode != 'no-cache' else None,
+                   TEMPLATE_WARMUP=(mode == 'warm-up'), PAGE_CACHE_ENABLED=False)
+    boot = time.perf_counter() - started
+    with app.app_context():
+        client = app.test_client()
+        started = time.perf_counter()
+        response = client.get(page)
+        ttfb = time.perf_counter() - started
+    assert response.status_code == 200, (page, response.status_code)
+    print(json.dumps({'boot': boot, 'ttfb': ttfb}))
+
+
+def _run_child(mode, page, db_path, cache_dir):
+    output = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.template_startup', '--child', mode, page, db_path, cache_dir],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=3, help='fresh processes per page and mode (best is kept)')
+    parser.add_argument('--child', nargs=4, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        return child(*args.child)
+
+    from app.extensions import db
+    from benchmarks._common import make_app
+
+    workdir = tempfile.mkdtemp(prefix='quickstay-startup-')
+    db_path, cache_dir = os.path.join(workdir, 'bench.db'), os.path.join(workdir, 'jinja')
+    with make_app(db_path).app_context():
+        db.create_all()
+    for page in PAGES:  # populate the bytecode cache, as the first worker after a deploy would
+        _run_child('bytecode', page, db_path, cache_dir)
+
+    print(f"first request in a cold worker, best of {args.runs} processes (ms)")
+    print(f"{'page':<24}" + ''.join(f"{mode:>12}" for mode in MODES))
+    boots = {mode: [] for mode in MODES}
+    for page in PAGES:
+        row = []
+        for mode in MODES:
+            results = [_run_child(mode, page, db_path, cache_dir) for _ in range(args.runs)]
+            row.append(min(r['ttfb'] for r in results) * 1000)
+            boots[mode].append(min(r['boot'] for r in results) * 1000)
+        print(f"{page:<24}" + ''.join(f"{value:12.1f}" for value in row))
+    print(f"{'create_app (boot)':<24}" + ''.join(f"{sum(boots[m]) / len(boots[m]):12.1f}" for m in MODES))
+
+
+if __name__ == '__main__':
+    main()
@@ -47,7 +47,16 @@ except Exception as e:
     print(f'⚠️ Migration note: {e}')
 "
 
-# ========== START FLASK ==========
-echo "🌐 Starting Flask..."
+# ========== BUILD ASSETS ==========
+echo "📦 Building static assets..."
+FLASK_APP=run.py flask assets build || echo "⚠️ Asset build failed - serving unbuilt sources"
+
+# ========== START SERVER ==========
+# Prefork gunicorn (see gunicorn.conf.py); SERVER_MODE=dev keeps the
+# single-process Werkzeug server for debugging
+echo "🌐 Starting QuickStay..."
 echo "=========================================="
-exec python run.py
\ No newline at end of file
+if [ "${SERVER_MODE:-gunicorn}" = "dev" ]; then
+    exec python run.py
+fi
+exec gunicorn --config gunicorn.conf.py run:app
\ No newline at end of file
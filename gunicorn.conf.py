@@ -0,0 +1,63 @@
+"""
+Production server settings: gunicorn -c gunicorn.conf.py run:app
+
+Sizes come from Config (WEB_* environment variables). The app is loaded
+once in the master and forked, so workers share its memory copy-on-write.
+
+Restarts:
+  kill -HUP <master>    new workers replace old ones gracefully (same code:
+                        with preload_app the master keeps the loaded app)
+  kill -USR2 <master>   start a new master with new code next to the old
+                        one, then kill -QUIT the old master - zero downtime
+"""
+import os
+
+# Prefork workers already use every core; one password hasher each is enough
+os.environ.setdefault('PASSWORD_HASH_WORKERS', '1')
+
+from app.config import Config  # noqa: E402
+
+bind = Config.WEB_BIND
+workers = Config.WEB_WORKERS
+threads = Config.WEB_THREADS
+worker_class = 'gthread' if threads > 1 else 'sync'
+
+preload_app = True
+max_requests = Config.WEB_MAX_REQUESTS
+max_requests_jitter = Config.WEB_MAX_REQUESTS_JITTER
+timeout = Config.WEB_TIMEOUT
+graceful_timeout = Config.WEB_GRACEFUL_TIMEOUT
+keepalive = Config.WEB_KEEPALIVE
+
+accesslog = '-'
+errorlog = '-'
+
+
+def when_ready(server):
+    """Master, after preloading: nothing forked may inherit threads or DB connections"""
+    from app.extensions import db
+    from app.services.scheduler import stop_background_tasks
+
+    app = server.app.wsgi()
+    stop_background_tasks(app)
+    with app.app_context():
+        db.engine.dispose()
+
+    if (server.cfg.workers > 1 and app.config['RATE_LIMIT_ENABLED']
+            and app.config['RATE_LIMIT_BACKEND'] == 'memory'):
+        server.log.warning(
+            "Rate limits use the per-process memory backend with %d workers: each "
+            "budget is %dx too generous. Set RATE_LIMIT_BACKEND=redis.",
+            server.cfg.workers, server.cfg.workers
+        )
+
+
+def post_fork(server, worker):
+    """Worker: fresh connection pool and its own background task threads"""
+    from app.extensions import db
+    from app.services.scheduler import resume_background_tasks
+
+    app = server.app.wsgi()
+    with app.app_context():
+        db.engine.dispose(close=False)
+    resume_background_tasks(app)
@@ -0,0 +1,33 @@
+"""Room occupancy calendar
+
+Run `flask occupancy rebuild` once after upgrading to populate the
+calendar from existing bookings.
+
+Revision ID: 0a9d5f7c3e18
+Revises: f3c6a1d8e245
+Create Date: 2026-10-17 15:21:33.904617
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0a9d5f7c3e18'
+down_revision = 'f3c6a1d8e245'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('room_occupancy',
+    sa.Column('room_id', sa.Integer(), nullable=False),
+    sa.Column('month', sa.Date(), nullable=False),
+    sa.Column('nights', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['room_id'], ['rooms.id'], ),
+    sa.PrimaryKeyConstraint('room_id', 'month')
+    )
+
+
+def downgrade():
+    op.drop_table('room_occupancy')
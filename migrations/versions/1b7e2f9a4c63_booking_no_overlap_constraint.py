@@ -0,0 +1,37 @@
+"""Booking no-overlap exclusion constraint (Postgres)
+
+Guarantees no two pending/confirmed bookings for the same room share a
+night, even if application-level locking is bypassed. Existing overlapping
+active bookings must be resolved before upgrading.
+
+Revision ID: 1b7e2f9a4c63
+Revises: 0a9d5f7c3e18
+Create Date: 2026-10-17 16:47:08.513920
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '1b7e2f9a4c63'
+down_revision = '0a9d5f7c3e18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.execute("""
+        ALTER TABLE bookings ADD CONSTRAINT bookings_no_overlap EXCLUDE USING gist (
+            room_id WITH =,
+            daterange(check_in_date, check_out_date) WITH &&
+        ) WHERE (status IN ('pending', 'confirmed'))
+    """)
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("ALTER TABLE bookings DROP CONSTRAINT IF EXISTS bookings_no_overlap")
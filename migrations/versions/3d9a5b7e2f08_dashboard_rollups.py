@@ -0,0 +1,47 @@
+"""Dashboard daily rollups
+
+Run `flask stats rebuild` once after upgrading to populate the rollups
+from existing bookings.
+
+Revision ID: 3d9a5b7e2f08
+Revises: 2c8f4a6d1e97
+Create Date: 2026-10-17 18:05:12.774390
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3d9a5b7e2f08'
+down_revision = '2c8f4a6d1e97'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('room_daily_stats',
+    sa.Column('room_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('arrivals', sa.Integer(), nullable=False),
+    sa.Column('nights', sa.Integer(), nullable=False),
+    sa.Column('revenue', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['room_id'], ['rooms.id'], ),
+    sa.PrimaryKeyConstraint('room_id', 'day', 'status')
+    )
+
+    op.create_table('room_type_daily_stats',
+    sa.Column('room_type', sa.String(length=20), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('arrivals', sa.Integer(), nullable=False),
+    sa.Column('nights', sa.Integer(), nullable=False),
+    sa.Column('revenue', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('room_type', 'day', 'status')
+    )
+
+
+def downgrade():
+    op.drop_table('room_type_daily_stats')
+    op.drop_table('room_daily_stats')
@@ -0,0 +1,30 @@
+"""Pending booking expiry index
+
+Revision ID: 4e1b6c8d3a29
+Revises: 3d9a5b7e2f08
+Create Date: 2026-10-17 18:41:57.120688
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4e1b6c8d3a29'
+down_revision = '3d9a5b7e2f08'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('bookings', schema=None) as batch_op:
+        batch_op.create_index(
+            'ix_bookings_pending_created', ['created_at', 'id'], unique=False,
+            postgresql_where=sa.text("status = 'pending'"),
+            sqlite_where=sa.text("status = 'pending'")
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('bookings', schema=None) as batch_op:
+        batch_op.drop_index('ix_bookings_pending_created')
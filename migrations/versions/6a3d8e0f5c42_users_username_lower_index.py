@@ -0,0 +1,27 @@
+"""Case-insensitive username login index
+
+Revision ID: 6a3d8e0f5c42
+Revises: 5f2c7d9e4b31
+Create Date: 2026-10-17 21:08:14.530917
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6a3d8e0f5c42'
+down_revision = '5f2c7d9e4b31'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Not unique: existing usernames may already differ only by case
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index('ix_users_username_lower', [sa.text('lower(username)')], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index('ix_users_username_lower')
@@ -0,0 +1,62 @@
+"""Password reset codes table (drops users.otp_code / otp_expires_at)
+
+Codes outstanding at upgrade time are discarded; users request a new one.
+Schedule `flask otp sweep` (e.g. hourly) to delete expired codes.
+
+Revision ID: 7b4e9f1a6d53
+Revises: 6a3d8e0f5c42
+Create Date: 2026-10-17 21:46:03.318274
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7b4e9f1a6d53'
+down_revision = '6a3d8e0f5c42'
+branch_labels = None
+depends_on = None
+
+
+def _alter_users(alter):
+    # SQLite batch mode rebuilds the table and can't carry over the
+    # lower(username) expression index, so re-create it afterwards
+    rebuilds = op.get_context().dialect.name == 'sqlite'
+    if rebuilds:
+        op.drop_index('ix_users_username_lower', table_name='users')
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        alter(batch_op)
+    if rebuilds:
+        op.create_index('ix_users_username_lower', 'users', [sa.text('lower(username)')], unique=False)
+
+
+def upgrade():
+    op.create_table('password_reset_otps',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('code_hash', sa.String(length=64), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    with op.batch_alter_table('password_reset_otps', schema=None) as batch_op:
+        batch_op.create_index('ix_password_reset_otps_expires_at', ['expires_at'], unique=False)
+
+    def drop_otp_columns(batch_op):
+        batch_op.drop_column('otp_expires_at')
+        batch_op.drop_column('otp_code')
+    _alter_users(drop_otp_columns)
+
+
+def downgrade():
+    def add_otp_columns(batch_op):
+        batch_op.add_column(sa.Column('otp_code', sa.String(length=6), nullable=True))
+        batch_op.add_column(sa.Column('otp_expires_at', sa.DateTime(), nullable=True))
+    _alter_users(add_otp_columns)
+
+    with op.batch_alter_table('password_reset_otps', schema=None) as batch_op:
+        batch_op.drop_index('ix_password_reset_otps_expires_at')
+
+    op.drop_table('password_reset_otps')
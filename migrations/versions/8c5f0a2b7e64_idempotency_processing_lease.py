@@ -0,0 +1,30 @@
+"""Idempotency key processing lease
+
+Keys left 'processing' by a request that died can be claimed again once
+locked_until has passed. Rows already 'processing' at upgrade time have
+no lease and can be claimed straight away.
+
+Revision ID: 8c5f0a2b7e64
+Revises: 7b4e9f1a6d53
+Create Date: 2026-10-18 10:12:37.540318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c5f0a2b7e64'
+down_revision = '7b4e9f1a6d53'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('idempotency_keys', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('locked_until', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('idempotency_keys', schema=None) as batch_op:
+        batch_op.drop_column('locked_until')
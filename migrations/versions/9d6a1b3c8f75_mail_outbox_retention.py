@@ -0,0 +1,30 @@
+"""Mail outbox retention
+
+Clears the bodies of messages already sent (they can contain password
+reset codes) and indexes sent messages for `flask mail sweep`, which
+deletes them after MAIL_OUTBOX_SENT_RETENTION. Schedule it (e.g. daily).
+
+Revision ID: 9d6a1b3c8f75
+Revises: 8c5f0a2b7e64
+Create Date: 2026-10-18 10:41:52.184907
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '9d6a1b3c8f75'
+down_revision = '8c5f0a2b7e64'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("UPDATE mail_outbox SET html = NULL, body = NULL WHERE status = 'sent'")
+    with op.batch_alter_table('mail_outbox', schema=None) as batch_op:
+        batch_op.create_index('ix_mail_outbox_status_sent_at', ['status', 'sent_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('mail_outbox', schema=None) as batch_op:
+        batch_op.drop_index('ix_mail_outbox_status_sent_at')
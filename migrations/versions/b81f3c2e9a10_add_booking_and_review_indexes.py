@@ -0,0 +1,39 @@
+"""Add booking overlap and review indexes
+
+Revision ID: b81f3c2e9a10
+Revises: 7d277183a6d4
+Create Date: 2026-10-17 09:12:04.118532
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b81f3c2e9a10'
+down_revision = '7d277183a6d4'
+branch_labels = None
+depends_on = None
+
+ACTIVE_STATUSES = sa.text("status IN ('pending', 'confirmed')")
+
+
+def upgrade():
+    with op.batch_alter_table('bookings', schema=None) as batch_op:
+        batch_op.create_index('ix_bookings_room_status_dates', ['room_id', 'status', 'check_in_date', 'check_out_date'], unique=False)
+        batch_op.create_index('ix_bookings_user_created', ['user_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_bookings_active_room_dates', ['room_id', 'check_in_date', 'check_out_date'], unique=False,
+                              postgresql_where=ACTIVE_STATUSES, sqlite_where=ACTIVE_STATUSES)
+
+    with op.batch_alter_table('reviews', schema=None) as batch_op:
+        batch_op.create_index('ix_reviews_room_created', ['room_id', 'created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('reviews', schema=None) as batch_op:
+        batch_op.drop_index('ix_reviews_room_created')
+
+    with op.batch_alter_table('bookings', schema=None) as batch_op:
+        batch_op.drop_index('ix_bookings_active_room_dates')
+        batch_op.drop_index('ix_bookings_user_created')
+        batch_op.drop_index('ix_bookings_room_status_dates')
@@ -0,0 +1,33 @@
+"""Rooms keyset pagination indexes
+
+Revision ID: c4d92e7f1b35
+Revises: b81f3c2e9a10
+Create Date: 2026-10-17 10:03:41.552870
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4d92e7f1b35'
+down_revision = 'b81f3c2e9a10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keyset comparisons need a non-null sort key
+    op.execute("UPDATE rooms SET rating = 0.0 WHERE rating IS NULL")
+
+    with op.batch_alter_table('rooms', schema=None) as batch_op:
+        batch_op.alter_column('rating', existing_type=sa.Float(), nullable=False)
+        batch_op.create_index('ix_rooms_price_id', ['price_per_night', 'id'], unique=False)
+        batch_op.create_index('ix_rooms_rating_id', ['rating', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('rooms', schema=None) as batch_op:
+        batch_op.drop_index('ix_rooms_rating_id')
+        batch_op.drop_index('ix_rooms_price_id')
+        batch_op.alter_column('rating', existing_type=sa.Float(), nullable=True)
@@ -0,0 +1,33 @@
+"""Room rating aggregate columns
+
+Run `flask ratings backfill` once after upgrading to populate the
+aggregate from existing reviews.
+
+Revision ID: d5a8e3b6c217
+Revises: c4d92e7f1b35
+Create Date: 2026-10-17 11:26:09.371145
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5a8e3b6c217'
+down_revision = 'c4d92e7f1b35'
+branch_labels = None
+depends_on = None
+
+AGGREGATE_COLUMNS = ['rating_sum', 'rating_count', 'rating_1', 'rating_2', 'rating_3', 'rating_4', 'rating_5']
+
+
+def upgrade():
+    with op.batch_alter_table('rooms', schema=None) as batch_op:
+        for name in AGGREGATE_COLUMNS:
+            batch_op.add_column(sa.Column(name, sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade():
+    with op.batch_alter_table('rooms', schema=None) as batch_op:
+        for name in reversed(AGGREGATE_COLUMNS):
+            batch_op.drop_column(name)
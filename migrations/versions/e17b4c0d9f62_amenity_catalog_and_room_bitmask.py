@@ -0,0 +1,96 @@
+"""Amenity catalog and room amenity bitmask
+
+Moves the comma-separated rooms.amenities strings into the amenities
+catalog and a per-room bitmask, then drops the text column.
+
+Revision ID: e17b4c0d9f62
+Revises: d5a8e3b6c217
+Create Date: 2026-10-17 12:40:52.806127
+
+"""
+from datetime import datetime
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e17b4c0d9f62'
+down_revision = 'd5a8e3b6c217'
+branch_labels = None
+depends_on = None
+
+MAX_AMENITIES = 63
+
+
+def upgrade():
+    op.create_table('amenities',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('bit', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('bit'),
+    sa.UniqueConstraint('name')
+    )
+    with op.batch_alter_table('rooms', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('amenity_mask', sa.BigInteger(), nullable=False, server_default='0'))
+
+    # --- Data migration: strings -> catalog + masks ---
+    bind = op.get_bind()
+    amenities = sa.table('amenities', sa.column('name'), sa.column('bit'), sa.column('created_at'))
+    rooms = sa.table('rooms', sa.column('id'), sa.column('amenities'), sa.column('amenity_mask'))
+
+    bits = {}  # lower-cased name -> (display name, bit)
+    masks = []
+    for room_id, raw in bind.execute(sa.select(rooms.c.id, rooms.c.amenities)):
+        mask = 0
+        for name in (raw or '').split(','):
+            name = name.strip()
+            if not name:
+                continue
+            if name.lower() not in bits:
+                if len(bits) >= MAX_AMENITIES:
+                    raise RuntimeError(f"More than {MAX_AMENITIES} distinct amenities - cannot fit in a bitmask")
+                bits[name.lower()] = (name, len(bits))
+            mask |= 1 << bits[name.lower()][1]
+        if mask:
+            masks.append({'room_id': room_id, 'mask': mask})
+
+    now = datetime.utcnow()
+    if bits:
+        op.bulk_insert(amenities, [{'name': name, 'bit': bit, 'created_at': now} for name, bit in bits.values()])
+    if masks:
+        bind.execute(
+            rooms.update().where(rooms.c.id == sa.bindparam('room_id')).values(amenity_mask=sa.bindparam('mask')),
+            masks
+        )
+
+    with op.batch_alter_table('rooms', schema=None) as batch_op:
+        batch_op.create_index('ix_rooms_amenity_mask', ['amenity_mask'], unique=False)
+        batch_op.drop_column('amenities')
+
+
+def downgrade():
+    with op.batch_alter_table('rooms', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('amenities', sa.Text(), nullable=True))
+
+    bind = op.get_bind()
+    amenities = sa.table('amenities', sa.column('name'), sa.column('bit'))
+    rooms = sa.table('rooms', sa.column('id'), sa.column('amenities'), sa.column('amenity_mask'))
+
+    names = dict((bit, name) for name, bit in bind.execute(sa.select(amenities.c.name, amenities.c.bit)))
+    values = []
+    for room_id, mask in bind.execute(sa.select(rooms.c.id, rooms.c.amenity_mask).where(rooms.c.amenity_mask != 0)):
+        listed = [names[bit] for bit in sorted(names) if mask >> bit & 1]
+        values.append({'room_id': room_id, 'text': ','.join(listed)})
+    if values:
+        bind.execute(
+            rooms.update().where(rooms.c.id == sa.bindparam('room_id')).values(amenities=sa.bindparam('text')),
+            values
+        )
+
+    with op.batch_alter_table('rooms', schema=None) as batch_op:
+        batch_op.drop_index('ix_rooms_amenity_mask')
+        batch_op.drop_column('amenity_mask')
+
+    op.drop_table('amenities')
@@ -0,0 +1,90 @@
+"""Room full-text search
+
+Postgres: generated tsvector column + GIN index.
+SQLite: external-content FTS5 table maintained by triggers.
+Note: SQLite batch migrations that recreate `rooms` drop the triggers;
+re-run the SQLite DDL below after any such migration.
+
+Revision ID: f3c6a1d8e245
+Revises: e17b4c0d9f62
+Create Date: 2026-10-17 13:58:17.240391
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3c6a1d8e245'
+down_revision = 'e17b4c0d9f62'
+branch_labels = None
+depends_on = None
+
+POSTGRES_DDL = [
+    """ALTER TABLE rooms ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(search_document, '')), 'B')
+    ) STORED""",
+    "CREATE INDEX ix_rooms_search_vector ON rooms USING gin (search_vector)",
+]
+
+SQLITE_DDL = [
+    """CREATE VIRTUAL TABLE rooms_fts USING fts5(
+        name, search_document, content='rooms', content_rowid='id', tokenize='porter unicode61'
+    )""",
+    """CREATE TRIGGER rooms_fts_ai AFTER INSERT ON rooms BEGIN
+        INSERT INTO rooms_fts(rowid, name, search_document) VALUES (new.id, new.name, new.search_document);
+    END""",
+    """CREATE TRIGGER rooms_fts_ad AFTER DELETE ON rooms BEGIN
+        INSERT INTO rooms_fts(rooms_fts, rowid, name, search_document)
+        VALUES ('delete', old.id, old.name, old.search_document);
+    END""",
+    """CREATE TRIGGER rooms_fts_au AFTER UPDATE OF name, search_document ON rooms BEGIN
+        INSERT INTO rooms_fts(rooms_fts, rowid, name, search_document)
+        VALUES ('delete', old.id, old.name, old.search_document);
+        INSERT INTO rooms_fts(rowid, name, search_document) VALUES (new.id, new.name, new.search_document);
+    END""",
+    "INSERT INTO rooms_fts(rooms_fts) VALUES ('rebuild')",
+]
+
+
+def upgrade():
+    with op.batch_alter_table('rooms', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('search_document', sa.Text(), nullable=True))
+
+    # Populate search_document = description + amenity names
+    bind = op.get_bind()
+    amenities = sa.table('amenities', sa.column('name'), sa.column('bit'))
+    rooms = sa.table('rooms', sa.column('id'), sa.column('description'),
+                     sa.column('amenity_mask'), sa.column('search_document'))
+
+    names = dict((bit, name) for name, bit in bind.execute(sa.select(amenities.c.name, amenities.c.bit)))
+    documents = []
+    for room_id, description, mask in bind.execute(sa.select(rooms.c.id, rooms.c.description, rooms.c.amenity_mask)):
+        parts = [description or ''] + [names[bit] for bit in sorted(names) if (mask or 0) >> bit & 1]
+        document = ' '.join(part for part in parts if part).strip()
+        if document:
+            documents.append({'room_id': room_id, 'document': document})
+    if documents:
+        bind.execute(
+            rooms.update().where(rooms.c.id == sa.bindparam('room_id')).values(search_document=sa.bindparam('document')),
+            documents
+        )
+
+    dialect = bind.dialect.name
+    for statement in POSTGRES_DDL if dialect == 'postgresql' else SQLITE_DDL if dialect == 'sqlite' else []:
+        op.execute(statement)
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_rooms_search_vector")
+        op.execute("ALTER TABLE rooms DROP COLUMN IF EXISTS search_vector")
+    elif dialect == 'sqlite':
+        for trigger in ('rooms_fts_ai', 'rooms_fts_ad', 'rooms_fts_au'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS rooms_fts")
+
+    with op.batch_alter_table('rooms', schema=None) as batch_op:
+        batch_op.drop_column('search_document')
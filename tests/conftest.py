@@ -0,0 +1,58 @@
+import pytest
+from app import create_app
+from app.config import config, TestingConfig
+from app.extensions import db
+from app.models.amenity import Amenity
+from tests.smtp_server import SMTPServer
+
+
+@pytest.fixture
+def db_app():
+    """Testing app with all tables created in the in-memory database."""
+    app = create_app('testing')
+    app.config['WTF_CSRF_ENABLED'] = False
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+        Amenity.clear_cache()
+
+
+@pytest.fixture
+def db_client(db_app):
+    """Test client bound to the database-backed app."""
+    return db_app.test_client()
+
+
+@pytest.fixture
+def smtp_server():
+    """Local SMTP stand-in (see tests/smtp_server.py)."""
+    server = SMTPServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def mail_app(smtp_server, tmp_path):
+    """App delivering to the local SMTP stand-in, on a file database shared by worker threads."""
+    class MailTestingConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'mail.db'}"
+        WTF_CSRF_ENABLED = False
+        MAIL_SERVER = '127.0.0.1'
+        MAIL_PORT = smtp_server.port
+        MAIL_USE_TLS = False
+        MAIL_SUPPRESS_SEND = False
+        MAIL_DEFAULT_SENDER = ('QuickStay', 'noreply@quickstay.test')
+        MAIL_OUTBOX_BACKOFF_BASE = 0
+        MAIL_OUTBOX_MAX_ATTEMPTS = 3
+        MAIL_BULK_RETRY_DELAY = 0
+
+    config['mail-testing'] = MailTestingConfig
+    app = create_app('mail-testing')
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+    config.pop('mail-testing', None)
@@ -0,0 +1,48 @@
+from datetime import date, timedelta
+from app.extensions import db
+from app.models.user import User
+from app.models.room import Room
+from app.models.bookings import Booking
+
+
+def make_user(username='guest', email=None, password='Password1!', **kwargs):
+    user = User(
+        first_name=kwargs.pop('first_name', 'Guest'),
+        username=username,
+        email=email or f'{username}@example.com',
+        **kwargs
+    )
+    user.set_password(password)
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def make_room(name='Room', room_type='Standard', price=100.0, max_guests=2, **kwargs):
+    room = Room(
+        name=name,
+        room_type=room_type,
+        price_per_night=price,
+        max_guests=max_guests,
+        **kwargs
+    )
+    db.session.add(room)
+    db.session.commit()
+    return room
+
+
+def make_booking(user, room, start_in_days=1, nights=2, status='pending', **kwargs):
+    check_in = date.today() + timedelta(days=start_in_days)
+    booking = Booking(
+        user_id=user.id,
+        room_id=room.id,
+        check_in_date=check_in,
+        check_out_date=check_in + timedelta(days=nights),
+        guests_count=kwargs.pop('guests_count', 1),
+        total_price=kwargs.pop('total_price', nights * room.price_per_night),
+        status=status,
+        **kwargs
+    )
+    db.session.add(booking)
+    db.session.commit()
+    return booking
@@ -0,0 +1,60 @@
+"""In-process stand-in for the shared key-value store used by the rate limiter"""
+import threading
+import time
+
+
+class _Pipeline:
+    def __init__(self, store):
+        self.store = store
+        self.commands = []
+
+    def incr(self, key):
+        self.commands.append((self.store.incr, key))
+
+    def expire(self, key, seconds):
+        self.commands.append((self.store.expire, key, seconds))
+
+    def get(self, key):
+        self.commands.append((self.store.get, key))
+
+    def execute(self):
+        with self.store.lock:
+            return [command(*args) for command, *args in self.commands]
+
+
+class RedisStub:
+    """The subset of the redis-py client the limiter uses (incr/expire/get, pipelined)"""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.data = {}  # key -> (value, expires_at)
+        self.round_trips = 0
+
+    def _live(self, key):
+        value, expires_at = self.data.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.time():
+            del self.data[key]
+            return None
+        return value
+
+    def incr(self, key):
+        with self.lock:
+            value = int(self._live(key) or 0) + 1
+            self.data[key] = (value, self.data.get(key, (None, None))[1])
+            return value
+
+    def expire(self, key, seconds):
+        with self.lock:
+            if self._live(key) is None:
+                return False
+            self.data[key] = (self.data[key][0], time.time() + seconds)
+            return True
+
+    def get(self, key):
+        with self.lock:
+            value = self._live(key)
+            return None if value is None else str(value).encode()
+
+    def pipeline(self):
+        self.round_trips += 1
+        return _Pipeline(self)
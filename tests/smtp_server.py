@@ -0,0 +1,120 @@
+"""Minimal in-process SMTP server standing in for the real mail host in tests"""
+import socketserver
+import threading
+from email import message_from_bytes
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    def _reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        server = self.server.smtp
+        server.connected()
+        self._reply('220 localhost test SMTP ready')
+        envelope = {'from': None, 'to': []}
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode(errors='replace').strip()
+            verb = command.split(' ', 1)[0].upper()
+
+            if verb in ('EHLO', 'HELO'):
+                self._reply('250 localhost')
+            elif verb == 'MAIL':
+                envelope = {'from': command.split(':', 1)[1].strip(), 'to': []}
+                self._reply('250 OK')
+            elif verb == 'RCPT':
+                address = command.split(':', 1)[1].strip()
+                if address.strip('<>') in server.reject_recipients:
+                    self._reply('550 No such user')
+                    continue
+                envelope['to'].append(address)
+                self._reply('250 OK')
+            elif verb == 'DATA':
+                self._reply('354 End data with <CR><LF>.<CR><LF>')
+                data = []
+                while True:
+                    chunk = self.rfile.readline()
+                    if chunk in (b'.\r\n', b'.\n', b''):
+                        break
+                    data.append(chunk[1:] if chunk.startswith(b'..') else chunk)
+                if server.take_disconnect():
+                    return  # drop the connection without replying
+                if server.take_failure():
+                    self._reply('451 Temporary failure, try again later')
+                else:
+                    server.record(envelope, b''.join(data))
+                    self._reply('250 Message accepted')
+            elif verb in ('RSET', 'NOOP'):
+                self._reply('250 OK')
+            elif verb == 'QUIT':
+                self._reply('221 Bye')
+                return
+            else:
+                self._reply('502 Command not implemented')
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class SMTPServer:
+    """
+    Accepts mail on 127.0.0.1:<port> and keeps it in `messages`.
+    fail_next(n) answers the next n DATA commands with a 451,
+    disconnect_next(n) drops the connection instead, and addresses in
+    reject_recipients are refused with a 550.
+    """
+
+    def __init__(self):
+        self.messages = []
+        self.connections = 0
+        self.reject_recipients = set()
+        self._failures = 0
+        self._disconnects = 0
+        self._lock = threading.Lock()
+        self._server = _Server(('127.0.0.1', 0), _SMTPHandler)
+        self._server.smtp = self
+        self.port = self._server.server_address[1]
+
+    def fail_next(self, count):
+        with self._lock:
+            self._failures = count
+
+    def disconnect_next(self, count):
+        with self._lock:
+            self._disconnects = count
+
+    def connected(self):
+        with self._lock:
+            self.connections += 1
+
+    def take_disconnect(self):
+        with self._lock:
+            if self._disconnects:
+                self._disconnects -= 1
+                return True
+            return False
+
+    def take_failure(self):
+        with self._lock:
+            if self._failures:
+                self._failures -= 1
+                return True
+            return False
+
+    def record(self, envelope, data):
+        with self._lock:
+            self.messages.append({'from': envelope['from'], 'to': list(envelope['to']),
+                                  'message': message_from_bytes(data)})
+
+    def start(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
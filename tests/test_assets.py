@@ -0,0 +1,59 @@
+import gzip
+import json
+import os
+import pytest
+from app.services.assets import build_assets, init_assets, asset_url
+
+
+@pytest.fixture
+def static_app(db_app, tmp_path):
+    """db_app with its static folder pointed at a scratch copy holding one source file"""
+    os.makedirs(tmp_path / 'src' / 'js')
+    (tmp_path / 'src' / 'js' / 'app.js').write_text('console.log("hello");\n' * 50)
+    db_app.static_folder = str(tmp_path)
+    return db_app
+
+
+def test_build_fingerprints_and_precompresses(static_app, tmp_path):
+    stats = build_assets(str(tmp_path))
+    manifest = json.loads((tmp_path / 'dist' / 'manifest.json').read_text())
+
+    built = manifest['js/app.js']
+    assert built.startswith('js/app.') and built.endswith('.js') and built != 'js/app.js'
+    source = (tmp_path / 'src' / 'js' / 'app.js').read_bytes()
+    assert gzip.decompress((tmp_path / 'dist' / (built + '.gz')).read_bytes()) == source
+    assert stats['files'] == 1 and 0 < stats['gzip_bytes'] < stats['bytes']
+
+
+def test_asset_url_falls_back_to_source_until_built(static_app, tmp_path):
+    with static_app.test_request_context():
+        assert asset_url('js/app.js') == '/static/src/js/app.js'
+
+        build_assets(str(tmp_path))
+        init_assets(static_app)
+        assert asset_url('js/app.js').startswith('/assets/js/app.')
+
+
+def test_built_assets_are_immutable_and_negotiated(static_app, tmp_path, db_client):
+    build_assets(str(tmp_path))
+    init_assets(static_app)
+    with static_app.test_request_context():
+        url = asset_url('js/app.js')
+
+    response = db_client.get(url, headers={'Accept-Encoding': 'gzip, deflate'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.mimetype == 'text/javascript'
+    assert 'immutable' in response.headers['Cache-Control']
+    assert 'max-age=31536000' in response.headers['Cache-Control']
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert gzip.decompress(response.data).startswith(b'console.log')
+
+    plain = db_client.get(url, headers={'Accept-Encoding': 'identity'})
+    assert 'Content-Encoding' not in plain.headers
+    assert plain.data.startswith(b'console.log')
+
+
+def test_pages_reference_extracted_scripts(db_client):
+    html = db_client.get('/auth/forgot-password').data.decode()
+    assert '/static/src/js/auth/forgot-password.js' in html or '/assets/js/auth/forgot-password.' in html
+    assert 'data-verify-url="/auth/verify-otp"' in html
@@ -0,0 +1,58 @@
+from app.extensions import db
+from app.models.user import User
+from app.services.password_hasher import hash_password, verify_password, shutdown_hasher_pool
+from tests.factories import make_user
+
+
+def test_find_by_login_resolves_username_or_email(db_app):
+    alice = make_user('Alice', email='alice@example.com')
+
+    assert User.find_by_login('Alice') == alice
+    assert User.find_by_login('alice') == alice
+    assert User.find_by_login('ALICE@Example.com') == alice
+    assert User.find_by_login('bob') is None
+    assert User.find_by_login('  ') is None
+
+
+def test_find_by_login_prefers_exact_case_for_legacy_duplicates(db_app):
+    make_user('sam', email='sam@example.com')
+    legacy = make_user('Sam', email='sam2@example.com')
+
+    assert User.find_by_login('Sam') == legacy
+    assert User.username_taken('SAM')
+
+
+def test_login_accepts_username_in_any_case(db_client):
+    make_user('Carol', email='carol@example.com')
+
+    response = db_client.post('/auth/login', data={
+        'email': 'carol', 'password': 'Password1!'
+    })
+    assert response.status_code == 302
+
+
+def test_login_rehashes_outdated_password_hash(db_app, db_client):
+    db_app.config['PASSWORD_HASH_METHOD'] = 'pbkdf2:sha256:500'
+    user = make_user('dana', email='dana@example.com')
+    assert user.password_hash.startswith('pbkdf2:sha256:500$')
+
+    db_app.config['PASSWORD_HASH_METHOD'] = 'pbkdf2:sha256:1000'
+    assert user.password_needs_rehash()
+
+    response = db_client.post('/auth/login', data={'email': 'dana', 'password': 'Password1!'})
+    assert response.status_code == 302
+    db.session.refresh(user)
+    assert user.password_hash.startswith('pbkdf2:sha256:1000$')
+    assert not user.password_needs_rehash()
+    assert user.check_password('Password1!')
+
+
+def test_password_hashing_in_process_pool(db_app):
+    db_app.config['PASSWORD_HASH_WORKERS'] = 2
+    try:
+        hashed = hash_password('s3cret')
+        assert hashed.startswith('pbkdf2:sha256:1000$')
+        assert verify_password(hashed, 's3cret')
+        assert not verify_password(hashed, 'wrong')
+    finally:
+        shutdown_hasher_pool()
@@ -0,0 +1,151 @@
+import random
+import threading
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from app import create_app
+from app.config import config, TestingConfig
+from app.extensions import db
+from app.models.bookings import Booking
+from app.models.occupancy import RoomOccupancy
+from app.services.booking_service import create_booking
+from tests.factories import make_user, make_room
+
+THREADS = 8
+ATTEMPTS_PER_THREAD = 25
+
+
+@pytest.fixture
+def file_db_app(tmp_path):
+    """App on an on-disk SQLite file so threads use separate connections."""
+    class FileDatabaseConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'bookings.db'}"
+        SQLALCHEMY_ENGINE_OPTIONS = {'connect_args': {'timeout': 30}}
+
+    config['file-testing'] = FileDatabaseConfig
+    app = create_app('file-testing')
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+    config.pop('file-testing', None)
+
+
+def test_create_booking_rejects_overlap(db_app):
+    """A second booking over the same nights is refused."""
+    user = make_user()
+    room = make_room()
+    check_in = date.today() + timedelta(days=5)
+
+    ok, _, first, _ = create_booking(user.id, room.id, check_in, check_in + timedelta(days=3))
+    assert ok and first.status == 'pending'
+    assert not RoomOccupancy.is_free(room.id, check_in, check_in + timedelta(days=1))
+
+    ok, message, _, _ = create_booking(user.id, room.id, check_in + timedelta(days=2), check_in + timedelta(days=4))
+    assert not ok and 'no longer available' in message
+
+    ok, _, _, _ = create_booking(user.id, room.id, check_in + timedelta(days=3), check_in + timedelta(days=4))
+    assert ok  # back-to-back stays share no night
+
+
+def test_concurrent_bookings_never_double_book(file_db_app):
+    """Many threads racing for the same rooms produce zero overlapping bookings."""
+    user_id = make_user().id
+    room_ids = [make_room(f'Room {i}').id for i in range(3)]
+    start = date.today() + timedelta(days=1)
+    barrier = threading.Barrier(THREADS)
+    errors = []
+
+    def worker(seed):
+        rng = random.Random(seed)
+        with file_db_app.app_context():
+            barrier.wait()
+            for _ in range(ATTEMPTS_PER_THREAD):
+                check_in = start + timedelta(days=rng.randrange(20))
+                ok, message, _, _ = create_booking(
+                    user_id, rng.choice(room_ids), check_in, check_in + timedelta(days=rng.randint(1, 4))
+                )
+                if not ok and 'no longer available' not in message:
+                    errors.append(message)
+            db.session.remove()
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    bookings = Booking.query.filter(Booking.status.in_(Booking.ACTIVE_STATUSES)).all()
+    assert bookings, 'expected some bookings to succeed'
+    for room_id in room_ids:
+        stays = sorted((b.check_in_date, b.check_out_date) for b in bookings if b.room_id == room_id)
+        for (_, previous_out), (next_in, _) in zip(stays, stays[1:]):
+            assert next_in >= previous_out, f'double booking in room {room_id}: {stays}'
+
+    # The incrementally maintained calendar matches a rebuild from bookings
+    incremental = {(r.room_id, r.month): r.nights for r in RoomOccupancy.query if r.nights}
+    RoomOccupancy.rebuild()
+    assert incremental == {(r.room_id, r.month): r.nights for r in RoomOccupancy.query if r.nights}
+
+
+def test_create_route_returns_conflict(db_client):
+    """POST /bookings/create answers 201, then 409 for the same nights."""
+    user = make_user(password='Password1!')
+    room = make_room()
+    db_client.post('/auth/login', data={'email': user.username, 'password': 'Password1!'})
+
+    check_in = date.today() + timedelta(days=3)
+    payload = {'room_id': room.id, 'check_in': check_in.isoformat(),
+               'check_out': (check_in + timedelta(days=2)).isoformat()}
+    assert db_client.post('/bookings/create', json=payload).status_code == 201
+    assert db_client.post('/bookings/create', json=payload).status_code == 409
+
+
+def _fail_insert(monkeypatch, error):
+    def insert(connection, values):
+        raise error
+    monkeypatch.setattr('app.services.booking_service._insert_if_free', insert)
+
+
+def test_create_route_busy_is_retryable(db_client, monkeypatch):
+    """Lock contention answers 503 + Retry-After, and a retry with the same key runs again."""
+    user = make_user(password='Password1!')
+    room = make_room()
+    db_client.post('/auth/login', data={'email': user.username, 'password': 'Password1!'})
+
+    check_in = date.today() + timedelta(days=3)
+    payload = {'room_id': room.id, 'check_in': check_in.isoformat(),
+               'check_out': (check_in + timedelta(days=2)).isoformat()}
+    headers = {'Idempotency-Key': 'booking-busy'}
+    _fail_insert(monkeypatch, OperationalError('INSERT', {}, Exception('database is locked')))
+    busy = db_client.post('/bookings/create', json=payload, headers=headers)
+    assert busy.status_code == 503
+    assert busy.headers['Retry-After']
+
+    monkeypatch.undo()
+    assert db_client.post('/bookings/create', json=payload, headers=headers).status_code == 201
+
+
+def test_create_route_hides_unexpected_errors(db_client, monkeypatch):
+    """Unexpected failures answer 500 without driver details; other integrity errors are not conflicts."""
+    user = make_user(password='Password1!')
+    room = make_room()
+    db_client.post('/auth/login', data={'email': user.username, 'password': 'Password1!'})
+
+    check_in = date.today() + timedelta(days=3)
+    payload = {'room_id': room.id, 'check_in': check_in.isoformat(),
+               'check_out': (check_in + timedelta(days=2)).isoformat()}
+    _fail_insert(monkeypatch, IntegrityError('INSERT INTO bookings', {}, Exception('FOREIGN KEY constraint failed')))
+    response = db_client.post('/bookings/create', json=payload)
+    assert response.status_code == 500
+    assert 'FOREIGN KEY' not in response.get_json()['message']
+    assert 'no longer available' not in response.get_json()['message']
+
+    _fail_insert(monkeypatch, RuntimeError('SELECT secret FROM somewhere'))
+    response = db_client.post('/bookings/create', json=payload)
+    assert response.status_code == 500
+    assert 'secret' not in response.get_json()['message']
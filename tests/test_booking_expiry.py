@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta
+
+from app import create_app
+from app.config import config, TestingConfig
+from app.extensions import db
+from app.models.bookings import Booking
+from app.models.occupancy import RoomOccupancy
+from app.services.booking_expiry import expire_stale_bookings
+from app.services.scheduler import PeriodicTask
+from tests.factories import make_user, make_room, make_booking
+
+
+def _age(booking, hours):
+    booking.created_at = datetime.utcnow() - timedelta(hours=hours)
+    db.session.commit()
+
+
+def test_expires_only_stale_pending_in_batches(db_app):
+    user = make_user()
+    room = make_room()
+    stale = [make_booking(user, room, start_in_days=2 + 3 * i) for i in range(5)]
+    for booking in stale:
+        _age(booking, 72)
+    fresh = make_booking(user, room, start_in_days=30)
+    old_confirmed = make_booking(user, room, start_in_days=40, status='confirmed')
+    _age(old_confirmed, 72)
+
+    result = expire_stale_bookings(ttl=48 * 3600, batch_size=2)
+
+    assert result['expired'] == 5 and result['batches'] == 3
+    statuses = {b.id: b.status for b in Booking.query}
+    assert {statuses[b.id] for b in stale} == {'expired'}
+    assert statuses[fresh.id] == 'pending'
+    assert statuses[old_confirmed.id] == 'confirmed'
+
+    # Expired nights are free again; the room can be booked for them
+    assert RoomOccupancy.is_free(room.id, stale[0].check_in_date, stale[0].check_out_date)
+    assert room.is_available_for_dates(stale[0].check_in_date, stale[0].check_out_date)
+
+    assert expire_stale_bookings(ttl=48 * 3600, batch_size=2)['expired'] == 0
+
+
+def test_max_batches_bounds_a_run(db_app):
+    user = make_user()
+    room = make_room()
+    for i in range(4):
+        _age(make_booking(user, room, start_in_days=2 + 3 * i), 72)
+
+    assert expire_stale_bookings(ttl=3600, batch_size=1, max_batches=3)['expired'] == 3
+    assert Booking.query.filter_by(status='pending').count() == 1
+
+
+def test_periodic_task_records_last_result(db_app):
+    user = make_user()
+    _age(make_booking(user, make_room()), 72)
+
+    task = PeriodicTask(db_app, 'booking_expiry', lambda: expire_stale_bookings(ttl=3600), interval=60)
+    task.run_once()
+
+    status = task.status()
+    assert status['runs'] == 1 and status['last_error'] is None
+    assert status['last_result']['expired'] == 1
+
+
+def test_in_process_expiry_starts_with_the_first_request(monkeypatch):
+    """CLI runs and pre-fork parents build the app but never serve: no expiry thread for them."""
+    class InProcessExpiryConfig(TestingConfig):
+        BOOKING_EXPIRY_IN_PROCESS = True
+        BOOKING_EXPIRY_INTERVAL = 3600
+
+    monkeypatch.setitem(config, 'expiry-testing', InProcessExpiryConfig)
+    app = create_app('expiry-testing')
+    with app.app_context():
+        db.create_all()
+    assert app.extensions['periodic_tasks'] == {}
+
+    app.test_client().get('/about')
+    app.test_client().get('/about')
+    task = app.extensions['periodic_tasks']['booking_expiry']
+    try:
+        assert task._thread.is_alive()
+    finally:
+        task.stop(5)
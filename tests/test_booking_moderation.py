@@ -0,0 +1,75 @@
+from app.models.bookings import Booking
+from app.models.occupancy import RoomOccupancy
+from app.services.booking_service import moderate_bookings
+from tests.factories import make_user, make_room, make_booking
+
+
+def _login(client, user):
+    client.post('/auth/login', data={'email': user.username, 'password': 'Password1!'})
+
+
+def test_bulk_approve_reports_per_id_outcomes(db_app):
+    user = make_user()
+    room = make_room()
+    pending = [make_booking(user, room, start_in_days=2 + 3 * i).id for i in range(3)]
+    cancelled = make_booking(user, room, start_in_days=30, status='cancelled').id
+
+    success, message, results, _ = moderate_bookings(pending + [cancelled, 9999], 'approve')
+
+    assert success and message == '3 of 5 bookings updated'
+    outcomes = {r['id']: (r['success'], r['status']) for r in results}
+    assert outcomes == {
+        pending[0]: (True, 'confirmed'), pending[1]: (True, 'confirmed'), pending[2]: (True, 'confirmed'),
+        cancelled: (False, 'cancelled'), 9999: (False, None)
+    }
+    assert {b.status for b in Booking.query.filter(Booking.id.in_(pending))} == {'confirmed'}
+
+    # Already confirmed: same rule as Booking.approve()
+    _, _, again, _ = moderate_bookings(pending[:1], 'approve')
+    assert again[0]['message'] == 'Only pending bookings can be approved'
+
+
+def test_bulk_reject_releases_nights(db_app):
+    user = make_user()
+    room = make_room()
+    bookings = [make_booking(user, room, start_in_days=2 + 3 * i) for i in range(2)]
+    ids = [b.id for b in bookings]
+
+    moderate_bookings(ids, 'reject', 'Room closed')
+
+    rejected = Booking.query.filter(Booking.id.in_(ids)).all()
+    assert {(b.status, b.rejection_reason) for b in rejected} == {('rejected', 'Room closed')}
+    assert not any(row.nights for row in RoomOccupancy.query)
+
+
+def test_moderation_route_requires_admin(db_client):
+    user = make_user()
+    admin = make_user('admin', role='admin')
+    booking_id = make_booking(user, make_room()).id
+    payload = {'action': 'approve', 'booking_ids': [booking_id]}
+
+    _login(db_client, user)
+    assert db_client.post('/admin/bookings/moderate', json=payload).status_code == 403
+    db_client.get('/auth/logout')
+
+    _login(db_client, admin)
+    response = db_client.post('/admin/bookings/moderate', json=payload)
+    assert response.status_code == 200
+    assert response.get_json()['results'][0]['status'] == 'confirmed'
+    assert db_client.post('/admin/bookings/moderate', json={'action': 'delete', 'booking_ids': [1]}).status_code == 400
+
+
+def test_moderation_failure_is_a_server_error_without_details(db_client, monkeypatch):
+    admin = make_user('admin', role='admin')
+    booking_id = make_booking(make_user(), make_room()).id
+
+    def broken(connection, changes):
+        raise RuntimeError('relation "room_daily_stats" does not exist')
+
+    monkeypatch.setattr('app.services.booking_service.dispatch_status_changes', broken)
+    _login(db_client, admin)
+    response = db_client.post('/admin/bookings/moderate', json={'action': 'approve', 'booking_ids': [booking_id]})
+
+    assert response.status_code == 500
+    assert 'room_daily_stats' not in response.get_json()['message']
+    assert Booking.query.filter_by(id=booking_id).one().status == 'pending'
@@ -0,0 +1,57 @@
+import time
+
+from flask_mail import Message
+
+from app.services.bulk_mailer import BulkMailer, RateLimiter
+from app.services.notifications import send_booking_reminders
+from tests.factories import make_user, make_room, make_booking
+
+
+def _messages(count):
+    return (Message(subject=f'Offer {i}', recipients=[f'guest{i}@example.com'], body='Hi') for i in range(count))
+
+
+def test_reuses_a_small_pool_of_connections(mail_app, smtp_server):
+    stats = BulkMailer(connections=3, batch_size=10).send(_messages(120))
+
+    assert stats['sent'] == 120 and stats['failed'] == 0
+    assert stats['batches'] == 12
+    assert stats['connections'] == smtp_server.connections == 3
+    assert stats['messages_per_second'] > 0
+    assert sorted(m['message']['Subject'] for m in smtp_server.messages) == sorted(f'Offer {i}' for i in range(120))
+
+
+def test_reconnects_and_retries_after_failures(mail_app, smtp_server):
+    smtp_server.disconnect_next(2)
+    smtp_server.fail_next(1)
+    smtp_server.reject_recipients.add('guest3@example.com')
+
+    stats = BulkMailer(connections=1, batch_size=5).send(_messages(10))
+
+    assert stats['sent'] == 9 and stats['failed'] == 1
+    assert stats['reconnects'] == 2 and stats['retries'] == 3
+    assert stats['failures'][0][0] == ['guest3@example.com']
+    assert len(smtp_server.messages) == 9
+
+
+def test_rate_limiter_caps_throughput():
+    limiter = RateLimiter(rate=200, burst=1)
+    started = time.perf_counter()
+    for _ in range(21):
+        limiter.acquire()
+    assert time.perf_counter() - started >= 0.09
+
+
+def test_booking_reminders_go_to_confirmed_guests(mail_app, smtp_server):
+    room = make_room('Sea View')
+    make_booking(make_user('alice'), room, start_in_days=1, status='confirmed')
+    make_booking(make_user('bob'), room, start_in_days=5, status='confirmed')
+    make_booking(make_user('carol'), make_room('Garden'), start_in_days=1, status='pending')
+
+    stats = send_booking_reminders(days_ahead=1, connections=2)
+
+    assert stats['sent'] == 1
+    delivered = smtp_server.messages[0]
+    assert delivered['to'] == ['<alice@example.com>']
+    parts = [part.get_content_type() for part in delivered['message'].walk()]
+    assert 'text/plain' in parts and 'text/html' in parts
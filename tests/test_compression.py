@@ -0,0 +1,69 @@
+import gzip
+from unittest.mock import patch
+from flask import Response
+from app.services.compression import compress_bytes
+
+GZIP = {'Accept-Encoding': 'gzip'}
+
+
+def _add_route(app, rule, view):
+    app.add_url_rule(rule, view.__name__, view)
+
+
+def test_html_is_gzipped_when_accepted(db_app, db_client):
+    plain = db_client.get('/contact')
+    compressed = db_client.get('/contact', headers=GZIP)
+
+    assert 'Content-Encoding' not in plain.headers
+    assert compressed.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in compressed.headers['Vary']
+    assert len(compressed.data) < len(plain.data) / 3
+    assert gzip.decompress(compressed.data) == plain.data
+
+
+def test_small_and_binary_bodies_are_left_alone(db_app, db_client):
+    def tiny():
+        return {'ok': True}
+
+    def image():
+        return Response(b'\x89PNG' * 1000, mimetype='image/png')
+
+    _add_route(db_app, '/_test/tiny', tiny)
+    _add_route(db_app, '/_test/image', image)
+    assert 'Content-Encoding' not in db_client.get('/_test/tiny', headers=GZIP).headers
+    assert 'Content-Encoding' not in db_client.get('/_test/image', headers=GZIP).headers
+
+
+def test_streamed_bodies_are_compressed_incrementally(db_app, db_client):
+    def export():
+        return Response((f'{i},row\n' for i in range(50000)), mimetype='text/csv')
+
+    _add_route(db_app, '/_test/export', export)
+    response = db_client.get('/_test/export', headers=GZIP)
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Content-Length' not in response.headers
+    assert gzip.decompress(response.data).count(b'\n') == 50000
+
+
+def test_etag_is_made_encoding_specific(db_app, db_client):
+    def tagged():
+        response = Response('x' * 2000, mimetype='text/plain')
+        response.set_etag('abc')
+        return response
+
+    _add_route(db_app, '/_test/tagged', tagged)
+    assert db_client.get('/_test/tagged', headers=GZIP).headers['ETag'] == '"abc-gzip"'
+
+
+def test_cached_pages_are_compressed_once(db_app, db_client):
+    with patch('app.services.page_cache.compress_bytes', side_effect=compress_bytes) as compress:
+        first = db_client.get('/faq', headers=GZIP)
+        second = db_client.get('/faq', headers=GZIP)
+        revalidated = db_client.get('/faq', headers={**GZIP, 'If-None-Match': second.headers['ETag']})
+
+    assert compress.call_count == 1
+    assert first.data == second.data
+    assert second.headers['Content-Encoding'] == 'gzip'
+    assert second.headers['ETag'].endswith('-gzip"')
+    assert revalidated.status_code == 304
+    assert gzip.decompress(second.data) == db_client.get('/faq').data
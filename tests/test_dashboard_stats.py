@@ -0,0 +1,79 @@
+from datetime import date, timedelta
+
+from app.extensions import db
+from app.models.booking_stats import RoomDailyStats, RoomTypeDailyStats, dashboard_summary, rebuild_daily_stats
+from app.services.booking_service import moderate_bookings
+from tests.factories import make_user, make_room, make_booking
+
+
+def _snapshot(model):
+    key = model.KEY_COLUMN
+    return {(row.day, getattr(row, key), row.status): (row.arrivals, row.nights, round(row.revenue, 6))
+            for row in model.query if row.arrivals or row.nights}
+
+
+def test_rollups_follow_booking_changes(db_app):
+    user = make_user()
+    standard = make_room('Standard Room', 'Standard', price=100.0)
+    deluxe = make_room('Deluxe Room', 'Deluxe', price=250.0)
+
+    stay = make_booking(user, standard, start_in_days=1, nights=2)
+    cancelled = make_booking(user, deluxe, start_in_days=3, nights=1)
+    to_reject = make_booking(user, deluxe, start_in_days=6, nights=2)
+    stay.approve()
+    cancelled.approve()
+    db.session.commit()
+    cancelled.cancel()
+    db.session.commit()
+    moderate_bookings([to_reject.id], 'reject')
+
+    start = date.today()
+    summary = dashboard_summary(start, start + timedelta(days=10))
+
+    assert summary['totals']['nights_sold'] == 2
+    assert summary['totals']['revenue'] == 200.0
+    assert summary['totals']['occupancy'] == round(2 / (2 * 10), 4)
+    assert summary['totals']['bookings_by_status'] == {'confirmed': 1, 'cancelled': 1, 'rejected': 1}
+    assert summary['room_types']['Deluxe']['bookings_by_status'] == {'cancelled': 1, 'rejected': 1}
+
+    # Incremental maintenance agrees with a rebuild from the bookings table
+    incremental = (_snapshot(RoomDailyStats), _snapshot(RoomTypeDailyStats))
+    rebuild_daily_stats()
+    assert (_snapshot(RoomDailyStats), _snapshot(RoomTypeDailyStats)) == incremental
+
+
+def test_rebuild_in_small_chunks_splits_stays_correctly(db_app):
+    """Stays crossing chunk boundaries keep one arrival and their nightly revenue."""
+    user = make_user()
+    room = make_room(price=90.0)
+    make_booking(user, room, start_in_days=1, nights=5, status='confirmed')
+    make_booking(user, room, start_in_days=8, nights=3)
+
+    incremental = (_snapshot(RoomDailyStats), _snapshot(RoomTypeDailyStats))
+    assert rebuild_daily_stats(chunk_days=2) == 8
+    assert (_snapshot(RoomDailyStats), _snapshot(RoomTypeDailyStats)) == incremental
+
+
+def test_moving_a_booking_moves_its_nights(db_app):
+    user = make_user()
+    room = make_room()
+    booking = make_booking(user, room, start_in_days=2, nights=1, status='confirmed')
+
+    booking.check_in_date += timedelta(days=5)
+    booking.check_out_date += timedelta(days=5)
+    db.session.commit()
+
+    days = {day for (day, _, _) in _snapshot(RoomDailyStats)}
+    assert days == {booking.check_in_date}
+
+
+def test_dashboard_requires_admin(db_client):
+    admin = make_user('admin', role='admin')
+    make_booking(make_user(), make_room(), status='confirmed')
+
+    assert db_client.get('/admin/dashboard').status_code == 302  # to login
+
+    db_client.post('/auth/login', data={'email': admin.username, 'password': 'Password1!'})
+    assert db_client.get('/admin/dashboard').status_code == 200
+    stats = db_client.get('/admin/api/stats?days=7').get_json()['stats']
+    assert stats['days'] == 7 and stats['totals']['nights_sold'] == 2
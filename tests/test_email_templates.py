@@ -0,0 +1,36 @@
+from app.models.mail_outbox import OutboxMessage
+from app.services.email_templates import inline_css, render_email, _compiled
+from app.utils import send_password_reset_confirmation_email
+
+
+def test_inline_css_moves_rules_onto_elements():
+    html = (
+        '<html><head><style>p { color: red; } .note, .tip { margin: 0; }</style></head>'
+        '<body><p class="note" style="font-weight: bold;">Hi</p><div class="tip">x</div></body></html>'
+    )
+    inlined = inline_css(html)
+
+    assert '<style' not in inlined
+    assert '<p style="color: red; margin: 0; font-weight: bold">Hi</p>' in inlined
+    assert '<div style="margin: 0">x</div>' in inlined
+
+
+def test_render_email_html_and_text(db_app):
+    html, text = render_email('otp', username='<Guest>', otp_code='123456', expires_minutes=10)
+
+    assert '<style' not in html and 'letter-spacing: 5px' in html
+    assert '&lt;Guest&gt;' in html  # HTML part is autoescaped
+    assert '123456' in text and '<Guest>' in text and '<' not in text.replace('<Guest>', '')
+
+    # Compiled once, then reused
+    assert _compiled(db_app, 'otp.html') is _compiled(db_app, 'otp.html')
+
+
+def test_reset_confirmation_has_absolute_login_link(db_app):
+    with db_app.test_request_context():
+        success, _ = send_password_reset_confirmation_email('guest@example.com', 'Guest')
+
+    queued = OutboxMessage.query.one()
+    assert success
+    assert 'href="http://localhost/auth/login"' in queued.html
+    assert 'http://localhost/auth/login' in queued.body
@@ -0,0 +1,120 @@
+from datetime import date, datetime, timedelta
+
+from app.extensions import db
+from app.models.bookings import Booking
+from app.models.idempotency import IdempotencyKey
+from app.models.user import User
+from tests.factories import make_user, make_room
+
+
+def _register_form(username='newguest'):
+    return {
+        'first_name': 'New', 'last_name': 'Guest', 'username': username,
+        'email': f'{username}@example.com', 'phone': '',
+        'password': 'Password1!', 'confirm_password': 'Password1!'
+    }
+
+
+def test_register_retry_replays_response(db_client):
+    """A retried registration returns the first response without a second insert."""
+    headers = {'Idempotency-Key': 'register-1'}
+    first = db_client.post('/auth/register', data=_register_form(), headers=headers)
+    retry = db_client.post('/auth/register', data=_register_form(), headers=headers)
+
+    assert first.status_code == 302
+    assert retry.status_code == 302
+    assert retry.headers['Location'] == first.headers['Location']
+    assert retry.headers['Idempotent-Replayed'] == 'true'
+    assert User.query.filter_by(username='newguest').count() == 1
+
+
+def test_key_reused_for_different_body_is_rejected(db_client):
+    headers = {'Idempotency-Key': 'register-2'}
+    db_client.post('/auth/register', data=_register_form('first'), headers=headers)
+    response = db_client.post('/auth/register', data=_register_form('second'), headers=headers)
+
+    assert response.status_code == 422
+    assert User.query.filter_by(username='second').count() == 0
+
+
+def test_booking_create_retry_does_not_conflict(db_client):
+    """Without the key a retry would hit the overlap check (409); with it, it replays the 201."""
+    user = make_user()
+    room = make_room()
+    db_client.post('/auth/login', data={'email': user.username, 'password': 'Password1!'})
+
+    check_in = date.today() + timedelta(days=3)
+    payload = {'room_id': room.id, 'check_in': check_in.isoformat(),
+               'check_out': (check_in + timedelta(days=2)).isoformat()}
+    headers = {'Idempotency-Key': 'booking-1'}
+    first = db_client.post('/bookings/create', json=payload, headers=headers)
+    retry = db_client.post('/bookings/create', json=payload, headers=headers)
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.get_json() == first.get_json()
+    assert Booking.query.count() == 1
+
+
+def test_sweep_expired_keys(db_app):
+    now = datetime.utcnow()
+    for i in range(5):
+        db.session.add(IdempotencyKey(scope='anonymous:test', key=f'k{i}', request_hash='x',
+                                      expires_at=now + timedelta(hours=1 if i < 2 else -1)))
+    db.session.commit()
+
+    assert IdempotencyKey.sweep_expired(batch_size=2) == 3
+    assert IdempotencyKey.query.count() == 2
+
+
+def _booking_request(db_client):
+    user = make_user()
+    room = make_room()
+    db_client.post('/auth/login', data={'email': user.username, 'password': 'Password1!'})
+    check_in = date.today() + timedelta(days=3)
+    payload = {'room_id': room.id, 'check_in': check_in.isoformat(),
+               'check_out': (check_in + timedelta(days=2)).isoformat()}
+    return f'user:{user.id}:booking.create', payload
+
+
+def _processing_key(scope, key, locked_until):
+    db.session.add(IdempotencyKey(scope=scope, key=key, request_hash='x', locked_until=locked_until,
+                                  expires_at=datetime.utcnow() + timedelta(hours=24)))
+    db.session.commit()
+
+
+def test_key_held_by_a_live_request_is_not_taken_over(db_app):
+    first, created = IdempotencyKey.claim('user:1:booking.create', 'live', 'h', ttl=3600, lease=60)
+    assert created
+    second, created = IdempotencyKey.claim('user:1:booking.create', 'live', 'h', ttl=3600, lease=60)
+    assert not created and second.status == 'processing'
+
+
+def test_key_of_a_dead_request_is_taken_over(db_client):
+    """A request killed mid-flight never released its key; its lease runs out instead."""
+    scope, payload = _booking_request(db_client)
+    _processing_key(scope, 'booking-dead', datetime.utcnow() - timedelta(seconds=1))
+    headers = {'Idempotency-Key': 'booking-dead'}
+    first = db_client.post('/bookings/create', json=payload, headers=headers)
+    retry = db_client.post('/bookings/create', json=payload, headers=headers)
+
+    assert first.status_code == 201
+    assert retry.status_code == 201 and retry.headers['Idempotent-Replayed'] == 'true'
+    assert IdempotencyKey.query.one().locked_until is None
+
+
+def test_view_exception_releases_key_after_failed_flush(db_app):
+    """The key is freed even when the view left the session needing a rollback."""
+    from app.services.idempotency import idempotent
+
+    @idempotent
+    def failing_view():
+        db.session.add(User(username=None))
+        db.session.flush()  # IntegrityError: NOT NULL
+
+    with db_app.test_request_context('/x', method='POST', headers={'Idempotency-Key': 'broken'}):
+        try:
+            failing_view()
+        except Exception as e:
+            error = e
+    assert 'NOT NULL' in str(error)
+    assert IdempotencyKey.query.count() == 0
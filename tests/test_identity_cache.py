@@ -0,0 +1,117 @@
+import time
+
+from flask import g
+from sqlalchemy import event
+
+from app.extensions import db
+from app.services.identity_cache import IdentityCache, get_identity_cache
+from tests.factories import make_user
+
+
+def _login(client, user):
+    client.post('/auth/login', data={'email': user.username, 'password': 'Password1!'})
+
+
+def _get(client, url):
+    # The fixture's app context (and its g) outlives each test request;
+    # drop Flask-Login's per-request user so the loader runs like in production
+    g.pop('_login_user', None)
+    return client.get(url)
+
+
+def _count_user_queries(engine):
+    queries = []
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if 'FROM users' in statement:
+            queries.append(statement)
+    return queries
+
+
+def test_authenticated_requests_hit_the_cache(db_client):
+    user = make_user()
+    _login(db_client, user)
+    _get(db_client, '/profile/')  # first request after login loads the snapshot
+
+    queries = _count_user_queries(db.engine)
+    for _ in range(5):
+        assert _get(db_client, '/profile/').status_code == 200
+
+    assert queries == []
+    stats = get_identity_cache().stats()
+    assert stats['hits'] >= 5 and stats['hit_rate'] > 0.5
+
+
+def test_profile_edit_invalidates_snapshot(db_client):
+    user = make_user()
+    _login(db_client, user)
+    _get(db_client, '/profile/')
+
+    db_client.post('/profile/edit', data={'first_name': 'Renamed', 'last_name': '', 'phone': ''})
+
+    assert b'Renamed' in _get(db_client, '/profile/').data
+    assert get_identity_cache().stats()['invalidations'] == 1
+
+
+def test_change_password_uses_the_database_row(db_client):
+    user = make_user()
+    _login(db_client, user)
+    response = db_client.post('/profile/change-password', data={
+        'current_password': 'Password1!', 'new_password': 'Changed2@x', 'confirm_password': 'Changed2@x'
+    })
+
+    assert response.status_code == 302
+    db.session.expire_all()
+    assert user.check_password('Changed2@x')
+
+
+def test_lru_eviction_and_ttl():
+    cache = IdentityCache(maxsize=2, ttl=0.05)
+    loads = []
+    loader = lambda user_id: loads.append(user_id) or f'user-{user_id}'
+
+    for user_id in (1, 2, 1, 3):  # 3 evicts 2, the least recently used
+        cache.get_or_load(user_id, loader)
+    cache.get_or_load(1, loader)
+    cache.get_or_load(2, loader)
+    assert loads == [1, 2, 3, 2]
+    assert cache.stats()['evictions'] == 2
+
+    time.sleep(0.06)
+    cache.get_or_load(2, loader)
+    assert loads[-1] == 2 and len(loads) == 5
+
+
+def test_invalidation_during_load_is_not_overwritten():
+    cache = IdentityCache()
+
+    def stale_loader(user_id):
+        cache.invalidate([user_id])  # a commit lands while we read the old row
+        return 'stale'
+
+    assert cache.get_or_load(7, stale_loader) == 'stale'
+    assert cache.get_or_load(7, lambda user_id: 'fresh') == 'fresh'
+
+
+def test_clear_during_load_is_not_overwritten():
+    cache = IdentityCache()
+
+    def stale_loader(user_id):
+        cache.clear()  # e.g. a bulk change lands while we read the old row
+        return 'stale'
+
+    assert cache.get_or_load(8, stale_loader) == 'stale'
+    assert cache.get_or_load(8, lambda user_id: 'fresh') == 'fresh'
+
+
+def test_invalidations_do_not_accumulate_state():
+    cache = IdentityCache()
+    cache.invalidate(range(1000))  # ids that were never loaded
+    cache.get_or_load(1, lambda user_id: 'one')
+    cache.invalidate([1, 2])
+    try:
+        cache.get_or_load(3, lambda user_id: 1 / 0)
+    except ZeroDivisionError:
+        pass
+    assert cache._loading == {}
@@ -0,0 +1,103 @@
+import time
+from datetime import datetime, timedelta
+
+from flask_mail import Message
+
+from app.extensions import db
+from app.models.mail_outbox import OutboxMessage
+from app.services.mail_outbox import queue_mail, process_outbox, retry_dead_messages, MailWorkerPool
+
+
+def _queue(subject='Hello', to='guest@example.com'):
+    queue_mail(Message(subject=subject, recipients=[to], html='<p>Hi</p>'))
+
+
+def test_registration_returns_before_delivery(mail_app, smtp_server):
+    """The request only writes the outbox row; the SMTP server sees nothing until a worker runs."""
+    client = mail_app.test_client()
+    response = client.post('/auth/register', data={
+        'first_name': 'New', 'username': 'newguest', 'email': 'new@example.com',
+        'password': 'Password1!', 'confirm_password': 'Password1!'
+    })
+
+    assert response.status_code == 302
+    assert smtp_server.messages == []
+    assert OutboxMessage.query.one().status == 'pending'
+
+    assert process_outbox()['sent'] == 1
+    delivered = smtp_server.messages[0]
+    assert delivered['to'] == ['<new@example.com>']
+    assert delivered['message']['Subject'] == 'Welcome to QuickStay!'
+    assert OutboxMessage.query.one().status == 'sent'
+
+
+def test_failed_delivery_is_retried_then_dead_lettered(mail_app, smtp_server):
+    _queue()
+    smtp_server.fail_next(1)
+    assert process_outbox() == {'claimed': 1, 'sent': 0, 'retried': 1, 'dead': 0}
+    assert 'Temporary failure' in OutboxMessage.query.one().last_error
+
+    assert process_outbox()['sent'] == 1
+    assert len(smtp_server.messages) == 1
+
+    _queue('Doomed')
+    smtp_server.fail_next(3)
+    for _ in range(3):
+        process_outbox()
+    doomed = OutboxMessage.query.filter_by(subject='Doomed').one()
+    assert (doomed.status, doomed.attempts) == ('dead', 3)
+
+    assert retry_dead_messages() == 1
+    assert process_outbox()['sent'] == 1
+
+
+def test_backoff_delays_the_next_attempt(mail_app, smtp_server):
+    mail_app.config['MAIL_OUTBOX_BACKOFF_BASE'] = 60
+    _queue()
+    smtp_server.fail_next(1)
+    process_outbox()
+
+    row = OutboxMessage.query.one()
+    assert row.next_attempt_at > datetime.utcnow() + timedelta(seconds=40)
+    assert process_outbox()['claimed'] == 0
+
+
+def test_expired_lease_is_reclaimed(mail_app, smtp_server):
+    """A message left 'sending' by a crashed worker is delivered once its lease runs out."""
+    _queue()
+    row = OutboxMessage.query.one()
+    row.status, row.locked_until = 'sending', datetime.utcnow() - timedelta(seconds=1)
+    db.session.commit()
+
+    assert process_outbox()['sent'] == 1
+
+
+def test_worker_pool_delivers_each_message_once(mail_app, smtp_server):
+    for i in range(30):
+        _queue(f'Message {i}')
+
+    pool = MailWorkerPool(mail_app, workers=3, poll_interval=0.05).start()
+    deadline = time.monotonic() + 10
+    while len(smtp_server.messages) < 30 and time.monotonic() < deadline:
+        time.sleep(0.05)
+    pool.stop(timeout=5)
+
+    subjects = sorted(m['message']['Subject'] for m in smtp_server.messages)
+    assert subjects == sorted(f'Message {i}' for i in range(30))
+    assert OutboxMessage.query.filter_by(status='sent').count() == 30
+
+
+def test_sent_messages_are_scrubbed_then_swept(mail_app, smtp_server):
+    """Delivered bodies (which may hold reset codes) are not kept, and old rows are deleted."""
+    _queue('Old')
+    _queue('Recent')
+    process_outbox()
+    assert [(row.html, row.body) for row in OutboxMessage.query] == [(None, None), (None, None)]
+
+    old = OutboxMessage.query.filter_by(subject='Old').one()
+    old.sent_at = datetime.utcnow() - timedelta(days=8)
+    _queue('Pending')
+    db.session.commit()
+
+    assert OutboxMessage.sweep_sent(retention=7 * 86400, batch_size=1) == 1
+    assert sorted(row.subject for row in OutboxMessage.query) == ['Pending', 'Recent']
@@ -0,0 +1,72 @@
+from datetime import date, timedelta
+from app.extensions import db
+from app.models.occupancy import RoomOccupancy
+from tests.factories import make_user, make_room, make_booking
+
+
+def _snapshot():
+    return {(row.room_id, row.month): row.nights for row in RoomOccupancy.query if row.nights}
+
+
+def test_month_masks_split_across_months():
+    """A stay spanning a month boundary sets bits in both months."""
+    masks = RoomOccupancy.month_masks(date(2026, 1, 30), date(2026, 2, 2))
+    assert masks == {date(2026, 1, 1): (1 << 29) | (1 << 30), date(2026, 2, 1): 1}
+
+
+def test_calendar_follows_booking_lifecycle(db_app):
+    """Nights are held while pending/confirmed and released on cancel/reject."""
+    user = make_user()
+    room = make_room()
+    held = make_booking(user, room, start_in_days=10, nights=3)
+    check_in = held.check_in_date
+
+    assert not RoomOccupancy.is_free(room.id, check_in, check_in + timedelta(days=1))
+    assert RoomOccupancy.is_free(room.id, check_in + timedelta(days=3), check_in + timedelta(days=5))
+
+    held.approve()
+    db.session.commit()
+    assert not RoomOccupancy.is_free(room.id, check_in, check_in + timedelta(days=3))
+
+    held.cancel()
+    db.session.commit()
+    assert RoomOccupancy.is_free(room.id, check_in, check_in + timedelta(days=3))
+
+    other = make_booking(user, room, start_in_days=20, nights=2)
+    other.reject('Overbooked')
+    db.session.commit()
+    assert _snapshot() == {}
+
+
+def test_free_nights_and_rebuild_agree(db_app):
+    """free_nights reflects held nights and a rebuild reproduces the calendar."""
+    user = make_user()
+    rooms = [make_room('A'), make_room('B')]
+    booking = make_booking(user, rooms[0], start_in_days=5, nights=2, status='confirmed')
+    make_booking(user, rooms[1], start_in_days=8, nights=1, status='cancelled')
+
+    month = booking.check_in_date
+    free = RoomOccupancy.free_nights([r.id for r in rooms], month.year, month.month)
+    assert booking.check_in_date.day not in free[rooms[0].id]
+    assert len(free[rooms[1].id]) == RoomOccupancy.days_in(month.replace(day=1))
+
+    before = _snapshot()
+    db.session.execute(db.delete(RoomOccupancy))
+    db.session.commit()
+    RoomOccupancy.rebuild()
+    assert _snapshot() == before
+
+
+def test_calendar_api_lists_free_nights(db_client):
+    """The calendar endpoint returns free nights per room per month."""
+    user = make_user()
+    room = make_room()
+    booking = make_booking(user, room, start_in_days=3, nights=1)
+    month = booking.check_in_date.strftime('%Y-%m')
+
+    response = db_client.get(f'/api/rooms/calendar?room_id={room.id}&month={month}&months=2')
+    assert response.status_code == 200
+    free = response.get_json()['free_nights'][str(room.id)]
+    assert len(free) == 2
+    assert booking.check_in_date.day not in free[month]
+    assert db_client.get('/api/rooms/calendar?month=2026-13').status_code == 400
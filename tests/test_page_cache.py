@@ -0,0 +1,61 @@
+from unittest.mock import patch
+from app.services.page_cache import PageCache, CachedPage, get_page_cache
+from tests.factories import make_user
+
+
+def _login(client, username):
+    make_user(username, email=f'{username}@example.com')
+    client.post('/auth/login', data={'email': username, 'password': 'Password1!'})
+
+
+def test_anonymous_pages_are_rendered_once(db_app, db_client):
+    with patch('app.controllers.main_controller.render_template', return_value='<p>home</p>') as render:
+        first = db_client.get('/')
+        second = db_client.get('/')
+
+    assert render.call_count == 1
+    assert first.data == second.data == b'<p>home</p>'
+    assert second.headers['ETag'] == first.headers['ETag']
+    assert 'public' in second.headers['Cache-Control'] and 'max-age=300' in second.headers['Cache-Control']
+    assert get_page_cache().stats()['hits'] == 1
+
+
+def test_if_none_match_returns_304(db_app, db_client):
+    etag = db_client.get('/about').headers['ETag']
+    response = db_client.get('/about', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+
+
+def test_rooms_cache_varies_on_query_string(db_app, db_client):
+    db_client.get('/rooms?guests=2')
+    db_client.get('/rooms?guests=3')
+    db_client.get('/rooms?guests=2')
+    stats = get_page_cache().stats()
+    assert (stats['entries'], stats['hits']) == (2, 1)
+
+
+def test_not_found_page_is_cached_without_etag(db_app, db_client):
+    db_client.get('/missing-page')
+    response = db_client.get('/another-missing-page')
+    assert response.status_code == 404
+    assert 'ETag' not in response.headers
+    assert get_page_cache().stats()['hits'] == 1
+
+
+def test_signed_in_users_and_flashes_bypass_the_cache(db_app, db_client):
+    _login(db_client, 'gina')  # leaves a "Welcome back" flash in the session
+    db_client.get('/faq')
+    db_client.get('/faq')
+    assert get_page_cache().stats()['entries'] == 0
+
+
+def test_lru_evicts_by_bytes():
+    cache = PageCache(max_entries=10, max_bytes=10)
+    cache.set('a', CachedPage(b'12345', 200, 'text/html'))
+    cache.set('b', CachedPage(b'12345', 200, 'text/html'))
+    cache.get('a')
+    cache.set('c', CachedPage(b'123', 200, 'text/html'))
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
+    assert cache.stats()['evictions'] == 1
@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta
+from app.extensions import db
+from app.models.otp import PasswordResetOTP
+from tests.factories import make_user
+
+
+def test_codes_are_stored_hashed_and_replaced_on_resend(db_app):
+    user = make_user()
+    PasswordResetOTP.issue(user.id, '123456')
+    db.session.commit()
+    PasswordResetOTP.issue(user.id, '654321')
+    db.session.commit()
+
+    rows = PasswordResetOTP.query.all()
+    assert len(rows) == 1
+    assert '654321' not in rows[0].code_hash
+    assert not PasswordResetOTP.verify(user.id, '123456')
+    assert PasswordResetOTP.verify(user.id, '654321')
+
+
+def test_code_locks_after_max_attempts(db_app):
+    db_app.config['OTP_MAX_ATTEMPTS'] = 3
+    user = make_user()
+    PasswordResetOTP.issue(user.id, '123456')
+    db.session.commit()
+
+    assert not PasswordResetOTP.verify(user.id, '000000')
+    assert not PasswordResetOTP.verify(user.id, '111111')
+    assert PasswordResetOTP.verify(user.id, '123456')
+    # Attempts are used up, even for the right code
+    assert not PasswordResetOTP.verify(user.id, '123456')
+
+
+def test_expired_codes_fail_and_are_swept(db_app):
+    user, other = make_user('a'), make_user('b')
+    PasswordResetOTP.issue(user.id, '123456', ttl=1)
+    PasswordResetOTP.issue(other.id, '123456')
+    db.session.commit()
+    db.session.execute(db.update(PasswordResetOTP).where(PasswordResetOTP.user_id == user.id)
+                       .values(expires_at=datetime.utcnow() - timedelta(seconds=1)))
+    db.session.commit()
+
+    assert not PasswordResetOTP.verify(user.id, '123456')
+    assert PasswordResetOTP.sweep_expired() == 1
+    assert [row.user_id for row in PasswordResetOTP.query.all()] == [other.id]
+
+
+def test_reset_flow_leaves_user_row_untouched_until_reset(db_app, db_client, monkeypatch):
+    monkeypatch.setattr('app.controllers.auth_controller.generate_otp', lambda: '424242')
+    user = make_user('frank', email='frank@example.com')
+    updated_at = user.updated_at
+
+    response = db_client.post('/auth/forgot-password', data={'email': 'frank@example.com'})
+    assert response.get_json()['success']
+    db.session.refresh(user)
+    assert user.updated_at == updated_at
+
+    response = db_client.post('/auth/verify-otp', data={'otp': '424242'})
+    assert response.get_json()['success']
+
+    response = db_client.post('/auth/reset-password', data={
+        'new_password': 'NewPassword1!', 'confirm_new_password': 'NewPassword1!'
+    })
+    assert response.get_json()['success']
+    assert PasswordResetOTP.query.count() == 0
+    db.session.refresh(user)
+    assert user.check_password('NewPassword1!')
@@ -0,0 +1,91 @@
+from datetime import date, datetime, timedelta
+from app.extensions import db
+from app.models.room import Room
+from app.models.bookings import Booking
+from app.models.user import User
+from tests.factories import make_user, make_room
+
+
+def _query_plan(query):
+    """Return SQLite's EXPLAIN QUERY PLAN detail lines for an ORM query"""
+    statement = query.statement if hasattr(query, 'statement') else query
+    compiled = statement.compile(dialect=db.engine.dialect, compile_kwargs={'literal_binds': True})
+    rows = db.session.connection().exec_driver_sql(f'EXPLAIN QUERY PLAN {compiled}').fetchall()
+    return [row[-1] for row in rows]
+
+
+def _assert_indexed(query, table):
+    plan = _query_plan(query)
+    scans = [line for line in plan if line.startswith(f'SCAN {table}') and 'INDEX' not in line]
+    assert not scans, f'{table} is sequentially scanned: {plan}'
+    assert any(line.startswith(f'SEARCH {table}') for line in plan), plan
+
+
+def test_overlap_check_uses_index(db_app):
+    """Room.is_available_for_dates probes bookings through an index."""
+    room = make_room()
+    today = date.today()
+    query = room.bookings.filter(
+        Booking.status.in_(Booking.ACTIVE_STATUSES),
+        Booking.check_in_date < today + timedelta(days=3),
+        Booking.check_out_date > today
+    )
+    _assert_indexed(query, 'bookings')
+
+
+def test_active_bookings_check_uses_index(db_app):
+    """Room.has_active_bookings probes bookings through an index."""
+    room = make_room()
+    query = room.bookings.filter(Booking.status.in_(Booking.ACTIVE_STATUSES))
+    _assert_indexed(query, 'bookings')
+
+
+def test_availability_search_uses_index(db_app):
+    """The anti-join in Room.search_available probes bookings by index."""
+    today = date.today()
+    query = Room.search_available(today, today + timedelta(days=2))
+    _assert_indexed(query, 'bookings')
+
+
+def test_user_booking_history_uses_index(db_app):
+    """A user's bookings, newest first, come from an index."""
+    user = make_user()
+    query = user.bookings.order_by(Booking.created_at.desc())
+    _assert_indexed(query, 'bookings')
+
+
+def test_room_reviews_use_index(db_app):
+    """Room.update_rating loads reviews through an index."""
+    room = make_room()
+    _assert_indexed(room.reviews, 'reviews')
+
+
+def test_keyset_page_seeks_on_sort_index(db_app):
+    """Later /rooms pages seek into the sort index instead of scanning."""
+    query = Room.query.filter(db.tuple_(Room.price_per_night, Room.id) > (150.0, 10))
+    query = query.order_by(Room.price_per_night, Room.id).limit(13)
+    _assert_indexed(query, 'rooms')
+
+
+def test_pending_expiry_scan_uses_index(db_app):
+    """The expiry sweep reads the oldest pending bookings from the partial index."""
+    query = (
+        db.select(Booking.id)
+        .where(Booking.status == 'pending', Booking.created_at < datetime.utcnow())
+        .order_by(Booking.created_at, Booking.id)
+        .limit(500)
+    )
+    plan = _query_plan(query)
+    assert any('ix_bookings_pending_created' in line for line in plan), plan
+    assert not any('TEMP B-TREE' in line for line in plan), plan
+
+
+def test_login_lookup_uses_single_index(db_app):
+    """find_by_login is one indexed equality probe for usernames and emails."""
+    username_query = db.select(User).where(db.func.lower(User.username) == 'alice')
+    plan = _query_plan(username_query)
+    assert any('ix_users_username_lower' in line for line in plan), plan
+
+    email_query = db.select(User).where(User.email == 'alice@example.com')
+    _assert_indexed(email_query, 'users')
+    assert not any('MULTI-INDEX OR' in line for line in _query_plan(email_query))
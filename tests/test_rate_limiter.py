@@ -0,0 +1,81 @@
+from sqlalchemy import event
+from app.extensions import db
+from app.services.rate_limiter import RateLimiter, MemoryBackend, SharedBackend, init_rate_limiter
+from tests.factories import make_user
+from tests.redis_stub import RedisStub
+
+RULES = {'login': {'ip': (3, 60), 'account': (2, 60)}}
+
+
+def _limiter(backend):
+    return RateLimiter(backend, RULES)
+
+
+def test_memory_backend_limits_per_key():
+    limiter = _limiter(MemoryBackend())
+    assert limiter.hit('login', {'ip': '1.1.1.1'}, now=0) is None
+    assert limiter.hit('login', {'ip': '1.1.1.1'}, now=1) is None
+    assert limiter.hit('login', {'ip': '1.1.1.1'}, now=2) is None
+    assert limiter.hit('login', {'ip': '1.1.1.1'}, now=3) == 57
+    assert limiter.hit('login', {'ip': '2.2.2.2'}, now=3) is None
+
+
+def test_sliding_window_carries_previous_window():
+    limiter = _limiter(MemoryBackend())
+    for second in range(3):
+        limiter.hit('login', {'ip': 'a'}, now=50 + second)
+    # 30s into the next window half of the previous 3 hits still count
+    assert limiter.hit('login', {'ip': 'a'}, now=90) is None
+    assert limiter.hit('login', {'ip': 'a'}, now=91) == 29
+    # Two windows later everything has expired
+    assert limiter.hit('login', {'ip': 'a'}, now=200) is None
+
+
+def test_account_limit_applies_across_ips():
+    limiter = _limiter(MemoryBackend())
+    assert limiter.hit('login', {'ip': 'a', 'account': 'alice'}, now=0) is None
+    assert limiter.hit('login', {'ip': 'b', 'account': 'alice'}, now=0) is None
+    assert limiter.hit('login', {'ip': 'c', 'account': 'alice'}, now=0) is not None
+
+
+def test_shared_backend_is_shared_between_limiters():
+    store = RedisStub()
+    first, second = _limiter(SharedBackend(store)), _limiter(SharedBackend(store))
+    assert first.hit('login', {'account': 'bob'}) is None
+    assert second.hit('login', {'account': 'bob'}) is None
+    assert first.hit('login', {'account': 'bob'}) is not None
+    assert store.round_trips == 3
+
+
+def test_login_rejected_before_any_query(db_app, db_client):
+    db_app.config['RATE_LIMIT_ENABLED'] = True
+    db_app.config['RATE_LIMITS'] = {'login': {'ip': (100, 60), 'account': (2, 60)}}
+    init_rate_limiter(db_app, client=RedisStub())
+    make_user('erin', email='erin@example.com')
+
+    form = {'email': 'erin', 'password': 'wrong'}
+    assert db_client.post('/auth/login', data=form).status_code == 200
+    assert db_client.post('/auth/login', data=form).status_code == 200
+
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(db.engine, 'before_cursor_execute', listener)
+    try:
+        response = db_client.post('/auth/login', data={'email': 'ERIN', 'password': 'Password1!'})
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', listener)
+
+    assert response.status_code == 429
+    assert int(response.headers['Retry-After']) > 0
+    assert statements == []
+
+
+def test_otp_endpoints_return_json_429(db_app, db_client):
+    db_app.config['RATE_LIMIT_ENABLED'] = True
+    db_app.config['RATE_LIMITS'] = {'otp_send': {'ip': (1, 60)}}
+    init_rate_limiter(db_app)
+
+    db_client.post('/auth/forgot-password', data={'email': 'nobody@example.com'})
+    response = db_client.post('/auth/forgot-password', data={'email': 'nobody@example.com'})
+    assert response.status_code == 429
+    assert response.get_json()['success'] is False
@@ -0,0 +1,74 @@
+from app.extensions import db
+from app.models.room import Room
+from app.models.review import Review
+from tests.factories import make_user, make_room
+
+
+def _review(user, room, rating):
+    review = Review(user_id=user.id, room_id=room.id, rating=rating)
+    db.session.add(review)
+    db.session.commit()
+    return review
+
+
+def test_aggregate_tracks_insert_edit_and_delete(db_app):
+    """Review changes are applied to the room aggregate without reloading reviews."""
+    user = make_user()
+    room = make_room()
+    other = make_room('Other')
+
+    first = _review(user, room, 5)
+    second = _review(user, room, 2)
+    assert (room.rating_sum, room.rating_count, room.rating) == (7, 2, 3.5)
+    assert room.get_rating_histogram() == {1: 0, 2: 1, 3: 0, 4: 0, 5: 1}
+
+    second.rating = 4
+    db.session.commit()
+    assert (room.rating_sum, room.rating) == (9, 4.5)
+    assert room.get_rating_histogram()[2] == 0 and room.get_rating_histogram()[4] == 1
+
+    first.room_id = other.id
+    db.session.commit()
+    assert (room.rating_count, room.rating) == (1, 4.0)
+    assert (other.rating_count, other.rating) == (1, 5.0)
+
+    db.session.delete(second)
+    db.session.commit()
+    assert (room.rating_sum, room.rating_count, room.rating) == (0, 0, 0.0)
+    assert Room.find_rating_mismatches() == []
+
+
+def test_checker_and_backfill_repair_drift(db_app):
+    """The consistency checker finds drift and the backfill repairs it."""
+    user = make_user()
+    room = make_room()
+    _review(user, room, 3)
+    _review(user, room, 4)
+
+    db.session.execute(db.update(Room).values(rating_sum=0, rating_count=0, rating_3=0, rating=0.0))
+    db.session.commit()
+
+    mismatches = Room.find_rating_mismatches()
+    assert [m['room_id'] for m in mismatches] == [room.id]
+    assert mismatches[0]['actual']['rating_sum'] == 7
+
+    result = db_app.test_cli_runner().invoke(args=['ratings', 'backfill', '--batch-size', '1'])
+    assert result.exit_code == 0
+    db.session.expire_all()
+    assert (room.rating_sum, room.rating_count, room.rating) == (7, 2, 3.5)
+    assert db_app.test_cli_runner().invoke(args=['ratings', 'check']).exit_code == 0
+
+
+def test_checker_reports_drift_in_the_average(db_app):
+    """Listings sort on `rating`, so a wrong average is drift even when the counters agree."""
+    user = make_user()
+    room = make_room()
+    _review(user, room, 3)
+    _review(user, room, 4)
+    assert Room.find_rating_mismatches() == []
+
+    db.session.execute(db.update(Room).values(rating=5.0))
+    db.session.commit()
+    mismatches = Room.find_rating_mismatches()
+    assert [m['room_id'] for m in mismatches] == [room.id]
+    assert (mismatches[0]['stored']['rating'], mismatches[0]['actual']['rating']) == (5.0, 3.5)
@@ -0,0 +1,67 @@
+from datetime import date, timedelta
+import pytest
+from app.extensions import db
+from app.models.room_search import search_rooms
+from tests.factories import make_user, make_room, make_booking
+
+
+def test_search_ranks_name_matches_first(db_app):
+    """Name hits outrank description hits; non-matching rooms are excluded."""
+    make_room('Garden Room', description='Quiet room near the ocean terrace')
+    make_room('Ocean Suite', description='Corner suite with balcony')
+    make_room('City Room', description='Downtown views')
+
+    names = [room.name for room, score in search_rooms('ocean')]
+    assert names == ['Ocean Suite', 'Garden Room']
+
+
+def test_index_follows_updates_and_amenities(db_app):
+    """Edits and amenity changes are reindexed incrementally."""
+    room = make_room('Plain Room', description='Nothing special')
+    assert search_rooms('jacuzzi').all() == []
+
+    room.set_amenities_list(['Jacuzzi'])
+    db.session.commit()
+    assert [r.name for r, _ in search_rooms('jacuzzi')] == ['Plain Room']
+
+    room.name = 'Renamed Room'
+    room.description = 'Sea breeze'
+    db.session.commit()
+    assert [r.name for r, _ in search_rooms('breeze')] == ['Renamed Room']
+    assert search_rooms('special').all() == []
+
+
+def test_search_combines_with_availability(db_client):
+    """Text search runs inside the date-availability filter."""
+    user = make_user()
+    booked = make_room('Ocean Deluxe')
+    make_room('Ocean Standard')
+    make_booking(user, booked, start_in_days=1, nights=3)
+
+    check_in = date.today() + timedelta(days=2)
+    response = db_client.get('/api/rooms/search', query_string={
+        'q': 'ocean', 'check_in': check_in.isoformat(),
+        'check_out': (check_in + timedelta(days=1)).isoformat()
+    })
+    assert response.status_code == 200
+    assert [room['name'] for room in response.get_json()['rooms']] == ['Ocean Standard']
+    assert db_client.get('/api/rooms/search').status_code == 400
+
+
+def test_autogenerate_leaves_search_index_alone(db_app):
+    """The FTS objects exist only as DDL; migrations must not propose dropping them."""
+    from alembic.autogenerate import compare_metadata
+    from alembic.migration import MigrationContext
+    from app.models.room_search import is_search_index_object
+
+    def include_object(object, name, type_, reflected, compare_to):
+        return not (reflected and compare_to is None and is_search_index_object(name, type_))
+
+    context = MigrationContext.configure(db.session.connection(), opts={'include_object': include_object})
+    assert [diff for diff in compare_metadata(context, db.metadata) if diff[0] == 'remove_table'] == []
+
+
+def test_unsupported_dialect_is_an_error(db_app, monkeypatch):
+    monkeypatch.setattr(db.engine.dialect, 'name', 'mysql')
+    with pytest.raises(NotImplementedError):
+        search_rooms('ocean')
@@ -0,0 +1,163 @@
+from datetime import date, timedelta
+from app.models.room import Room
+from tests.factories import make_user, make_room, make_booking
+
+
+def _stay(start_in_days, nights):
+    check_in = date.today() + timedelta(days=start_in_days)
+    return check_in, check_in + timedelta(days=nights)
+
+
+def test_search_available_excludes_overlapping_bookings(db_app):
+    """Rooms with an active overlapping booking are filtered out."""
+    user = make_user()
+    free = make_room('Free')
+    taken = make_room('Taken')
+    cancelled = make_room('Cancelled')
+    make_booking(user, taken, start_in_days=2, nights=3)
+    make_booking(user, cancelled, start_in_days=2, nights=3, status='cancelled')
+
+    check_in, check_out = _stay(3, 2)
+    names = {room.name for room in Room.search_available(check_in, check_out)}
+
+    assert names == {'Free', 'Cancelled'}
+    # Agrees with the per-room check
+    assert all(room.is_available_for_dates(check_in, check_out)
+               for room in Room.search_available(check_in, check_out))
+    assert not taken.is_available_for_dates(check_in, check_out)
+    assert free.is_available_for_dates(check_in, check_out)
+
+
+def test_search_available_applies_filters(db_app):
+    """Guest count, room type and price bounds narrow the result."""
+    make_room('Small', 'Standard', price=80, max_guests=2)
+    make_room('Family', 'Family', price=250, max_guests=5)
+    make_room('Suite', 'Premium', price=400, max_guests=4)
+    make_room('Closed', 'Family', price=200, max_guests=6, status='maintenance')
+
+    check_in, check_out = _stay(1, 1)
+    rooms = Room.search_available(check_in, check_out, guests=4,
+                                  room_type=['Family', 'Premium'], max_price=300).all()
+
+    assert [room.name for room in rooms] == ['Family']
+
+
+def test_available_api_returns_free_rooms(db_client):
+    """JSON availability endpoint validates dates and lists free rooms."""
+    make_room('Only')
+    check_in, check_out = _stay(1, 2)
+
+    response = db_client.get('/api/rooms/available', query_string={
+        'check_in': check_in.isoformat(), 'check_out': check_out.isoformat()
+    })
+    assert response.status_code == 200
+    assert [room['name'] for room in response.get_json()['rooms']] == ['Only']
+
+    response = db_client.get('/api/rooms/available', query_string={
+        'check_in': check_out.isoformat(), 'check_out': check_in.isoformat()
+    })
+    assert response.status_code == 400
+
+
+def test_keyset_pages_cover_every_room_once(db_app):
+    """Walking the cursor visits each room exactly once in sort order."""
+    for i in range(7):
+        make_room(f'Room {i}', price=100 + (i % 3) * 50)
+
+    seen, after = [], None
+    while True:
+        rooms, after = Room.keyset_page(Room.query, sort='price-high', after=after, per_page=3)
+        seen.extend(rooms)
+        if after is None:
+            break
+
+    assert len(seen) == 7 and len({room.id for room in seen}) == 7
+    keys = [(room.price_per_night, room.id) for room in seen]
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_rooms_api_paginates_with_cursor(db_client):
+    """JSON listing returns a cursor that continues where the page ended."""
+    for i in range(5):
+        make_room(f'Room {i}', room_type='Deluxe', price=100 + i)
+    make_room('Other', room_type='Standard', price=50)
+
+    first = db_client.get('/api/rooms?room_type=Deluxe&sort=price-low&per_page=3').get_json()
+    assert [room['price_per_night'] for room in first['rooms']] == [100, 101, 102]
+
+    second = db_client.get(f"/api/rooms?room_type=Deluxe&sort=price-low&per_page=3&after={first['next_cursor']}").get_json()
+    assert [room['price_per_night'] for room in second['rooms']] == [103, 104]
+    assert second['next_cursor'] is None
+
+
+def test_rooms_page_lists_database_rooms(db_client):
+    """/rooms renders rooms from the database."""
+    make_room('Harbour View Suite')
+    response = db_client.get('/rooms')
+    assert response.status_code == 200
+    assert b'Harbour View Suite' in response.data
+
+
+def test_amenities_round_trip_through_catalog(db_app):
+    """Amenity lists are stored as catalog bits and read back by name."""
+    from app.extensions import db
+    room = make_room('Loft')
+    room.set_amenities_list(['WiFi', ' AC', 'TV'])
+    db.session.commit()
+
+    assert room.amenity_mask == 0b111
+    assert room.get_amenities_list() == ['WiFi', 'AC', 'TV']
+
+    other = make_room('Cabin')
+    other.set_amenities_list(['tv', 'Pool'])  # 'tv' reuses the existing entry
+    db.session.commit()
+    assert other.get_amenities_list() == ['TV', 'Pool']
+
+
+def test_amenity_filter_requires_every_amenity(db_app):
+    """Filtering by amenities keeps rooms that have all of them."""
+    from app.extensions import db
+    for name, amenities in [('Both', ['WiFi', 'AC']), ('WiFi only', ['WiFi']),
+                            ('All', ['AC', 'WiFi', 'TV']), ('None', [])]:
+        make_room(name).set_amenities_list(amenities)
+    db.session.commit()
+
+    rooms = Room.filter_by_amenities(Room.query, ['wifi', 'AC']).order_by(Room.id).all()
+    assert [room.name for room in rooms] == ['Both', 'All']
+    assert Room.filter_by_amenities(Room.query, ['Sauna']).all() == []
+
+
+def test_amenity_filter_sees_masks_written_elsewhere(db_app):
+    """A new amenity combination saved outside this process matches immediately."""
+    from app.extensions import db
+    make_room('Both').set_amenities_list(['WiFi', 'AC', 'TV'])
+    trio = make_room('Trio')
+    db.session.commit()
+    assert [r.name for r in Room.filter_by_amenities(Room.query, ['WiFi'])] == ['Both']
+
+    # e.g. another worker or a migration: a plain UPDATE, no model code involved
+    db.session.execute(db.update(Room).where(Room.id == trio.id).values(amenity_mask=0b101))
+    db.session.commit()
+    rooms = Room.filter_by_amenities(Room.query, ['WiFi', 'TV']).order_by(Room.id)
+    assert [r.name for r in rooms] == ['Both', 'Trio']
+
+
+def test_amenity_created_concurrently_is_reused(db_app, monkeypatch):
+    """Losing the insert race to another admin re-reads the catalog instead of failing."""
+    from app.extensions import db
+    from app.models.amenity import Amenity
+    make_room('Loft').set_amenities_list(['WiFi'])
+    db.session.commit()
+
+    lookup = Amenity.lookup.__func__
+    calls = []
+
+    def stale_lookup(cls, name):
+        calls.append(name)
+        return None if len(calls) == 1 else lookup(cls, name)
+
+    monkeypatch.setattr(Amenity, 'lookup', classmethod(stale_lookup))
+    assert Amenity.get_or_create('WiFi') == 0
+    assert len(calls) == 2  # the clashing insert was rolled back and retried
+    db.session.commit()
+    assert Amenity.query.count() == 1
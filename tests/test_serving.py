@@ -0,0 +1,61 @@
+import os
+import runpy
+from types import SimpleNamespace
+from app.config import Config
+from app.services.scheduler import PeriodicTask
+
+CONF = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'gunicorn.conf.py')
+
+
+def _load_conf(monkeypatch):
+    monkeypatch.setenv('PASSWORD_HASH_WORKERS', '1')  # restored after the test
+    return runpy.run_path(CONF)
+
+
+class _Log:
+    def __init__(self):
+        self.warnings = []
+
+    def warning(self, message, *args):
+        self.warnings.append(message % args)
+
+
+def _server(app, workers):
+    return SimpleNamespace(app=SimpleNamespace(wsgi=lambda: app),
+                           cfg=SimpleNamespace(workers=workers), log=_Log())
+
+
+def test_gunicorn_conf_uses_config_sizes(monkeypatch):
+    conf = _load_conf(monkeypatch)
+    assert conf['preload_app'] is True
+    assert conf['workers'] == Config.WEB_WORKERS >= 1
+    assert conf['threads'] == Config.WEB_THREADS
+    assert conf['max_requests'] == Config.WEB_MAX_REQUESTS
+    assert conf['worker_class'] == ('gthread' if Config.WEB_THREADS > 1 else 'sync')
+
+
+def test_fork_hooks_move_background_tasks_into_workers(db_app, monkeypatch):
+    conf = _load_conf(monkeypatch)
+    task = PeriodicTask(db_app, 'noop', lambda: None, interval=3600).start()
+    db_app.extensions['periodic_tasks'] = {'noop': task}
+    server = _server(db_app, workers=1)
+
+    conf['when_ready'](server)
+    assert not task._thread.is_alive()
+
+    conf['post_fork'](server, worker=None)
+    assert task._thread.is_alive()
+    task.stop(5)
+
+
+def test_warns_about_per_process_rate_limits(db_app, monkeypatch):
+    conf = _load_conf(monkeypatch)
+    db_app.config.update(RATE_LIMIT_ENABLED=True, RATE_LIMIT_BACKEND='memory')
+    server = _server(db_app, workers=4)
+    conf['when_ready'](server)
+    assert 'RATE_LIMIT_BACKEND=redis' in server.log.warnings[0]
+
+    db_app.config['RATE_LIMIT_BACKEND'] = 'redis'
+    server = _server(db_app, workers=4)
+    conf['when_ready'](server)
+    assert server.log.warnings == []
@@ -0,0 +1,62 @@
+import os
+from unittest.mock import patch
+from app import create_app
+from app.services.template_cache import init_template_cache, warm_templates
+
+
+def _app(cache_dir):
+    app = create_app('testing')
+    app.config['JINJA_BYTECODE_CACHE_DIR'] = str(cache_dir)
+    init_template_cache(app)
+    return app
+
+
+def test_warm_up_compiles_every_template(tmp_path):
+    app = _app(tmp_path)
+    stats = warm_templates(app)
+
+    assert stats['failed'] == 0
+    assert stats['templates'] == len(app.jinja_env.list_templates())
+    # Email templates are compiled from strings, so only page templates hit the disk cache
+    assert len(list(tmp_path.glob('quickstay-*.cache'))) > 0
+
+
+def test_new_worker_loads_bytecode_instead_of_compiling(tmp_path):
+    warm_templates(_app(tmp_path))
+
+    fresh = _app(tmp_path)
+    with patch.object(fresh.jinja_env, 'compile', wraps=fresh.jinja_env.compile) as compile:
+        fresh.jinja_env.get_template('main/home.html')
+    assert compile.call_count == 0
+
+
+def test_template_edits_invalidate_cached_bytecode(tmp_path):
+    app = _app(tmp_path)
+    with patch.object(app.jinja_env.loader, 'get_source', return_value=('{{ 1 }}', None, lambda: True)):
+        assert app.jinja_env.get_template('main/home.html').render() == '1'
+    fresh = _app(tmp_path)
+    with patch.object(fresh.jinja_env.loader, 'get_source', return_value=('{{ 2 }}', None, lambda: True)):
+        assert fresh.jinja_env.get_template('main/home.html').render() == '2'
+
+
+def test_cache_directory_is_private(tmp_path):
+    cache_dir = tmp_path / 'jinja'
+    app = _app(cache_dir)
+    assert app.jinja_env.bytecode_cache is not None
+    assert os.stat(cache_dir).st_mode & 0o777 == 0o700
+
+
+def test_shared_cache_directory_is_refused(tmp_path):
+    """Another user could plant compiled code in a directory they can write to."""
+    cache_dir = tmp_path / 'shared'
+    cache_dir.mkdir()
+    cache_dir.chmod(0o777)
+    assert _app(cache_dir).jinja_env.bytecode_cache is None
+
+
+def test_default_directory_is_under_the_instance_folder(tmp_path):
+    app = create_app('testing')
+    app.instance_path = str(tmp_path)
+    app.config['JINJA_BYTECODE_CACHE_DIR'] = 'jinja-cache'
+    init_template_cache(app)
+    assert app.jinja_env.bytecode_cache.directory == str(tmp_path / 'jinja-cache')